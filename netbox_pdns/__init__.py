@@ -1,36 +1,55 @@
+import asyncio
 import hashlib
 import hmac
-import json
 import secrets
 import threading
 import time
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Callable
 from contextlib import asynccontextmanager
 from typing import Any
 
-import dns.name
-from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from fastapi import Depends, FastAPI, HTTPException, Request, Security
+from fastapi.responses import ORJSONResponse
 from fastapi.security import APIKeyHeader
 from pydantic import ValidationError
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from slowapi.middleware import SlowAPIMiddleware
 from slowapi.util import get_remote_address
-from starlette.status import HTTP_401_UNAUTHORIZED
-
-from .api import NetboxPDNS
-from .models import NetboxWebhook
+from starlette.concurrency import run_in_threadpool
+from starlette.status import (
+    HTTP_202_ACCEPTED,
+    HTTP_401_UNAUTHORIZED,
+    HTTP_503_SERVICE_UNAVAILABLE,
+)
+
+from .api import NetboxPDNS, name_from_text
+from .models import NetboxWebhook, Settings
 from .mqtt_service import MQTTService, MQTTZoneUpdate
 
+# A queued webhook operation and the webhook payload it is run with
+WebhookOperation = tuple[Callable[[NetboxWebhook], None], NetboxWebhook]
+
+# Header carrying the API key for /sync and the webhook endpoints
+API_KEY_HEADER = "x-netbox-pdns-api-key"
+
+# Largest webhook body accepted; Netbox zone webhooks are a few KiB
+MAX_WEBHOOK_BODY_SIZE = 1024 * 1024
+
+
+def create_app(settings: Settings | None = None) -> FastAPI:
+    api = NetboxPDNS(settings)
+
+    async def run_scheduled_sync() -> None:
+        """Run the blocking full sync off the event loop"""
+        await asyncio.to_thread(api.full_sync)
 
-def create_app() -> FastAPI:
-    api = NetboxPDNS()
-    scheduler = BackgroundScheduler()
+    # The scheduler runs on the app's event loop, so it is started in lifespan
+    scheduler = AsyncIOScheduler()
     trigger = CronTrigger.from_crontab(api.config.sync_crontab)
-    scheduler.add_job(api.full_sync, trigger)
-    scheduler.start()
+    scheduler.add_job(run_scheduled_sync, trigger)
 
     # Application state tracking
     app_state: dict[str, Any] = {
@@ -43,7 +62,7 @@ def create_app() -> FastAPI:
     # Shared zone operation handlers (used by both MQTT and webhooks)
     def handle_zone_create(zone_name: str, source: str = "MQTT") -> None:
         """Handle zone creation"""
-        with api._operation_lock_with_logging(f"{source.lower()}_zone_create"):
+        with api._operation_lock_with_logging(f"{source.lower()}_zone_create", zone_name):
             nb_zone = api.get_nb_zone_by_name(zone_name)
             if nb_zone:
                 api.create_zone(nb_zone)
@@ -53,7 +72,7 @@ def create_app() -> FastAPI:
 
     def handle_zone_update(zone_name: str, source: str = "MQTT") -> None:
         """Handle zone update/sync"""
-        with api._operation_lock_with_logging(f"{source.lower()}_zone_update"):
+        with api._operation_lock_with_logging(f"{source.lower()}_zone_update", zone_name):
             nb_zone = api.get_nb_zone_by_name(zone_name)
             pdns_zone = api.get_pdns_zone(zone_name)
             if nb_zone and pdns_zone:
@@ -68,11 +87,41 @@ def create_app() -> FastAPI:
 
     def handle_zone_delete(zone_name: str, source: str = "MQTT") -> None:
         """Handle zone deletion"""
-        with api._operation_lock_with_logging(f"{source.lower()}_zone_delete"):
-            zone_dns_name = dns.name.from_text(zone_name)
+        with api._operation_lock_with_logging(f"{source.lower()}_zone_delete", zone_name):
+            zone_dns_name = name_from_text(zone_name)
             api.delete_zone(zone_dns_name)
             api.logger.info(f"{source}: Deleted zone {zone_name}")
 
+    # Webhook zone operations, run by the background webhook workers
+    def process_webhook_create(data: NetboxWebhook) -> None:
+        """Create a zone announced by a Netbox webhook"""
+        with api._operation_lock_with_logging("webhook_zone_create", data.name):
+            api.create_zone(api.get_nb_zone(data.id))
+
+    def process_webhook_update(data: NetboxWebhook) -> None:
+        """Synchronize a zone announced by a Netbox webhook"""
+        with api._operation_lock_with_logging("webhook_zone_update", data.name):
+            api.sync_zone(api.get_nb_zone(data.id), api.get_pdns_zone(data.name))
+
+    def process_webhook_delete(data: NetboxWebhook) -> None:
+        """Delete a zone announced by a Netbox webhook"""
+        with api._operation_lock_with_logging("webhook_zone_delete", data.name):
+            api.delete_zone(name_from_text(data.name))
+
+    async def run_webhook_worker(queue: asyncio.Queue[WebhookOperation]) -> None:
+        """Drain queued webhook operations, running the blocking API calls in a thread"""
+        while True:
+            operation, data = await queue.get()
+            try:
+                await run_in_threadpool(operation, data)
+            except Exception as e:
+                api.logger.error(
+                    f"Webhook: Error in {operation.__name__} for zone {data.name}: {e}",
+                    exc_info=True,
+                )
+            finally:
+                queue.task_done()
+
     def run_initial_sync_background() -> None:
         """Run initial sync in background thread"""
         try:
@@ -114,6 +163,8 @@ def create_app() -> FastAPI:
 
     @asynccontextmanager
     async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+        scheduler.start()
+
         # Start MQTT service
         if api.config.mqtt_enabled:
             api.logger.info("Starting MQTT service")
@@ -125,6 +176,17 @@ def create_app() -> FastAPI:
             else:
                 api.logger.warning("MQTT service failed to connect within timeout")
 
+        # Start webhook workers, each with its own queue; the webhook endpoints only enqueue
+        # operations for them. The configured queue size is split across the workers.
+        queue_size = max(1, api.config.webhook_queue_size // api.config.webhook_workers)
+        webhook_queues: list[asyncio.Queue[WebhookOperation]] = [
+            asyncio.Queue(maxsize=queue_size) for _ in range(api.config.webhook_workers)
+        ]
+        webhook_workers = [
+            asyncio.create_task(run_webhook_worker(queue)) for queue in webhook_queues
+        ]
+        app.state.webhook_queues = webhook_queues
+
         # Start initial sync in background thread (non-blocking)
         sync_thread = threading.Thread(target=run_initial_sync_background, daemon=True)
         sync_thread.start()
@@ -132,46 +194,82 @@ def create_app() -> FastAPI:
 
         yield
 
-        # Shutdown services
+        # Shutdown services, giving queued webhook operations a chance to finish
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(queue.join() for queue in webhook_queues)), timeout=30.0
+            )
+        except TimeoutError:
+            queued = sum(queue.qsize() for queue in webhook_queues)
+            api.logger.warning(f"Shutting down with {queued} webhook operations still queued")
+        app.state.webhook_queues = None
+        for worker in webhook_workers:
+            worker.cancel()
+        await asyncio.gather(*webhook_workers, return_exceptions=True)
         scheduler.shutdown()
         if api.config.mqtt_enabled:
             api.logger.info("Stopping MQTT service")
-            mqtt_service.stop()
+            await mqtt_service.shutdown()
 
-    def verify_webhook_signature(payload: bytes, signature: str, secret: str) -> bool:
+    # Key the HMAC once at startup; each request only copies the pre-keyed state
+    webhook_hmac = (
+        hmac.new(api.config.webhook_secret.encode(), digestmod=hashlib.sha256)
+        if api.config.webhook_secret
+        else None
+    )
+
+    def verify_webhook_signature(payload: bytes, signature: str) -> bool:
         """Verify HMAC webhook signature"""
-        if not signature or not secret:
+        if not signature or webhook_hmac is None:
             return False
         try:
+            mac = webhook_hmac.copy()
+            mac.update(payload)
             # Remove 'sha256=' prefix if present
-            if signature.startswith("sha256="):
-                signature = signature[7:]
-            expected_signature = hmac.new(secret.encode(), payload, hashlib.sha256).hexdigest()
-            return secrets.compare_digest(expected_signature, signature)
+            return secrets.compare_digest(mac.hexdigest(), signature.removeprefix("sha256="))
         except Exception:
             return False
 
-    api_key_header = APIKeyHeader(name="x-netbox-pdns-api-key", auto_error=False)
+    api_key_header = APIKeyHeader(name=API_KEY_HEADER, auto_error=False)
+    # Encode the API key once; comparing bytes also handles non-ASCII header values
+    api_key_bytes = api.config.api_key.encode()
 
-    async def get_api_key(api_key_header: str = Security(api_key_header)) -> str:
-        if api_key_header and secrets.compare_digest(api_key_header, api.config.api_key):
-            return api_key_header
+    def check_api_key(api_key_value: str | None) -> str:
+        """Return the API key if it matches the configured one, else raise a 401"""
+        if api_key_value and secrets.compare_digest(api_key_value.encode(), api_key_bytes):
+            return api_key_value
         else:
             raise HTTPException(
                 status_code=HTTP_401_UNAUTHORIZED, detail="Could not validate API key"
             )
 
+    async def get_api_key(api_key_header: str = Security(api_key_header)) -> str:
+        return check_api_key(api_key_header)
+
+    async def read_webhook_body(request: Request) -> bytes:
+        """Read the request body, rejecting it once it exceeds MAX_WEBHOOK_BODY_SIZE"""
+        content_length = request.headers.get("content-length")
+        if content_length and content_length.isdigit():
+            if int(content_length) > MAX_WEBHOOK_BODY_SIZE:
+                raise HTTPException(status_code=413, detail="Request body too large")
+
+        # Content-Length may be absent (chunked) or wrong, so enforce the limit while reading
+        body = bytearray()
+        async for chunk in request.stream():
+            body += chunk
+            if len(body) > MAX_WEBHOOK_BODY_SIZE:
+                raise HTTPException(status_code=413, detail="Request body too large")
+        return bytes(body)
+
     async def verify_webhook_and_parse(request: Request) -> tuple[NetboxWebhook, str]:
         """Verify webhook authentication and parse data in one step"""
-        # First verify API key
-        api_key_value = request.headers.get("x-netbox-pdns-api-key")
-        if not api_key_value or not secrets.compare_digest(api_key_value, api.config.api_key):
-            raise HTTPException(
-                status_code=HTTP_401_UNAUTHORIZED, detail="Could not validate API key"
-            )
+        # Called inside the rate-limited endpoints, not as a dependency: FastAPI resolves
+        # dependencies before the limiter runs, so rejected keys would never be counted.
+        # The API key is checked before any of the body is read.
+        api_key = check_api_key(request.headers.get(API_KEY_HEADER))
 
         # Get raw body for both signature verification and parsing
-        body = await request.body()
+        body = await read_webhook_body(request)
 
         # If webhook secret is configured, verify HMAC signature
         if api.config.webhook_secret:
@@ -184,34 +282,53 @@ def create_app() -> FastAPI:
                     detail="HMAC signature required when webhook secret is configured",
                 )
 
-            if not verify_webhook_signature(body, signature, api.config.webhook_secret):
+            if not verify_webhook_signature(body, signature):
                 raise HTTPException(
                     status_code=HTTP_401_UNAUTHORIZED, detail="Invalid webhook signature"
                 )
 
-        # Parse JSON body into NetboxWebhook model
+        # Parse JSON body straight into the NetboxWebhook model (no intermediate dict)
         try:
-            data_dict = json.loads(body.decode("utf-8"))
-            webhook_data = NetboxWebhook(**data_dict)
-            return webhook_data, api_key_value
-        except json.JSONDecodeError as e:
-            raise HTTPException(status_code=400, detail="Invalid JSON in request body") from e
+            webhook_data = NetboxWebhook.model_validate_json(body)
+            return webhook_data, api_key
         except ValidationError as e:
+            if any(error["type"] == "json_invalid" for error in e.errors()):
+                raise HTTPException(status_code=400, detail="Invalid JSON in request body") from e
             raise HTTPException(status_code=400, detail=f"Invalid webhook data: {e}") from e
         except Exception as e:
             raise HTTPException(status_code=400, detail=f"Error parsing webhook data: {e}") from e
 
+    def enqueue_webhook(
+        request: Request, operation: Callable[[NetboxWebhook], None], data: NetboxWebhook
+    ) -> None:
+        """Queue a webhook operation for the background workers"""
+        queues: list[asyncio.Queue[WebhookOperation]] | None = getattr(
+            request.app.state, "webhook_queues", None
+        )
+        if not queues:
+            raise HTTPException(
+                status_code=HTTP_503_SERVICE_UNAVAILABLE, detail="Webhook workers are not running"
+            )
+        # Every operation for a zone goes to the same worker, so they run in arrival order
+        queue = queues[hash(data.name.rstrip(".").lower()) % len(queues)]
+        try:
+            queue.put_nowait((operation, data))
+        except asyncio.QueueFull as e:
+            raise HTTPException(
+                status_code=HTTP_503_SERVICE_UNAVAILABLE, detail="Webhook queue is full"
+            ) from e
+
     # Initialize rate limiter
     limiter = Limiter(key_func=get_remote_address)
 
-    app = FastAPI(lifespan=lifespan)
+    app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
     app.state.limiter = limiter
     app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)  # type: ignore[arg-type]
     app.add_middleware(SlowAPIMiddleware)
 
     @app.get("/health")
-    @limiter.limit("100/minute")  # Allow generous rate for health checks
-    async def health_check(request: Request) -> dict[str, Any]:
+    @limiter.exempt  # Load balancer probes skip rate limit bookkeeping
+    async def health_check() -> dict[str, Any]:
         """Basic health check endpoint"""
         return {"status": "Healthy"}
 
@@ -252,25 +369,28 @@ def create_app() -> FastAPI:
     def sync(request: Request, api_key: str = Depends(get_api_key)) -> dict[str, str]:
         return api.full_sync()
 
-    @app.post("/zones/create")
+    @app.post("/zones/create", status_code=HTTP_202_ACCEPTED)
     @limiter.limit("20/minute")  # Reasonable rate for webhook operations
-    async def create_zone_webhook(request: Request) -> None:
+    async def create_zone_webhook(request: Request) -> dict[str, str]:
         data, api_key = await verify_webhook_and_parse(request)
-        api.logger.info(f"Received Netbox create webhook {data}")
-        api.create_zone(api.get_nb_zone(data.id))
+        api.logger.info("Received Netbox create webhook %s", data)
+        enqueue_webhook(request, process_webhook_create, data)
+        return {"result": "accepted"}
 
-    @app.delete("/zones/delete")
+    @app.delete("/zones/delete", status_code=HTTP_202_ACCEPTED)
     @limiter.limit("20/minute")  # Reasonable rate for webhook operations
-    async def delete_zone_webhook(request: Request) -> None:
+    async def delete_zone_webhook(request: Request) -> dict[str, str]:
         data, api_key = await verify_webhook_and_parse(request)
-        api.logger.info(f"Received Netbox delete webhook {data}")
-        api.delete_zone(dns.name.from_text(data.name))
+        api.logger.info("Received Netbox delete webhook %s", data)
+        enqueue_webhook(request, process_webhook_delete, data)
+        return {"result": "accepted"}
 
-    @app.post("/zones/update")
+    @app.post("/zones/update", status_code=HTTP_202_ACCEPTED)
     @limiter.limit("20/minute")  # Reasonable rate for webhook operations
-    async def update_zone_webhook(request: Request) -> None:
+    async def update_zone_webhook(request: Request) -> dict[str, str]:
         data, api_key = await verify_webhook_and_parse(request)
-        api.logger.info(f"Received Netbox update webhook {data}")
-        api.sync_zone(api.get_nb_zone(data.id), api.get_pdns_zone(data.name))
+        api.logger.info("Received Netbox update webhook %s", data)
+        enqueue_webhook(request, process_webhook_update, data)
+        return {"result": "accepted"}
 
     return app
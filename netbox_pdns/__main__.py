@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 import argparse
+from collections.abc import Sequence
 
 import uvicorn
 
@@ -7,29 +8,29 @@ from netbox_pdns import create_app
 from netbox_pdns.models import Settings
 
 
-def parse_args() -> argparse.Namespace:
-    """Parse command line arguments."""
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments, defaulting to sys.argv."""
     parser = argparse.ArgumentParser(description="Netbox PowerDNS Connector")
     parser.add_argument(
         "--host", type=str, default="127.0.0.1", help="Host address to bind to (default: 127.0.0.1)"
     )
     parser.add_argument("--port", type=int, default=8000, help="Port to listen on (default: 8000)")
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 
-def main() -> None:
+def main(argv: Sequence[str] | None = None) -> None:
     """
     Main entry point for the netbox-pdns connector.
     Starts the FastAPI application with uvicorn.
     """
     # Parse command line arguments
-    args = parse_args()
+    args = parse_args(argv)
 
     # Load settings
     settings = Settings()
 
-    # Start the FastAPI application
-    app = create_app()
+    # Start the FastAPI application with the settings loaded above
+    app = create_app(settings)
 
     # Configure and run uvicorn server
     uvicorn.run(app, host=args.host, port=args.port, log_level=settings.log_level.lower())
@@ -1,15 +1,19 @@
+import functools
 import logging
 import random
 import sys
 import threading
 import time
+from collections import defaultdict
 from collections.abc import Callable, Generator
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import contextmanager
 from typing import Any, TypeVar
 
 import dns.name
 import pdns_auth_client
 import pynetbox
+from requests.adapters import HTTPAdapter
 
 from .exceptions import (
     NetboxAPIError,
@@ -21,29 +25,66 @@ from .models import Settings
 
 T = TypeVar("T")
 
+# Number of lock stripes zone operations are spread across
+ZONE_LOCK_STRIPES = 64
+
+
+@functools.lru_cache(maxsize=8192)
+def name_from_text(text: str) -> dns.name.Name:
+    """Parse a DNS name, memoized since zone names repeat across syncs and events"""
+    return dns.name.from_text(text)
+
+
+def is_transient_error(exc: Exception) -> bool:
+    """Whether a failed PowerDNS call may succeed on retry; client errors (4xx) would not"""
+    if isinstance(exc, ZoneNotFoundError):
+        return False
+    if isinstance(exc, pdns_auth_client.ApiException) and exc.status is not None:
+        return not 400 <= exc.status < 500 or exc.status == 429
+    return True
+
 
 class NetboxPDNS:
-    def __init__(self) -> None:
-        self.config = Settings()
+    def __init__(self, config: Settings | None = None) -> None:
+        # Callers that already loaded the settings pass them in to skip a second validation
+        self.config = config if config is not None else Settings()
         self.nb = self.setup_netbox()
         self.pdns = self.setup_pdns()
         self.zones_api = pdns_auth_client.ZonesApi(self.pdns)
         self.logger = self.setup_logging()
-        # Thread lock to prevent concurrent operations
-        self._operation_lock = threading.Lock()
+        # Striped locks: operations on the same zone are serialized while different zones
+        # proceed concurrently. Operations without a zone (full_sync) take every stripe.
+        self._zone_locks = [threading.Lock() for _ in range(ZONE_LOCK_STRIPES)]
         self.logger.info(f"Netbox PowerDNS Connector intialized id: {id(self)}")
 
+    def _operation_locks(self, zone_name: str | None) -> list[threading.Lock]:
+        """Return the locks guarding an operation on a zone, or every lock if no zone given"""
+        if zone_name is None:
+            return self._zone_locks
+        stripe = hash(zone_name.rstrip(".").lower()) % len(self._zone_locks)
+        return [self._zone_locks[stripe]]
+
     @contextmanager
-    def _operation_lock_with_logging(self, operation_name: str) -> Generator[None, None, None]:
+    def _operation_lock_with_logging(
+        self, operation_name: str, zone_name: str | None = None
+    ) -> Generator[None, None, None]:
         """Context manager for operation lock with debug logging and timing"""
-        self.logger.debug(f"Attempting to acquire lock for operation: {operation_name}")
+        self.logger.debug("Attempting to acquire lock for operation: %s", operation_name)
         start_time = time.time()
 
-        # Try to acquire lock with timeout to detect contention
-        acquired = self._operation_lock.acquire(timeout=30.0)
-        if not acquired:
-            self.logger.warning(f"Failed to acquire lock for {operation_name} within 30 seconds")
-            raise TimeoutError(f"Lock timeout for operation: {operation_name}")
+        # Try to acquire locks with timeout to detect contention. Locks are always taken in
+        # stripe order, so concurrent operations cannot deadlock each other.
+        acquired: list[threading.Lock] = []
+        for lock in self._operation_locks(zone_name):
+            remaining = 30.0 - (time.time() - start_time)
+            if not lock.acquire(timeout=max(remaining, 0.0)):
+                for held in reversed(acquired):
+                    held.release()
+                self.logger.warning(
+                    f"Failed to acquire lock for {operation_name} within 30 seconds"
+                )
+                raise TimeoutError(f"Lock timeout for operation: {operation_name}")
+            acquired.append(lock)
 
         acquire_time = time.time() - start_time
         if acquire_time > 1.0:  # Log if we waited more than 1 second
@@ -51,15 +92,16 @@ class NetboxPDNS:
                 f"Lock acquired for {operation_name} after {acquire_time:.2f}s wait"
             )
         else:
-            self.logger.debug(f"Lock acquired for {operation_name} (waited {acquire_time:.3f}s)")
+            self.logger.debug("Lock acquired for %s (waited %.3fs)", operation_name, acquire_time)
 
         try:
             yield
         finally:
-            self._operation_lock.release()
+            for lock in reversed(acquired):
+                lock.release()
             total_time = time.time() - start_time
             self.logger.debug(
-                f"Lock released for {operation_name} (total operation time: {total_time:.3f}s)"
+                "Lock released for %s (total operation time: %.3fs)", operation_name, total_time
             )
 
     def retry_with_backoff(
@@ -71,6 +113,7 @@ class NetboxPDNS:
         max_delay: float = 60.0,
         backoff_factor: float = 2.0,
         jitter: bool = True,
+        retry_if: Callable[[Exception], bool] | None = None,
         **kwargs: Any,
     ) -> T:
         """Execute function with exponential backoff retry logic"""
@@ -82,6 +125,13 @@ class NetboxPDNS:
             except Exception as e:
                 last_exception = e
 
+                # Errors that will fail the same way again are raised without retrying
+                if retry_if is not None and not retry_if(e):
+                    self.logger.warning(
+                        f"Function {func.__name__} failed with a non-retryable error: {e}"
+                    )
+                    raise e
+
                 if attempt == max_attempts - 1:  # Last attempt
                     self.logger.error(
                         f"Function {func.__name__} failed after {max_attempts} attempts: {e}"
@@ -125,12 +175,25 @@ class NetboxPDNS:
 
         return logger
 
+    def _http_pool_size(self) -> int:
+        """Connections to keep alive per API, enough for concurrent zone syncs and webhooks"""
+        return max(16, 2 * self.config.sync_parallelism)
+
     def setup_netbox(self) -> pynetbox.api:
-        return pynetbox.api(self.config.nb_url, token=self.config.nb_token)
+        nb = pynetbox.api(self.config.nb_url, token=self.config.nb_token)
+        # Size the keep-alive pool for concurrent requests; retries are left to
+        # retry_with_backoff so failures are not retried twice
+        adapter = HTTPAdapter(
+            pool_connections=16, pool_maxsize=self._http_pool_size(), max_retries=0
+        )
+        nb.http_session.mount("http://", adapter)
+        nb.http_session.mount("https://", adapter)
+        return nb
 
     def setup_pdns(self) -> pdns_auth_client.ApiClient:
         configuration = pdns_auth_client.Configuration(host=self.config.pdns_url)
         configuration.api_key["APIKeyHeader"] = self.config.pdns_token
+        configuration.connection_pool_maxsize = self._http_pool_size()
         return pdns_auth_client.ApiClient(configuration)
 
     def get_nb_zone(self, zone_id: int) -> pynetbox.core.response.Record:
@@ -206,7 +269,7 @@ class NetboxPDNS:
             return zone
 
         try:
-            return self.retry_with_backoff(_get_pdns_zone)
+            return self.retry_with_backoff(_get_pdns_zone, retry_if=is_transient_error)
         except ZoneNotFoundError:
             raise
         except Exception as e:
@@ -228,14 +291,11 @@ class NetboxPDNS:
             raise ValueError("Zone ID must be positive")
 
         try:
-            nb_records = self.nb.plugins.netbox_dns.records.filter(zone_id=zone_id)
-            nb_rrsets: dict = {}
+            nb_records = self.nb.plugins.netbox_dns.records.filter(zone_id=zone_id, limit=0)
+            nb_rrsets: defaultdict[tuple[str, str], list] = defaultdict(list)
             for record in nb_records:
-                key = (record.fqdn, record.type)
-                if key not in nb_rrsets:
-                    nb_rrsets[key] = []
-                nb_rrsets[key].append(record)
-            return nb_rrsets
+                nb_rrsets[(record.fqdn, record.type)].append(record)
+            return dict(nb_rrsets)
         except Exception as e:
             raise NetboxAPIError(f"Failed to fetch records for zone ID {zone_id}: {e}") from e
 
@@ -259,13 +319,14 @@ class NetboxPDNS:
             pdns_rrsets.append(pdns_rrset)
         for nb_rrset in nb_rrsets_replace:
             self.logger.info(f"Replacing RRSet {nb_rrset}")
-            nb_record_ttl = nb_rrsets[nb_rrset][0].ttl
+            nb_records = nb_rrsets[nb_rrset]
+            nb_record_ttl = nb_records[0].ttl
             pdns_rrset = pdns_auth_client.RRSet(
                 changetype="REPLACE",
                 name=nb_rrset[0],
                 type=nb_rrset[1],
                 ttl=nb_record_ttl if nb_record_ttl is not None else nb_zone.default_ttl,
-                records=[pdns_auth_client.Record(content=r.value) for r in nb_rrsets[nb_rrset]],
+                records=[pdns_auth_client.Record(content=r.value) for r in nb_records],
             )
             pdns_rrsets.append(pdns_rrset)
         return pdns_rrsets
@@ -276,34 +337,46 @@ class NetboxPDNS:
 
             pdns_zones_list = self.zones_api.list_zones(self.config.pdns_server_id)
             pdns_zones = {
-                dns.name.from_text(z.name if z.name is not None else ""): z for z in pdns_zones_list
+                name_from_text(z.name if z.name is not None else ""): z for z in pdns_zones_list
             }
-            self.logger.debug(f"pdns_zones = {pdns_zones}")
+            # Lazy %-formatting: these reprs can be large and are only built when DEBUG is on
+            self.logger.debug("pdns_zones = %s", pdns_zones)
 
-            nb_zones = self.nb.plugins.netbox_dns.zones.filter(nameserver_id=self.config.nb_ns_id)
-            nb_zones = {dns.name.from_text(z.name): z for z in nb_zones}
-            self.logger.debug(f"nb_zones = {nb_zones}")
-
-            pdns_zone_set = set(pdns_zones.keys())
-            nb_zone_set = set(nb_zones.keys())
+            # limit=0 requests NetBox's maximum page size, keeping pagination round-trips minimal
+            nb_zone_records = self.nb.plugins.netbox_dns.zones.filter(
+                nameserver_id=self.config.nb_ns_id, limit=0
+            )
+            nb_zones = {name_from_text(z.name): z for z in nb_zone_records}
+            self.logger.debug("nb_zones = %s", nb_zones)
+
+            # Dict key views support set operations directly, no intermediate sets needed.
+            # Zones whose serials already match are up to date and never reach the pool.
+            sync_zones = {
+                z
+                for z in pdns_zones.keys() & nb_zones.keys()
+                if nb_zones[z].soa_serial != pdns_zones[z].serial
+            }
+            self.logger.debug("sync_zones = %s", sync_zones)
 
-            self.logger.debug(f"pdns_zone_set = {pdns_zone_set}")
-            self.logger.debug(f"nb_zone_set = {nb_zone_set}")
+            nb_created = nb_zones.keys() - pdns_zones.keys()
+            self.logger.debug("nb_created = %s", nb_created)
 
-            sync_zones = pdns_zone_set & nb_zone_set
-            self.logger.debug(f"sync_zones = {sync_zones}")
-            for zone in sync_zones:
-                self.sync_zone(nb_zones[zone], pdns_zones[zone])
+            nb_deleted = pdns_zones.keys() - nb_zones.keys()
+            self.logger.debug("nb_deleted = %s", nb_deleted)
 
-            nb_created = nb_zone_set - pdns_zone_set
-            self.logger.debug(f"nb_created = {nb_created}")
-            for zone in nb_created:
-                self.create_zone(nb_zones[zone])
+            # Zone operations are dominated by HTTP round-trips, so run them concurrently
+            with ThreadPoolExecutor(
+                max_workers=self.config.sync_parallelism, thread_name_prefix="netbox-pdns-sync"
+            ) as executor:
+                futures: list[Future[None]] = [
+                    executor.submit(self.sync_zone, nb_zones[z], pdns_zones[z]) for z in sync_zones
+                ]
+                futures += [executor.submit(self.create_zone, nb_zones[z]) for z in nb_created]
+                futures += [executor.submit(self.delete_zone, z) for z in nb_deleted]
 
-            nb_deleted = pdns_zone_set - nb_zone_set
-            self.logger.debug(f"nb_deleted = {nb_deleted}")
-            for zone in nb_deleted:
-                self.delete_zone(zone)
+                # Surface the first zone failure once every submitted operation has finished
+                for future in futures:
+                    future.result()
 
             return {"result": "success"}
 
@@ -312,17 +385,17 @@ class NetboxPDNS:
 
         # Retrieve RRSets from Netbox
         nb_rrsets = self.get_nb_rrsets(nb_zone.id)
-        self.logger.debug(f"nb_rrsets = {nb_rrsets}")
+        self.logger.debug("nb_rrsets = %s", nb_rrsets)
 
         # Make PowerDNS RRSets from Netbox RRSets
         pdns_rrsets = self._mk_pdns_rrsets(
             nb_zone, nb_rrsets, nb_rrsets_replace=set(nb_rrsets.keys())
         )
-        self.logger.debug(f"pdns_rrsets = {pdns_rrsets}")
+        self.logger.debug("pdns_rrsets = %s", pdns_rrsets)
 
         # Build Zone struct to create on PowerDNS server
         pdns_zone = pdns_auth_client.Zone(
-            name=dns.name.from_text(nb_zone.name).to_text(),
+            name=name_from_text(nb_zone.name).to_text(),
             serial=nb_zone.soa_serial,
             rrsets=pdns_rrsets,
             soa_edit_api="",
@@ -333,29 +406,29 @@ class NetboxPDNS:
             self.zones_api.create_zone(self.config.pdns_server_id, pdns_zone)
 
         try:
-            self.retry_with_backoff(_create_pdns_zone)
+            self.retry_with_backoff(_create_pdns_zone, retry_if=is_transient_error)
         except Exception as e:
-            error_msg = f"Failed to create zone {nb_zone.name} in PowerDNS: {e}"
-            # Check if it's a 409 Conflict (zone already exists)
-            if "409" in str(e) and "Conflict" in str(e):
+            # A 409 Conflict means the zone already exists
+            if isinstance(e, pdns_auth_client.ApiException) and e.status == 409:
                 self.logger.warning(
                     f"Zone {nb_zone.name} already exists in PowerDNS, skipping creation"
                 )
                 return
-            else:
-                self.logger.error(error_msg)
-                raise PowerDNSAPIError(error_msg) from e
+            error_msg = f"Failed to create zone {nb_zone.name} in PowerDNS: {e}"
+            self.logger.error(error_msg)
+            raise PowerDNSAPIError(error_msg) from e
 
     def delete_zone(self, zone: dns.name.Name) -> None:
-        self.logger.info(f"Deleting zone {zone.to_text()}")
+        zone_text = zone.to_text()
+        self.logger.info(f"Deleting zone {zone_text}")
 
         def _delete_pdns_zone() -> None:
-            self.zones_api.delete_zone(self.config.pdns_server_id, zone.to_text())
+            self.zones_api.delete_zone(self.config.pdns_server_id, zone_text)
 
         try:
-            self.retry_with_backoff(_delete_pdns_zone)
+            self.retry_with_backoff(_delete_pdns_zone, retry_if=is_transient_error)
         except Exception as e:
-            error_msg = f"Failed to delete zone {zone.to_text()} from PowerDNS: {e}"
+            error_msg = f"Failed to delete zone {zone_text} from PowerDNS: {e}"
             self.logger.error(error_msg)
             raise PowerDNSAPIError(error_msg) from e
 
@@ -373,33 +446,34 @@ class NetboxPDNS:
 
         # Retrieve RRSets from Netbox
         nb_rrsets = self.get_nb_rrsets(nb_zone.id)
-        self.logger.debug(f"nb_rrsets = {nb_rrsets}")
+        self.logger.debug("nb_rrsets = %s", nb_rrsets)
 
-        # Retrieve RRSets from PowerDNS Server
-        pdns_rrsets_list = self.zones_api.list_zone(
-            self.config.pdns_server_id, pdns_zone.id if pdns_zone.id is not None else ""
-        ).rrsets
+        # Retrieve RRSets from PowerDNS Server, unless the zone in hand already carries them
+        # (list_zones omits RRSets, while list_zone/get_pdns_zone include them)
+        pdns_rrsets_list = pdns_zone.rrsets
+        if pdns_rrsets_list is None:
+            pdns_rrsets_list = self.get_pdns_zone(pdns_zone.id or "").rrsets
         pdns_rrsets_list = [] if pdns_rrsets_list is None else pdns_rrsets_list
         pdns_rrsets = {(r.name, r.type): r for r in pdns_rrsets_list}
-        self.logger.debug(f"pdns_rrsets = {pdns_rrsets}")
+        self.logger.debug("pdns_rrsets = %s", pdns_rrsets)
 
         # Create sets from each RRSet collection
         nb_rrsets_set = set(nb_rrsets.keys())
         pdns_rrsets_set = set(pdns_rrsets.keys())
-        self.logger.debug(f"nb_rrsets_set = {nb_rrsets_set}")
-        self.logger.debug(f"pdns_rrsets_set = {pdns_rrsets_set}")
+        self.logger.debug("nb_rrsets_set = %s", nb_rrsets_set)
+        self.logger.debug("pdns_rrsets_set = %s", pdns_rrsets_set)
 
         # Determine the RRSets that need to be replaced and deleted
         nb_rrsets_deleted = pdns_rrsets_set - nb_rrsets_set
         nb_rrsets_replace = nb_rrsets_set - nb_rrsets_deleted
-        self.logger.debug(f"nb_rrsets_deleted = {nb_rrsets_deleted}")
-        self.logger.debug(f"nb_rrsets_replace = {nb_rrsets_replace}")
+        self.logger.debug("nb_rrsets_deleted = %s", nb_rrsets_deleted)
+        self.logger.debug("nb_rrsets_replace = %s", nb_rrsets_replace)
 
         # Create RRSet patch to apply to zone
         pdns_rrset_patch = self._mk_pdns_rrsets(
             nb_zone, nb_rrsets, nb_rrsets_deleted, nb_rrsets_replace
         )
-        self.logger.debug(f"pdns_rrset_patch = {pdns_rrset_patch}")
+        self.logger.debug("pdns_rrset_patch = %s", pdns_rrset_patch)
 
         # Build Zone struct to patch PowerDNS server
         pdns_zone_updated = pdns_auth_client.Zone(
@@ -414,7 +488,7 @@ class NetboxPDNS:
             )
 
         try:
-            self.retry_with_backoff(_patch_pdns_zone)
+            self.retry_with_backoff(_patch_pdns_zone, retry_if=is_transient_error)
         except Exception as e:
             error_msg = f"Failed to patch zone {pdns_zone.name} in PowerDNS: {e}"
             self.logger.error(error_msg)
@@ -16,6 +16,8 @@ class ConfigurationError(NetboxPDNSError):
 class NetboxAPIError(NetboxPDNSError):
     """Raised when there's an error communicating with Netbox API."""
 
+    __slots__ = ("status_code",)
+
     def __init__(self, message: str, status_code: int | None = None) -> None:
         super().__init__(message)
         self.status_code = status_code
@@ -24,6 +26,8 @@ class NetboxAPIError(NetboxPDNSError):
 class PowerDNSAPIError(NetboxPDNSError):
     """Raised when there's an error communicating with PowerDNS API."""
 
+    __slots__ = ("status_code",)
+
     def __init__(self, message: str, status_code: int | None = None) -> None:
         super().__init__(message)
         self.status_code = status_code
@@ -32,6 +36,8 @@ class PowerDNSAPIError(NetboxPDNSError):
 class ZoneNotFoundError(NetboxPDNSError):
     """Raised when a requested zone is not found."""
 
+    __slots__ = ("zone_name",)
+
     def __init__(self, zone_name: str) -> None:
         super().__init__(f"Zone not found: {zone_name}")
         self.zone_name = zone_name
@@ -40,6 +46,8 @@ class ZoneNotFoundError(NetboxPDNSError):
 class ZoneSyncError(NetboxPDNSError):
     """Raised when there's an error during zone synchronization."""
 
+    __slots__ = ("zone_name",)
+
     def __init__(self, zone_name: str, message: str) -> None:
         super().__init__(f"Error syncing zone {zone_name}: {message}")
         self.zone_name = zone_name
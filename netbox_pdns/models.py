@@ -1,11 +1,21 @@
+import functools
 import re
-from urllib.parse import urlparse
+from urllib.parse import ParseResult, urlparse
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from .exceptions import ConfigurationError, ValidationError
 
+MQTT_CLIENT_ID_RE = re.compile(r"^[a-zA-Z0-9_-]+$")
+MQTT_TOPIC_PREFIX_RE = re.compile(r"^[a-zA-Z0-9_/-]+$")
+
+
+@functools.lru_cache(maxsize=32)
+def cached_urlparse(url: str) -> ParseResult:
+    """Parse a URL, memoized since the configured URLs are parsed repeatedly"""
+    return urlparse(url)
+
 
 class Settings(BaseSettings):
     """
@@ -24,7 +34,9 @@ class Settings(BaseSettings):
     in Netbox will be removed from the PowerDNS server for all domains that exist in Netbox.
     """
 
-    model_config = SettingsConfigDict(env_prefix="NETBOX_PDNS_", title="Netbox PowerDNS Connector")
+    model_config = SettingsConfigDict(
+        env_prefix="NETBOX_PDNS_", title="Netbox PowerDNS Connector", frozen=True
+    )
     api_key: str = Field(
         default=...,
         description="The secret API key used to authenticate webhook requests from Netbox",
@@ -44,17 +56,18 @@ class Settings(BaseSettings):
     @classmethod
     def validate_sync_crontab(cls, v: str) -> str:
         """Validate crontab format (basic validation)."""
-        if not v or not v.strip():
+        crontab = v.strip()
+        if not crontab:
             raise ValidationError("Crontab expression cannot be empty")
 
         # Basic crontab validation - should have 5 parts
-        parts = v.strip().split()
+        parts = crontab.split()
         if len(parts) != 5:
             raise ValidationError(
                 f"Invalid crontab format: {v}. Expected 5 parts (minute hour day month weekday)"
             )
 
-        return v.strip()
+        return crontab
 
     log_level: str = Field(default="INFO", description="Sets the log level of the console")
 
@@ -78,16 +91,17 @@ class Settings(BaseSettings):
     @classmethod
     def validate_nb_url(cls, v: str) -> str:
         """Validate Netbox URL format."""
-        if not v or not v.strip():
+        url = v.strip()
+        if not url:
             raise ValidationError("Netbox URL cannot be empty")
 
-        parsed = urlparse(v.strip())
+        parsed = cached_urlparse(url)
         if not parsed.scheme or not parsed.netloc:
             raise ValidationError(f"Invalid Netbox URL format: {v}")
         if parsed.scheme not in {"http", "https"}:
             raise ValidationError(f"Netbox URL must use http or https scheme, got: {parsed.scheme}")
 
-        return v.strip().rstrip("/")
+        return url.rstrip("/")
 
     nb_token: str = Field(default=..., description="API token for the Netbox server")
     nb_ns_id: int = Field(
@@ -101,10 +115,11 @@ class Settings(BaseSettings):
     @classmethod
     def validate_pdns_url(cls, v: str) -> str:
         """Validate PowerDNS URL format."""
-        if not v or not v.strip():
+        url = v.strip()
+        if not url:
             raise ValidationError("PowerDNS URL cannot be empty")
 
-        parsed = urlparse(v.strip())
+        parsed = cached_urlparse(url)
         if not parsed.scheme or not parsed.netloc:
             raise ValidationError(f"Invalid PowerDNS URL format: {v}")
         if parsed.scheme not in {"http", "https"}:
@@ -112,7 +127,7 @@ class Settings(BaseSettings):
                 f"PowerDNS URL must use http or https scheme, got: {parsed.scheme}"
             )
 
-        return v.strip().rstrip("/")
+        return url.rstrip("/")
 
     pdns_token: str = Field(
         default=..., description="API token for the PowerDNS Authoritative Server API"
@@ -121,6 +136,23 @@ class Settings(BaseSettings):
         default="localhost",
         description="The server identifier used when constructing PowerDNS API requests",
     )
+    sync_parallelism: int = Field(
+        default=8,
+        ge=1,
+        le=64,
+        description="Maximum number of zones synchronized concurrently during a full sync",
+    )
+    webhook_workers: int = Field(
+        default=4,
+        ge=1,
+        le=64,
+        description="Number of background workers processing queued webhook operations",
+    )
+    webhook_queue_size: int = Field(
+        default=1000,
+        ge=1,
+        description="Maximum number of queued webhook operations before webhooks are rejected",
+    )
     mqtt_enabled: bool = Field(
         default=False,
         description="Enable MQTT subscription for zone update notifications",
@@ -134,10 +166,11 @@ class Settings(BaseSettings):
     @classmethod
     def validate_mqtt_broker_url(cls, v: str) -> str:
         """Validate MQTT broker URL format."""
-        if not v or not v.strip():
+        url = v.strip()
+        if not url:
             raise ValidationError("MQTT broker URL cannot be empty")
 
-        parsed = urlparse(v.strip())
+        parsed = cached_urlparse(url)
         if not parsed.scheme or not parsed.netloc:
             raise ValidationError(f"Invalid MQTT broker URL format: {v}")
         if parsed.scheme not in {"mqtt", "mqtts"}:
@@ -145,7 +178,7 @@ class Settings(BaseSettings):
                 f"MQTT broker URL must use mqtt or mqtts scheme, got: {parsed.scheme}"
             )
 
-        return v.strip()
+        return url
 
     mqtt_client_id: str = Field(
         default="netbox-pdns",
@@ -158,16 +191,17 @@ class Settings(BaseSettings):
     @classmethod
     def validate_mqtt_client_id(cls, v: str) -> str:
         """Validate MQTT client ID format."""
-        if not v or not v.strip():
+        client_id = v.strip()
+        if not client_id:
             raise ValidationError("MQTT client ID cannot be empty")
 
         # Check for valid characters (alphanumeric, dash, underscore)
-        if not re.match(r"^[a-zA-Z0-9_-]+$", v.strip()):
+        if not MQTT_CLIENT_ID_RE.match(client_id):
             raise ValidationError(
                 "MQTT client ID can only contain alphanumeric characters, dashes, and underscores"
             )
 
-        return v.strip()
+        return client_id
 
     mqtt_topic_prefix: str = Field(
         default="dns/zones",
@@ -179,12 +213,13 @@ class Settings(BaseSettings):
     @classmethod
     def validate_mqtt_topic_prefix(cls, v: str) -> str:
         """Validate MQTT topic prefix format."""
-        if not v or not v.strip():
+        prefix = v.strip()
+        if not prefix:
             raise ValidationError("MQTT topic prefix cannot be empty")
 
         # Remove leading/trailing slashes and validate characters
-        cleaned = v.strip().strip("/")
-        if not re.match(r"^[a-zA-Z0-9_/-]+$", cleaned):
+        cleaned = prefix.strip("/")
+        if not MQTT_TOPIC_PREFIX_RE.match(cleaned):
             raise ValidationError(
                 "MQTT topic prefix can only contain alphanumeric characters, "
                 "dashes, underscores, and forward slashes"
@@ -241,6 +276,8 @@ class Settings(BaseSettings):
 
 
 class NetboxWebhook(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: int
     name: str
     serial: int | None = None
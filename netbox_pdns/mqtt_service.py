@@ -1,18 +1,57 @@
 import asyncio
-import json
 import logging
 import time
 from collections.abc import Callable
 from typing import Any
-from urllib.parse import urlparse
 
-import dns.name
 import paho.mqtt.client as mqtt
-from pydantic import BaseModel
+from paho.mqtt.properties import Properties
+from paho.mqtt.reasoncodes import ReasonCode
+from pydantic import BaseModel, field_validator
 from pydantic import ValidationError as PydanticValidationError
 
+from .api import name_from_text
 from .exceptions import MQTTConnectionError, ValidationError
-from .models import Settings
+from .models import Settings, cached_urlparse
+
+# Python logging levels for the paho client log levels that are forwarded
+MQTT_LOG_LEVELS: dict[int, int] = {
+    mqtt.MQTT_LOG_DEBUG: logging.DEBUG,
+    mqtt.MQTT_LOG_INFO: logging.INFO,
+    mqtt.MQTT_LOG_WARNING: logging.WARNING,
+    mqtt.MQTT_LOG_ERR: logging.ERROR,
+}
+
+# Reasons for MQTT v3 CONNACK return codes, indexed by code (0 is success)
+MQTT_CONNECT_ERRORS = (
+    "",
+    "incorrect protocol version",
+    "invalid client identifier",
+    "server unavailable",
+    "bad username or password",
+    "not authorised",
+)
+
+# Default port and TLS flag for each supported broker URL scheme
+MQTT_SCHEMES: dict[str, tuple[int, bool]] = {
+    "mqtt": (1883, False),
+    "mqtts": (8883, True),
+}
+
+# Bytes a JSON object payload can start with: an opening brace or JSON whitespace
+MQTT_PAYLOAD_FIRST_BYTES = b"{ \t\n\r"
+
+# Known zone update event types, mapped to one shared string each
+MQTT_EVENT_TYPES: dict[str, str] = {event: event for event in ("create", "update", "delete")}
+
+# Zone updates are queued from the paho network thread and drained on the event loop in
+# batches, so a burst of messages for the same zone results in a single sync
+MQTT_UPDATE_QUEUE_SIZE = 1024
+MQTT_BATCH_WINDOW = 0.05
+MQTT_BATCH_SIZE = 256
+
+# Seconds shutdown waits for queued zone updates to be handled before dropping them
+MQTT_DRAIN_TIMEOUT = 30.0
 
 
 class MQTTZoneUpdate(BaseModel):
@@ -24,12 +63,21 @@ class MQTTZoneUpdate(BaseModel):
     timestamp: float
     nameserver_ids: list[int] | None = None
 
+    @field_validator("event")
+    @classmethod
+    def share_event(cls, v: str) -> str:
+        """Reuse the shared string for known event types, leaving unknown ones as they are"""
+        # Payloads are untrusted, so nothing from them is interned (interned strings may
+        # never be freed); only the fixed set of known event literals is shared
+        return MQTT_EVENT_TYPES.get(v, v)
+
     def validate_zone_name(self) -> None:
         """Validate that the zone name is a valid DNS name"""
         if not self.zone or not self.zone.strip():
             raise ValidationError(f"Invalid DNS zone name '{self.zone}': empty zone name")
         try:
-            dns.name.from_text(self.zone)
+            # Zone names repeat across messages, so reuse the memoized parser
+            name_from_text(self.zone)
         except Exception as e:
             raise ValidationError(f"Invalid DNS zone name '{self.zone}': {e}") from e
 
@@ -46,24 +94,37 @@ class MQTTService:
         self.reconnect_delay = config.mqtt_reconnect_delay
         self.max_reconnect_delay = 300
         self._shutdown_event = asyncio.Event()
+        # Set from the paho network thread when a connection is established, for
+        # wait_for_connection running on the event loop
+        self._connected_event: asyncio.Event | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        # Only set while the service is started from an event loop
+        self._update_queue: asyncio.Queue[MQTTZoneUpdate] | None = None
+        self._consumer_task: asyncio.Task[None] | None = None
+        # Updates the consumer has taken off the queue but not finished handling
+        self._updates_in_flight = 0
+        # The topic prefix is fixed for the service's lifetime, so build it once
+        self._topic_prefix = config.mqtt_topic_prefix.rstrip("/") + "/"
 
     def _parse_broker_url(self) -> tuple[str, int, bool]:
         """Parse MQTT broker URL and return host, port, and TLS flag"""
-        parsed = urlparse(self.config.mqtt_broker_url)
-
-        if parsed.scheme == "mqtt":
-            port = parsed.port or 1883
-            use_tls = False
-        elif parsed.scheme == "mqtts":
-            port = parsed.port or 8883
-            use_tls = True
-        else:
-            raise MQTTConnectionError(f"Unsupported MQTT scheme: {parsed.scheme}")
+        parsed = cached_urlparse(self.config.mqtt_broker_url)
+
+        try:
+            default_port, use_tls = MQTT_SCHEMES[parsed.scheme]
+        except KeyError:
+            raise MQTTConnectionError(f"Unsupported MQTT scheme: {parsed.scheme}") from None
 
-        return parsed.hostname or "localhost", port, use_tls
+        return parsed.hostname or "localhost", parsed.port or default_port, use_tls
 
     def _on_connect(
-        self, client: mqtt.Client, userdata: Any, flags: dict, rc: int, properties: Any = None
+        self,
+        client: mqtt.Client,
+        userdata: Any,
+        flags: mqtt.ConnectFlags,
+        rc: ReasonCode | int,
+        properties: Properties | None,
+        /,
     ) -> None:
         """Callback for when the client connects to the MQTT broker"""
         if rc == 0:
@@ -72,6 +133,10 @@ class MQTTService:
                 self.config.mqtt_reconnect_delay
             )  # Reset delay on successful connection
             self.logger.info(f"Connected to MQTT broker at {self.config.mqtt_broker_url}")
+            # wait_for_connection may clear these from the event loop at any moment
+            loop, event = self._loop, self._connected_event
+            if loop is not None and event is not None:
+                loop.call_soon_threadsafe(event.set)
 
             # Subscribe to zone update topics
             topic = f"{self.config.mqtt_topic_prefix}/+/+"
@@ -79,18 +144,23 @@ class MQTTService:
             self.logger.info(f"Subscribed to MQTT topic: {topic}")
         else:
             self.connected = False
-            error_messages = {
-                1: "Connection refused - incorrect protocol version",
-                2: "Connection refused - invalid client identifier",
-                3: "Connection refused - server unavailable",
-                4: "Connection refused - bad username or password",
-                5: "Connection refused - not authorised",
-            }
-            error_msg = error_messages.get(rc, f"Connection refused - unknown error ({rc})")
-            self.logger.error(f"Failed to connect to MQTT broker: {error_msg}")
+            if not isinstance(rc, int):
+                # MQTT v5 reason codes carry their own description
+                reason = str(rc)
+            elif 0 < rc < len(MQTT_CONNECT_ERRORS):
+                reason = MQTT_CONNECT_ERRORS[rc]
+            else:
+                reason = f"unknown error ({rc})"
+            self.logger.error(f"Failed to connect to MQTT broker: Connection refused - {reason}")
 
     def _on_disconnect(
-        self, client: mqtt.Client, userdata: Any, rc: int, properties: Any = None
+        self,
+        client: mqtt.Client,
+        userdata: Any,
+        flags: mqtt.DisconnectFlags,
+        rc: ReasonCode | int,
+        properties: Properties | None,
+        /,
     ) -> None:
         """Callback for when the client disconnects from the MQTT broker"""
         self.connected = False
@@ -99,40 +169,51 @@ class MQTTService:
         else:
             self.logger.warning(f"Unexpected disconnection from MQTT broker (code: {rc})")
 
-    def _on_message(self, client: mqtt.Client, userdata: Any, message: mqtt.MQTTMessage) -> None:
+    def _on_message(self, client: mqtt.Client, userdata: Any, message: mqtt.MQTTMessage, /) -> None:
         """Callback for when a message is received from the MQTT broker"""
         try:
-            # Parse topic to extract zone name and event
-            topic_parts = message.topic.split("/")
-            if len(topic_parts) < 3:
-                self.logger.warning(f"Invalid topic format: {message.topic}")
+            # Topics are "<prefix>/<zone>/<event>"; slice them rather than splitting into a list
+            topic = message.topic
+            if not topic.startswith(self._topic_prefix):
+                self.logger.warning(f"Topic doesn't match expected format: {topic}")
                 return
 
-            expected_prefix_parts = self.config.mqtt_topic_prefix.split("/")
-            if len(topic_parts) < len(expected_prefix_parts) + 2:
-                self.logger.warning(f"Topic doesn't match expected format: {message.topic}")
+            zone_name, _, event_type = topic[len(self._topic_prefix) :].partition("/")
+            if not zone_name or not event_type or "/" in event_type:
+                self.logger.warning(f"Invalid topic format: {topic}")
                 return
 
-            # Extract zone name and event from topic
-            zone_name = topic_parts[len(expected_prefix_parts)]
-            event_type = topic_parts[len(expected_prefix_parts) + 1]
-
-            # Parse message payload
-            try:
-                payload = json.loads(message.payload.decode("utf-8"))
-            except json.JSONDecodeError as e:
-                self.logger.error(f"Failed to parse JSON payload: {e}")
+            # A zone update is a JSON object, so anything else is rejected from its first byte
+            # without running the JSON parser. Empty payloads clear retained messages.
+            payload = message.payload
+            if not payload:
+                self.logger.debug(f"Ignoring empty MQTT payload on {topic}")
+                return
+            if payload[0] not in MQTT_PAYLOAD_FIRST_BYTES:
+                self.logger.error(
+                    "Invalid zone update message format: payload is not a JSON object"
+                )
                 return
 
-            # Validate message format
+            # Parse and validate the payload bytes in one pass, without str or dict intermediates
             try:
-                zone_update = MQTTZoneUpdate(**payload)
-                zone_update.validate_zone_name()
+                zone_update = MQTTZoneUpdate.model_validate_json(payload)
             except PydanticValidationError as e:
-                self.logger.error(f"Invalid zone update message format: {e}")
+                if any(error["type"] == "json_invalid" for error in e.errors()):
+                    self.logger.error(f"Failed to parse JSON payload: {e}")
+                else:
+                    self.logger.error(f"Invalid zone update message format: {e}")
                 return
-            except ValidationError as e:
-                self.logger.error(f"Zone validation error: {e}")
+
+            # Cheap checks first: stale (e.g. retained, replayed) and mismatched messages are
+            # dropped before the zone name is parsed as a DNS name
+
+            # Check message age (ignore messages older than 5 minutes)
+            message_age = time.time() - zone_update.timestamp
+            if message_age > 300:
+                self.logger.warning(
+                    f"Ignoring old message for {zone_name} (age: {message_age:.1f}s)"
+                )
                 return
 
             # Verify zone name consistency
@@ -149,12 +230,10 @@ class MQTTService:
                 )
                 return
 
-            # Check message age (ignore messages older than 5 minutes)
-            message_age = time.time() - zone_update.timestamp
-            if message_age > 300:
-                self.logger.warning(
-                    f"Ignoring old message for {zone_name} (age: {message_age:.1f}s)"
-                )
+            try:
+                zone_update.validate_zone_name()
+            except ValidationError as e:
+                self.logger.error(f"Zone validation error: {e}")
                 return
 
             self.logger.info(
@@ -162,33 +241,76 @@ class MQTTService:
                 f"({event_type}, serial: {zone_update.serial})"
             )
 
-            # Call the zone handler
-            self.zone_handler(zone_update)
+            if self._update_queue is not None and self._loop is not None:
+                self._loop.call_soon_threadsafe(self._queue_update, zone_update)
+            else:
+                self.zone_handler(zone_update)
 
         except Exception as e:
             self.logger.error(f"Error processing MQTT message: {e}", exc_info=True)
 
+    def _queue_update(self, zone_update: MQTTZoneUpdate) -> None:
+        """Queue a zone update for the consumer task (runs on the event loop)"""
+        if self._update_queue is None:
+            return
+        try:
+            self._update_queue.put_nowait(zone_update)
+        except asyncio.QueueFull:
+            self.logger.warning(f"MQTT update queue full, dropping update for {zone_update.zone}")
+
+    async def _consume_updates(self, queue: asyncio.Queue[MQTTZoneUpdate]) -> None:
+        """Drain queued zone updates in batches, coalescing repeats of the same zone event"""
+        while True:
+            updates = [await queue.get()]
+            self._updates_in_flight = 1
+            # Give the rest of a burst a moment to arrive before handling it
+            await asyncio.sleep(MQTT_BATCH_WINDOW)
+            while len(updates) < MQTT_BATCH_SIZE and not queue.empty():
+                updates.append(queue.get_nowait())
+            self._updates_in_flight = len(updates)
+
+            batch: dict[tuple[str, str], MQTTZoneUpdate] = {}
+            for update in updates:
+                key = (update.zone, update.event)
+                previous = batch.pop(key, None)
+                # Re-inserting keeps the batch in order of each zone event's latest arrival
+                batch[key] = (
+                    update if previous is None or update.serial >= previous.serial else previous
+                )
+
+            try:
+                for update in batch.values():
+                    try:
+                        await asyncio.to_thread(self.zone_handler, update)
+                    except Exception as e:
+                        self.logger.error(
+                            f"Error handling MQTT zone update for {update.zone}: {e}",
+                            exc_info=True,
+                        )
+            finally:
+                # Mark every update taken from the queue, coalesced ones included, as done
+                for _ in updates:
+                    queue.task_done()
+                self._updates_in_flight = 0
+
     def _on_subscribe(
         self,
         client: mqtt.Client,
         userdata: Any,
         mid: int,
-        granted_qos: list,
-        properties: Any = None,
+        granted_qos: list[ReasonCode],
+        properties: Properties | None,
+        /,
     ) -> None:
         """Callback for when a subscription is confirmed"""
         self.logger.debug(f"Subscription confirmed (mid: {mid}, qos: {granted_qos})")
 
-    def _on_log(self, client: mqtt.Client, userdata: Any, level: int, buf: str) -> None:
+    def _on_log(self, client: mqtt.Client, userdata: Any, level: int, buf: str, /) -> None:
         """Callback for MQTT client logging"""
-        if level == mqtt.MQTT_LOG_DEBUG:
-            self.logger.debug(f"MQTT: {buf}")
-        elif level == mqtt.MQTT_LOG_INFO:
-            self.logger.info(f"MQTT: {buf}")
-        elif level == mqtt.MQTT_LOG_WARNING:
-            self.logger.warning(f"MQTT: {buf}")
-        elif level == mqtt.MQTT_LOG_ERR:
-            self.logger.error(f"MQTT: {buf}")
+        # paho logs every packet at debug level, so filter before doing any other work
+        log_level = MQTT_LOG_LEVELS.get(level)
+        if log_level is not None and self.logger.isEnabledFor(log_level):
+            self.logger.log(log_level, "MQTT: %s", buf)
 
     def start(self) -> None:
         """Start the MQTT client and connect to broker"""
@@ -228,6 +350,18 @@ class MQTTService:
             self.logger.info(f"Connecting to MQTT broker: {host}:{port}")
             self.client.connect(host, port, keepalive=self.config.mqtt_keepalive)
 
+            # When started from the event loop, hand updates to a single consumer task
+            # instead of running the zone handler on the paho network thread
+            try:
+                self._loop = asyncio.get_running_loop()
+            except RuntimeError:
+                self._loop = None
+            if self._loop is not None:
+                self._update_queue = asyncio.Queue(maxsize=MQTT_UPDATE_QUEUE_SIZE)
+                self._consumer_task = self._loop.create_task(
+                    self._consume_updates(self._update_queue)
+                )
+
             # Start the client loop in a separate thread
             self.client.loop_start()
 
@@ -236,8 +370,8 @@ class MQTTService:
             self.logger.error(error_msg, exc_info=True)
             raise MQTTConnectionError(error_msg) from e
 
-    def stop(self) -> None:
-        """Stop the MQTT client and disconnect from broker"""
+    def _stop_client(self) -> None:
+        """Stop the network loop and disconnect, so no further updates are received"""
         self._shutdown_event.set()
 
         if self.client:
@@ -248,6 +382,31 @@ class MQTTService:
             self.connected = False
             self.client = None
 
+    def stop(self) -> None:
+        """Stop the MQTT client and disconnect from broker"""
+        self._stop_client()
+
+        if self._consumer_task is not None:
+            queued = self._update_queue.qsize() if self._update_queue is not None else 0
+            dropped = queued + self._updates_in_flight
+            if dropped:
+                self.logger.warning(f"Dropping {dropped} queued MQTT zone updates on shutdown")
+            self._consumer_task.cancel()
+            self._consumer_task = None
+            self._updates_in_flight = 0
+        self._update_queue = None
+
+    async def shutdown(self, drain_timeout: float = MQTT_DRAIN_TIMEOUT) -> None:
+        """Stop receiving updates, give queued ones a chance to be handled, then stop"""
+        self._stop_client()
+
+        if self._update_queue is not None and self._consumer_task is not None:
+            try:
+                await asyncio.wait_for(self._update_queue.join(), timeout=drain_timeout)
+            except TimeoutError:
+                pass  # stop() logs the updates that are left
+        self.stop()
+
     def is_connected(self) -> bool:
         """Check if the MQTT client is connected"""
         return self.connected
@@ -257,13 +416,18 @@ class MQTTService:
         if not self.config.mqtt_enabled:
             return True
 
-        start_time = time.time()
-        while time.time() - start_time < connection_timeout:
+        # Register the event before checking, so a connection made in between is not missed
+        self._loop = asyncio.get_running_loop()
+        self._connected_event = asyncio.Event()
+        try:
             if self.connected:
                 return True
-            await asyncio.sleep(0.1)
-
-        return False
+            await asyncio.wait_for(self._connected_event.wait(), timeout=connection_timeout)
+            return True
+        except TimeoutError:
+            return False
+        finally:
+            self._connected_event = None
 
     def get_status(self) -> dict[str, Any]:
         """Get MQTT service status information"""
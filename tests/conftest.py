@@ -1,14 +1,19 @@
+import logging
 import os
 from collections.abc import Generator
-from unittest.mock import patch
+from unittest.mock import MagicMock, Mock, create_autospec, patch
 
 import pytest
 
+from netbox_pdns.api import NetboxPDNS
+from netbox_pdns.models import Settings
+from netbox_pdns.mqtt_service import MQTTService
 
-@pytest.fixture(autouse=True)
+
+@pytest.fixture(scope="session", autouse=True)
 def mock_env_file() -> Generator[None, None, None]:
     """
-    Create a mock environment for all tests.
+    Create a mock environment for the whole test session.
     This prevents tests from reading real .env files or environment variables.
     """
     # Mock environment variables for testing
@@ -23,3 +28,58 @@ def mock_env_file() -> Generator[None, None, None]:
 
     with patch.dict(os.environ, env_vars, clear=True):
         yield
+
+
+@pytest.fixture(scope="session", autouse=True)
+def quiet_logging() -> Generator[None, None, None]:
+    """
+    Keep the connector's log records out of pytest's per-test log capture.
+    Tests assert on mocked loggers rather than captured output, so nothing is lost.
+    """
+    logger = logging.getLogger("netbox_pdns")
+    logger.handlers.clear()
+    logger.propagate = False
+    yield
+    logger.propagate = True
+
+
+@pytest.fixture(scope="session")
+def prebuilt_settings() -> Settings:
+    """Settings matching the mock environment, validated once per session."""
+    return Settings(
+        api_key="test_api_key",
+        nb_url="https://netbox.example.com",
+        nb_token="netbox_token",
+        nb_ns_id=1,
+        pdns_url="https://pdns.example.com",
+        pdns_token="pdns_token",
+    )
+
+
+@pytest.fixture(scope="session")
+def netbox_pdns_spec(prebuilt_settings: Settings) -> Mock:
+    """NetboxPDNS mock with the real interface, specced once per session."""
+    spec: Mock = create_autospec(NetboxPDNS, instance=True)
+    # Instance attributes are set in __init__, so the class spec does not cover them
+    spec.configure_mock(
+        config=prebuilt_settings,
+        logger=create_autospec(logging.Logger, instance=True),
+        _operation_lock_with_logging=MagicMock(),
+    )
+    return spec
+
+
+@pytest.fixture(scope="session")
+def mqtt_service_spec() -> Mock:
+    """MQTTService mock with the real interface, specced once per session."""
+    spec: Mock = create_autospec(MQTTService, instance=True)
+    return spec
+
+
+@pytest.fixture
+def mock_mqtt_service(mqtt_service_spec: Mock) -> Mock:
+    """The shared MQTTService mock, reset to a disabled, disconnected service."""
+    mqtt_service_spec.reset_mock(return_value=True, side_effect=True)
+    mqtt_service_spec.get_status.return_value = {"enabled": False}
+    mqtt_service_spec.wait_for_connection.return_value = False
+    return mqtt_service_spec
@@ -0,0 +1,257 @@
+import json
+from collections.abc import Generator
+from contextlib import ExitStack
+from dataclasses import asdict, dataclass
+from typing import Any
+from unittest.mock import Mock, patch
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+from requests import PreparedRequest, Response
+from requests.adapters import BaseAdapter
+
+from netbox_pdns.models import Settings
+
+
+@dataclass(slots=True)
+class MockNetboxZone:
+    id: int
+    name: str
+    soa_serial: int
+    default_ttl: int = 3600
+
+
+@dataclass(slots=True)
+class MockNetboxRecord:
+    id: int
+    zone_id: int
+    fqdn: str
+    type: str
+    value: str
+    ttl: int | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class MockPDNSRecord:
+    content: str
+
+
+@dataclass(slots=True, frozen=True)
+class MockPDNSRRSet:
+    name: str
+    type: str
+    ttl: int
+    records: tuple[MockPDNSRecord, ...]
+
+
+@dataclass(slots=True, frozen=True)
+class MockPDNSZone:
+    id: str
+    name: str
+    serial: int
+    rrsets: tuple[MockPDNSRRSet, ...]
+
+
+# RRsets served for example.com, built once and shared by every zone fixture
+EXAMPLE_RRSETS = (
+    MockPDNSRRSet(
+        "example.com",
+        "SOA",
+        3600,
+        (MockPDNSRecord("ns1.example.com. admin.example.com. 2023010101 3600 900 1209600 86400"),),
+    ),
+    MockPDNSRRSet("example.com", "NS", 3600, (MockPDNSRecord("ns1.example.com"),)),
+    MockPDNSRRSet(
+        "www.example.com",
+        "A",
+        3600,
+        (MockPDNSRecord("192.0.2.1"), MockPDNSRecord("192.0.2.2")),
+    ),
+)
+
+
+# Zones in the bulk data set used to check that full_sync only touches changed zones
+BULK_ZONE_COUNT = 100
+
+
+class MockNetboxAdapter(BaseAdapter):
+    """Serve the netbox_dns plugin API from mock zones and records at the HTTP layer.
+
+    pynetbox's own request and response handling runs, so the code under test sees real
+    pynetbox records.
+    """
+
+    def __init__(
+        self,
+        ns_id: int,
+        zones: list[MockNetboxZone],
+        records: dict[int, list[MockNetboxRecord]],
+    ) -> None:
+        super().__init__()
+        self.ns_id = ns_id
+        self.zones = {zone.id: asdict(zone) for zone in zones}
+        self.records = {
+            zone_id: [asdict(record) for record in zone_records]
+            for zone_id, zone_records in records.items()
+        }
+
+    def send(self, request: PreparedRequest, *args: Any, **kwargs: Any) -> Response:
+        url = urlsplit(request.url or "")
+        query = parse_qs(url.query)
+        path = url.path.removeprefix("/api/plugins/netbox-dns/")
+        body: Any = None
+
+        if path == "zones/":
+            zones = list(self.zones.values())
+            if "nameserver_id" in query:
+                zones = zones if query["nameserver_id"] == [str(self.ns_id)] else []
+            for field in ("id", "name"):
+                if field in query:
+                    zones = [zone for zone in zones if str(zone[field]) in query[field]]
+            body = zones
+        elif path.startswith("zones/"):
+            body = self.zones.get(int(path.removeprefix("zones/").strip("/")))
+        elif path == "records/":
+            body = self.records.get(int(query["zone_id"][0]), [])
+
+        response = Response()
+        response.request = request
+        response.url = request.url or ""
+        response.headers["Content-Type"] = "application/json"
+        if body is None:
+            response.status_code = 404
+            response._content = b'{"detail": "Not found."}'
+        else:
+            if isinstance(body, list):
+                body = {"count": len(body), "next": None, "previous": None, "results": body}
+            response.status_code = 200
+            response._content = json.dumps(body).encode()
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+# Integration tests with real responses but mocked API clients. The response fixtures are
+# built once per session; tests that modify them must work on a copy.
+@pytest.fixture(scope="session")
+def real_settings() -> Settings:
+    """Use test environment settings"""
+    return Settings(
+        api_key="test_api_key",
+        nb_url="https://netbox.example.com",
+        nb_token="netbox_token",
+        nb_ns_id=1,
+        pdns_url="https://pdns.example.com",
+        pdns_token="pdns_token",
+        log_level="DEBUG",
+    )
+
+
+@pytest.fixture(scope="session")
+def mock_nb_zones() -> list[MockNetboxZone]:
+    """Mock response for Netbox zones"""
+    return [MockNetboxZone(1, "example.com", 2023010101), MockNetboxZone(2, "new.com", 2023010102)]
+
+
+@pytest.fixture(scope="session")
+def mock_nb_records() -> dict[int, list[MockNetboxRecord]]:
+    """Mock response for Netbox records"""
+    return {
+        1: [
+            MockNetboxRecord(
+                1,
+                1,
+                "example.com",
+                "SOA",
+                "ns1.example.com. admin.example.com. 2023010101 3600 900 1209600 86400",
+            ),
+            MockNetboxRecord(2, 1, "example.com", "NS", "ns1.example.com"),
+            MockNetboxRecord(3, 1, "www.example.com", "A", "192.0.2.1"),
+            MockNetboxRecord(4, 1, "www.example.com", "A", "192.0.2.2"),
+        ],
+        2: [
+            MockNetboxRecord(
+                5,
+                2,
+                "new.com",
+                "SOA",
+                "ns1.example.com. admin.new.com. 2023010102 3600 900 1209600 86400",
+            ),
+            MockNetboxRecord(6, 2, "new.com", "NS", "ns1.example.com"),
+            MockNetboxRecord(7, 2, "www.new.com", "A", "192.0.2.3"),
+        ],
+    }
+
+
+@pytest.fixture(scope="session")
+def mock_pdns_zones() -> tuple[MockPDNSZone, ...]:
+    """Immutable baseline PowerDNS zones, tests derive variants with dataclasses.replace"""
+    return (
+        MockPDNSZone("example.com", "example.com.", 2023010101, EXAMPLE_RRSETS),
+        MockPDNSZone("old.com", "old.com.", 2023010100, ()),
+    )
+
+
+@pytest.fixture(scope="session")
+def netbox_adapter(
+    real_settings: Settings,
+    mock_nb_zones: list[MockNetboxZone],
+    mock_nb_records: dict[int, list[MockNetboxRecord]],
+) -> MockNetboxAdapter:
+    """Transport adapter serving the mock Netbox responses over HTTP"""
+    return MockNetboxAdapter(real_settings.nb_ns_id, mock_nb_zones, mock_nb_records)
+
+
+@pytest.fixture(scope="session")
+def bulk_netbox_adapter(real_settings: Settings) -> MockNetboxAdapter:
+    """Netbox serving BULK_ZONE_COUNT zones, where only zone1 has a newer serial than PowerDNS"""
+    zones = [
+        MockNetboxZone(i, f"zone{i}.example.com", 2023010102 if i == 1 else 2023010101)
+        for i in range(1, BULK_ZONE_COUNT + 1)
+    ]
+    records = {
+        zone.id: [
+            MockNetboxRecord(
+                zone.id,
+                zone.id,
+                zone.name,
+                "SOA",
+                f"ns1.example.com. admin.example.com. {zone.soa_serial} 3600 900 1209600 86400",
+            )
+        ]
+        for zone in zones
+    }
+    return MockNetboxAdapter(real_settings.nb_ns_id, zones, records)
+
+
+@pytest.fixture(scope="session")
+def bulk_pdns_zones() -> tuple[MockPDNSZone, ...]:
+    """PowerDNS side of bulk_netbox_adapter, every zone at the same serial"""
+    return tuple(
+        MockPDNSZone(f"zone{i}.example.com.", f"zone{i}.example.com.", 2023010101, ())
+        for i in range(1, BULK_ZONE_COUNT + 1)
+    )
+
+
+@pytest.fixture(scope="module")
+def patched_apis(mock_pdns_zones: tuple[MockPDNSZone, ...]) -> Generator[Mock, None, None]:
+    """Patch the PowerDNS client once per module and yield the zones API mock"""
+    # Index the zones by ID once, for the single-zone lookups
+    pdns_zones_by_id = {z.id: z for z in mock_pdns_zones}
+
+    with ExitStack() as stack:
+        # Mock PowerDNS API responses
+        stack.enter_context(patch("pdns_auth_client.ApiClient"))
+        mock_zones_api = stack.enter_context(patch("pdns_auth_client.ZonesApi")).return_value
+
+        # Mock zone operations
+        mock_zones_api.list_zones = lambda server_id: mock_pdns_zones
+        mock_zones_api.list_zone = lambda server_id, zone_id: pdns_zones_by_id.get(zone_id)
+
+        # Mock actual API calls with traceable mocks
+        mock_zones_api.create_zone = Mock()
+        mock_zones_api.delete_zone = Mock()
+        mock_zones_api.patch_zone = Mock()
+
+        yield mock_zones_api
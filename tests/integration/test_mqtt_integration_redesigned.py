@@ -4,300 +4,210 @@ These tests focus on the public API and end-to-end behavior rather than
 internal implementation details. Internal handler logic is covered by unit tests.
 """
 
-from collections.abc import Generator
+from __future__ import annotations
+
+from contextlib import ExitStack
+from typing import TYPE_CHECKING, Any
 from unittest.mock import Mock, patch
 
 import pytest
-from fastapi.testclient import TestClient
 
 from netbox_pdns import create_app
 from netbox_pdns.models import Settings
+from netbox_pdns.mqtt_service import MQTTService
+
+if TYPE_CHECKING:
+    from fastapi.testclient import TestClient
+
+
+def build_client(config: Settings, mock_mqtt: bool) -> tuple[TestClient, Mock | None]:
+    """Create the app around a mocked NetboxPDNS API and scheduler.
+
+    The patches are only needed while the app is built, since create_app captures the
+    objects it uses, so they are undone before the client is returned.
+    """
+    # Imported here so collecting this module doesn't pull in the test client and httpx
+    from fastapi.testclient import TestClient
+
+    mqtt_class = None
+    with ExitStack() as stack:
+        mock_netbox = stack.enter_context(patch("netbox_pdns.NetboxPDNS"))
+        mock_netbox.return_value.config = config
+        mock_netbox.return_value.full_sync.return_value = {"result": "success"}
+        stack.enter_context(patch("netbox_pdns.AsyncIOScheduler"))
+
+        if mock_mqtt:
+            # Mock all methods to prevent real network activity
+            mqtt_class = stack.enter_context(patch("netbox_pdns.MQTTService", autospec=True))
+            mqtt_instance = mqtt_class.return_value
+            mqtt_instance.wait_for_connection.return_value = False
+            mqtt_instance.get_status.return_value = {
+                "enabled": True,
+                "connected": False,  # Not actually connected in test
+                "broker_url": config.mqtt_broker_url,
+                "client_id": config.mqtt_client_id,
+                "topic_prefix": config.mqtt_topic_prefix,
+                "qos": config.mqtt_qos,
+            }
+
+        app = create_app()
+    return TestClient(app), mqtt_class
+
+
+@pytest.fixture(scope="session")
+def client_mqtt_disabled() -> TestClient:
+    """Client for an app with MQTT disabled, built once per session."""
+    config = Settings(
+        api_key="test_api_key",
+        nb_url="https://netbox.example.com",
+        nb_token="test_nb_token",
+        nb_ns_id=1,
+        pdns_url="https://pdns.example.com",
+        pdns_token="test_pdns_token",
+        mqtt_enabled=False,  # Disabled for safe testing
+    )
+    client, _ = build_client(config, mock_mqtt=False)
+    return client
+
+
+@pytest.fixture(scope="session")
+def mqtt_enabled_app() -> tuple[TestClient, Mock | None]:
+    """Client for an app with MQTT enabled and the MQTT service class mock, built once."""
+    config = Settings(
+        api_key="test_api_key",
+        nb_url="https://netbox.example.com",
+        nb_token="test_nb_token",
+        nb_ns_id=1,
+        pdns_url="https://pdns.example.com",
+        pdns_token="test_pdns_token",
+        mqtt_enabled=True,
+        mqtt_broker_url="mqtt://test-broker:1883",
+        mqtt_client_id="test-client-id",
+        mqtt_topic_prefix="test/zones",
+        mqtt_qos=2,
+    )
+    return build_client(config, mock_mqtt=True)
+
+
+@pytest.fixture
+def client_mqtt_enabled(
+    mqtt_enabled_app: tuple[TestClient, Mock | None],
+) -> TestClient:
+    """Client for the MQTT-enabled app, with the MQTT service mock's calls reset."""
+    client, mqtt_class = mqtt_enabled_app
+    assert mqtt_class is not None
+    mqtt_class.return_value.reset_mock()
+    return client
+
+
+@pytest.fixture
+def mqtt_instance(mqtt_enabled_app: tuple[TestClient, Mock | None]) -> Mock:
+    """The MQTT service mock used by the MQTT-enabled app."""
+    _, mqtt_class = mqtt_enabled_app
+    assert mqtt_class is not None
+    instance: Mock = mqtt_class.return_value
+    return instance
 
 
 class TestMQTTIntegrationEndToEnd:
     """End-to-end integration tests for MQTT functionality with FastAPI app."""
 
-    @pytest.fixture
-    def mqtt_disabled_config(self) -> Settings:
-        """Configuration with MQTT disabled for safe testing."""
-        return Settings(
-            api_key="test_api_key",
-            nb_url="https://netbox.example.com",
-            nb_token="test_nb_token",
-            nb_ns_id=1,
-            pdns_url="https://pdns.example.com",
-            pdns_token="test_pdns_token",
-            mqtt_enabled=False,  # Disabled for safe testing
-        )
-
-    @pytest.fixture
-    def mqtt_enabled_config(self) -> Settings:
-        """Configuration with MQTT enabled for testing enabled state."""
-        return Settings(
-            api_key="test_api_key",
-            nb_url="https://netbox.example.com",
-            nb_token="test_nb_token",
-            nb_ns_id=1,
-            pdns_url="https://pdns.example.com",
-            pdns_token="test_pdns_token",
-            mqtt_enabled=True,
-            mqtt_broker_url="mqtt://test-broker:1883",
-            mqtt_client_id="test-client",
-            mqtt_topic_prefix="test/zones",
-            mqtt_qos=1,
-        )
-
-    @pytest.fixture
-    def mock_netbox_api(self) -> Generator[Mock, None, None]:
-        """Mock the NetboxPDNS API layer to avoid external dependencies."""
-        with patch("netbox_pdns.NetboxPDNS") as mock_class:
-            mock_instance = Mock()
-            mock_class.return_value = mock_instance
-            mock_instance.full_sync.return_value = {"result": "success"}
-            yield mock_instance
-
-    def test_mqtt_status_endpoint_disabled(self, mock_netbox_api: Mock) -> None:
-        """Test MQTT status endpoint when MQTT is disabled."""
-        # Configure with MQTT disabled
-        mock_netbox_api.config = Settings(
-            api_key="test_api_key",
-            nb_url="https://netbox.example.com",
-            nb_token="test_nb_token",
-            nb_ns_id=1,
-            pdns_url="https://pdns.example.com",
-            pdns_token="test_pdns_token",
-            mqtt_enabled=False,
-        )
-
-        with patch("apscheduler.schedulers.background.BackgroundScheduler"):
-            with patch("netbox_pdns.mqtt_service.MQTTService") as mqtt_mock:
-                mqtt_instance = Mock()
-                mqtt_mock.return_value = mqtt_instance
-
-                app = create_app()
-                client = TestClient(app)
-
-                response = client.get("/mqtt/status")
-
-                assert response.status_code == 200
-                data = response.json()
-
-                # Test the response structure
-                assert "enabled" in data
-                assert "connected" in data
-                assert "broker_url" in data
-                assert "client_id" in data
-                assert "topic_prefix" in data
-                assert "qos" in data
-
-                # MQTT should be disabled
-                assert data["enabled"] is False
-
-    def test_mqtt_status_endpoint_enabled_structure(self, mock_netbox_api: Mock) -> None:
-        """Test MQTT status endpoint returns correct structure when enabled."""
-        # Configure with MQTT enabled (but mocked to avoid actual connection)
-        mock_netbox_api.config = Settings(
-            api_key="test_api_key",
-            nb_url="https://netbox.example.com",
-            nb_token="test_nb_token",
-            nb_ns_id=1,
-            pdns_url="https://pdns.example.com",
-            pdns_token="test_pdns_token",
-            mqtt_enabled=True,
-            mqtt_broker_url="mqtt://test-broker:1883",
-            mqtt_client_id="test-client-id",
-            mqtt_topic_prefix="test/zones",
-            mqtt_qos=2,
-        )
-
-        with patch("apscheduler.schedulers.background.BackgroundScheduler"):
-            with patch("netbox_pdns.mqtt_service.MQTTService") as mqtt_mock:
-                mqtt_instance = Mock()
-                mqtt_mock.return_value = mqtt_instance
-
-                # Mock the status response
-                mqtt_instance.get_status.return_value = {
+    @pytest.mark.parametrize(
+        ("client_fixture", "expected"),
+        [
+            ("client_mqtt_disabled", {"enabled": False}),
+            (
+                "client_mqtt_enabled",
+                {
                     "enabled": True,
-                    "connected": False,  # Not actually connected in test
                     "broker_url": "mqtt://test-broker:1883",
                     "client_id": "test-client-id",
                     "topic_prefix": "test/zones",
                     "qos": 2,
-                }
-
-                app = create_app()
-                client = TestClient(app)
-
-                response = client.get("/mqtt/status")
-
-                assert response.status_code == 200
-                data = response.json()
-
-                # Verify the response contains expected configuration
-                assert data["enabled"] is True
-                assert data["broker_url"] == "mqtt://test-broker:1883"
-                assert data["client_id"] == "test-client-id"
-                assert data["topic_prefix"] == "test/zones"
-                assert data["qos"] == 2
-
-    def test_app_startup_mqtt_disabled(self, mock_netbox_api: Mock) -> None:
+                },
+            ),
+        ],
+    )
+    def test_mqtt_status_endpoint(
+        self, client_fixture: str, expected: dict[str, Any], request: pytest.FixtureRequest
+    ) -> None:
+        """Test core endpoints and the MQTT status structure with MQTT disabled or enabled."""
+        client: TestClient = request.getfixturevalue(client_fixture)
+
+        # Core endpoints work regardless of MQTT configuration
+        response = client.get("/health")
+        assert response.status_code == 200
+
+        response = client.get("/mqtt/status")
+        assert response.status_code == 200
+        data = response.json()
+
+        # Test the response structure
+        status_keys = {"enabled", "connected", "broker_url", "client_id", "topic_prefix", "qos"}
+        assert status_keys <= data.keys()
+        # Verify the response reflects the configuration
+        assert data.items() >= expected.items()
+
+    def test_app_startup_mqtt_disabled(
+        self, client_mqtt_disabled: TestClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test app startup behavior when MQTT is disabled."""
-        mock_netbox_api.config = Settings(
-            api_key="test_api_key",
-            nb_url="https://netbox.example.com",
-            nb_token="test_nb_token",
-            nb_ns_id=1,
-            pdns_url="https://pdns.example.com",
-            pdns_token="test_pdns_token",
-            mqtt_enabled=False,
-        )
-
-        with patch("apscheduler.schedulers.background.BackgroundScheduler"):
-            with patch("netbox_pdns.mqtt_service.MQTTService") as mqtt_mock:
-                mqtt_instance = Mock()
-                mqtt_mock.return_value = mqtt_instance
-
-                # Create and start app
-                with TestClient(create_app()) as client:
-                    # Verify basic functionality works
-                    response = client.get("/health")
-                    assert response.status_code == 200
-                    assert response.json() == {"status": "Healthy"}
-
-                # With MQTT disabled, start should not be called
-                mqtt_instance.start.assert_not_called()
-
-    def test_app_startup_mqtt_enabled_observable_behavior(self, mock_netbox_api: Mock) -> None:
+        mock_start = Mock()
+        monkeypatch.setattr(MQTTService, "start", mock_start)
+
+        # Start the app
+        with client_mqtt_disabled as client:
+            # Verify basic functionality works
+            response = client.get("/health")
+            assert response.status_code == 200
+            assert response.json() == {"status": "Healthy"}
+
+        # With MQTT disabled, start should not be called
+        mock_start.assert_not_called()
+
+    def test_app_startup_mqtt_enabled_observable_behavior(
+        self, client_mqtt_enabled: TestClient, mqtt_instance: Mock
+    ) -> None:
         """Test observable behavior when MQTT is enabled (focus on what we can see)."""
-        mock_netbox_api.config = Settings(
-            api_key="test_api_key",
-            nb_url="https://netbox.example.com",
-            nb_token="test_nb_token",
-            nb_ns_id=1,
-            pdns_url="https://pdns.example.com",
-            pdns_token="test_pdns_token",
-            mqtt_enabled=True,
-            mqtt_broker_url="mqtt://localhost:1883",
-            mqtt_client_id="integration-test-client",
-            mqtt_topic_prefix="integration/test",
-            mqtt_qos=1,
-        )
-
-        with patch("apscheduler.schedulers.background.BackgroundScheduler"):
-            with patch("netbox_pdns.MQTTService") as mqtt_mock:
-                mqtt_instance = Mock()
-                mqtt_mock.return_value = mqtt_instance
-
-                # Mock all methods to prevent real network activity
-                from unittest.mock import AsyncMock
-
-                mqtt_instance.wait_for_connection = AsyncMock(return_value=False)
-                mqtt_instance.start = Mock(return_value=None)  # Don't actually call start
-                mqtt_instance.stop = Mock(return_value=None)
-                mqtt_instance.get_status = Mock(
-                    return_value={
-                        "enabled": True,
-                        "connected": False,
-                        "broker_url": "mqtt://localhost:1883",
-                        "client_id": "integration-test-client",
-                        "topic_prefix": "integration/test",
-                        "qos": 1,
-                    }
-                )
-
-                # The key test: app should start successfully even if MQTT is disabled/mocked
-                with TestClient(create_app()) as client:
-                    # Test that core endpoints work
-                    response = client.get("/health")
-                    assert response.status_code == 200
-                    assert response.json() == {"status": "Healthy"}
-
-                    # MQTT status endpoint should still work
-                    response = client.get("/mqtt/status")
-                    assert response.status_code == 200
-
-                # MQTT service creation should have been attempted
-                mqtt_mock.assert_called_once()
-
-    def test_api_endpoints_work_regardless_of_mqtt_config(self, mock_netbox_api: Mock) -> None:
-        """Test that core API endpoints work regardless of MQTT configuration."""
-        # Test with MQTT disabled
-        mock_netbox_api.config = Settings(
-            api_key="test_api_key",
-            nb_url="https://netbox.example.com",
-            nb_token="test_nb_token",
-            nb_ns_id=1,
-            pdns_url="https://pdns.example.com",
-            pdns_token="test_pdns_token",
-            mqtt_enabled=False,
-        )
-
-        with patch("apscheduler.schedulers.background.BackgroundScheduler"):
-            with patch("netbox_pdns.mqtt_service.MQTTService") as mqtt_mock:
-                mqtt_instance = Mock()
-                mqtt_mock.return_value = mqtt_instance
-
-                app = create_app()
-                client = TestClient(app)
-
-                # Test core endpoints
-                response = client.get("/health")
-                assert response.status_code == 200
-
-                # Test MQTT status endpoint works even with MQTT disabled
-                response = client.get("/mqtt/status")
-                assert response.status_code == 200
+        # The key test: app should start successfully even if MQTT is mocked
+        with client_mqtt_enabled as client:
+            # Test that core endpoints work
+            response = client.get("/health")
+            assert response.status_code == 200
+            assert response.json() == {"status": "Healthy"}
+
+            # MQTT status endpoint should still work
+            response = client.get("/mqtt/status")
+            assert response.status_code == 200
+
+        # The MQTT service should have been started and stopped with the app
+        mqtt_instance.start.assert_called_once()
+        mqtt_instance.shutdown.assert_awaited_once()
 
     def test_configuration_validation_integration(self) -> None:
         """Test that invalid configurations are caught during app creation."""
         # This is more of a unit test but validates end-to-end integration
 
-        with patch("netbox_pdns.NetboxPDNS") as mock_netbox:
-            # Mock NetboxPDNS to use invalid config
-            mock_instance = Mock()
-            mock_netbox.return_value = mock_instance
-
-            # Test invalid MQTT broker URL
-            # Should raise ValidationError during Settings creation
-            with pytest.raises(Exception):  # noqa: B017
-                Settings(
-                    api_key="test_api_key",
-                    nb_url="https://netbox.example.com",
-                    nb_token="test_nb_token",
-                    nb_ns_id=1,
-                    pdns_url="https://pdns.example.com",
-                    pdns_token="test_pdns_token",
-                    mqtt_enabled=True,
-                    mqtt_broker_url="invalid-url-format",  # This should fail validation
-                )
-
-    def test_mqtt_status_endpoint_authentication(self) -> None:
-        """Test that MQTT status endpoint doesn't require API key (monitoring endpoint)."""
-        with patch("netbox_pdns.NetboxPDNS") as mock_netbox:
-            mock_instance = Mock()
-            mock_netbox.return_value = mock_instance
-            mock_instance.config = Settings(
-                api_key="secret_key",
+        # Test invalid MQTT broker URL
+        # Should raise ValidationError during Settings creation
+        with pytest.raises(Exception):  # noqa: B017
+            Settings(
+                api_key="test_api_key",
                 nb_url="https://netbox.example.com",
                 nb_token="test_nb_token",
                 nb_ns_id=1,
                 pdns_url="https://pdns.example.com",
                 pdns_token="test_pdns_token",
-                mqtt_enabled=False,
+                mqtt_enabled=True,
+                mqtt_broker_url="invalid-url-format",  # This should fail validation
             )
 
-            with patch("apscheduler.schedulers.background.BackgroundScheduler"):
-                with patch("netbox_pdns.mqtt_service.MQTTService") as mqtt_mock:
-                    mqtt_instance = Mock()
-                    mqtt_mock.return_value = mqtt_instance
-
-                    app = create_app()
-                    client = TestClient(app)
-
-                    # MQTT status should work without API key (monitoring endpoint)
-                    response = client.get("/mqtt/status")
-                    assert response.status_code == 200
+    def test_mqtt_status_endpoint_authentication(self, client_mqtt_disabled: TestClient) -> None:
+        """Test that MQTT status endpoint doesn't require API key (monitoring endpoint)."""
+        # MQTT status should work without API key (monitoring endpoint)
+        response = client_mqtt_disabled.get("/mqtt/status")
+        assert response.status_code == 200
 
-                    # But other endpoints should still require API key
-                    response = client.get("/sync")
-                    assert response.status_code == 401  # Unauthorized
+        # But other endpoints should still require API key
+        response = client_mqtt_disabled.get("/sync")
+        assert response.status_code == 401  # Unauthorized
@@ -1,46 +1,103 @@
+import copy
+import itertools
 import logging
 import sys
 from collections.abc import Generator
-from typing import Any
-from unittest.mock import MagicMock, Mock, call, patch
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Any, cast
+from unittest.mock import DEFAULT, Mock, call, patch
 
 import dns.name
+import pdns_auth_client
 import pytest
 
-from netbox_pdns.api import NetboxPDNS
-from netbox_pdns.exceptions import PowerDNSAPIError, ZoneSyncError
+from netbox_pdns.api import NetboxPDNS, is_transient_error
+from netbox_pdns.exceptions import PowerDNSAPIError, ZoneNotFoundError, ZoneSyncError
 from netbox_pdns.models import Settings
 
+# Zone names shared by the tests, parsed once rather than in every test body
+EXAMPLE_COM_NAME = dns.name.from_text("example.com")
+NONEXISTENT_COM_NAME = dns.name.from_text("non-existent.com")
+TO_BE_DELETED_NAME = dns.name.from_text("to-be-deleted.com")
 
-# Create fixtures to mock external dependencies
-@pytest.fixture
-def mock_settings() -> Settings:
-    return Settings(
-        api_key="test_api_key",
-        nb_url="https://netbox.example.com",
-        nb_token="netbox_token",
-        nb_ns_id=1,
-        pdns_url="https://pdns.example.com",
-        pdns_token="pdns_token",
-    )
 
+@dataclass(slots=True, frozen=True)
+class NbRecord:
+    """Netbox DNS record stand-in, far cheaper to build than a Mock"""
 
-@pytest.fixture
+    fqdn: str
+    type: str
+    value: str
+    ttl: int | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class NbZone:
+    """Netbox zone stand-in, far cheaper to build than a Mock"""
+
+    name: str
+    soa_serial: int = 0
+    id: int = 1
+    default_ttl: int = 3600
+
+
+@dataclass(slots=True, frozen=True)
+class PdnsRRSet:
+    """PowerDNS RRSet stand-in, sync_zone only reads the name and type"""
+
+    name: str
+    type: str
+
+
+@dataclass(slots=True, frozen=True)
+class PdnsZone:
+    """PowerDNS zone stand-in, rrsets is None as for zones returned by list_zones"""
+
+    name: str
+    id: str = ""
+    serial: int = 0
+    rrsets: list[PdnsRRSet] | None = None
+
+
+# Netbox records for get_nb_rrsets, one or more per record type, shared read-only
+SAMPLE_RECORDS = (
+    # Multiple A records for same FQDN
+    NbRecord(fqdn="www.example.com", type="A", value="192.0.2.1"),
+    NbRecord(fqdn="www.example.com", type="A", value="192.0.2.2"),
+    # A single AAAA record
+    NbRecord(fqdn="www.example.com", type="AAAA", value="2001:db8::1"),
+    # MX record
+    NbRecord(fqdn="example.com", type="MX", value="10 mail.example.com"),
+    # TXT record
+    NbRecord(fqdn="example.com", type="TXT", value="v=spf1 -all"),
+    # CNAME record
+    NbRecord(fqdn="alias.example.com", type="CNAME", value="www.example.com"),
+    # SRV record
+    NbRecord(fqdn="_sip._tcp.example.com", type="SRV", value="0 5 5060 sip.example.com"),
+)
+
+
+# Create fixtures to mock external dependencies. Building them is the bulk of the setup
+# cost, so they are created once per module and their call state reset before each test.
+@pytest.fixture(scope="session")
+def mock_settings(prebuilt_settings: Settings) -> Settings:
+    return prebuilt_settings
+
+
+@pytest.fixture(scope="module")
 def mock_pynetbox() -> Generator[Mock, None, None]:
     with patch("pynetbox.api") as mock_api:
         mock_nb = Mock()
         mock_api.return_value = mock_nb
 
-        # Mock the plugins structure
-        mock_nb.plugins = Mock()
-        mock_nb.plugins.netbox_dns = Mock()
-        mock_nb.plugins.netbox_dns.zones = Mock()
-        mock_nb.plugins.netbox_dns.records = Mock()
+        # Mock the plugins structure, only the endpoints the code calls need to be mocks
+        mock_nb.plugins = SimpleNamespace(netbox_dns=SimpleNamespace(zones=Mock(), records=Mock()))
 
         yield mock_nb
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_pdns_client() -> Generator[Mock, None, None]:
     with patch("pdns_auth_client.ApiClient") as mock_api_client:
         mock_client = Mock()
@@ -48,7 +105,7 @@ def mock_pdns_client() -> Generator[Mock, None, None]:
         yield mock_client
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_zones_api() -> Generator[Mock, None, None]:
     with patch("pdns_auth_client.ZonesApi") as mock_zones_api:
         mock_api = Mock()
@@ -56,18 +113,44 @@ def mock_zones_api() -> Generator[Mock, None, None]:
         yield mock_api
 
 
-@pytest.fixture
-def netbox_pdns_instance(
+@pytest.fixture(scope="module")
+def cached_netbox_pdns(
     mock_settings: Settings,
     mock_pynetbox: Mock,
     mock_pdns_client: Mock,
     mock_zones_api: Mock,
 ) -> NetboxPDNS:
-    with patch("netbox_pdns.api.Settings", return_value=mock_settings):
-        with patch("netbox_pdns.api.NetboxPDNS.setup_logging") as mock_logging:
-            mock_logging.return_value = Mock()
-            instance = NetboxPDNS()
-            return instance
+    # Nothing asserts on these stand-ins, so plain attribute swaps are enough
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("netbox_pdns.api.Settings", lambda: mock_settings)
+        mp.setattr(NetboxPDNS, "setup_logging", lambda self: Mock())
+        return NetboxPDNS()
+
+
+@pytest.fixture(autouse=True)
+def _reset_api_mocks(
+    mock_pynetbox: Mock,
+    mock_pdns_client: Mock,
+    mock_zones_api: Mock,
+    cached_netbox_pdns: NetboxPDNS,
+) -> None:
+    """Clear calls and configured results left on the shared mocks by the previous test"""
+    netbox_dns = mock_pynetbox.plugins.netbox_dns
+    for mock in (
+        mock_pynetbox,
+        netbox_dns.zones,
+        netbox_dns.records,
+        mock_pdns_client,
+        mock_zones_api,
+        cached_netbox_pdns.logger,
+    ):
+        cast(Mock, mock).reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture
+def netbox_pdns_instance(cached_netbox_pdns: NetboxPDNS) -> NetboxPDNS:
+    # A shallow copy, so attributes replaced by a test don't leak into the next one
+    return copy.copy(cached_netbox_pdns)
 
 
 def test_init(netbox_pdns_instance: Mock) -> None:
@@ -80,115 +163,151 @@ def test_init(netbox_pdns_instance: Mock) -> None:
     assert netbox_pdns_instance.logger is not None
 
 
+def test_init_with_settings(
+    mock_settings: Settings,
+    mock_pynetbox: Mock,
+    mock_pdns_client: Mock,
+    mock_zones_api: Mock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test NetboxPDNS uses provided settings instead of loading them again"""
+    monkeypatch.setattr(NetboxPDNS, "setup_logging", lambda self: Mock())
+    with patch("netbox_pdns.api.Settings") as mock_settings_class:
+        instance = NetboxPDNS(mock_settings)
+
+    assert instance.config is mock_settings
+    mock_settings_class.assert_not_called()
+
+
 def test_setup_logging(netbox_pdns_instance: Mock) -> None:
     """Test setup_logging method properly configures logging"""
     # Reset the logger to ensure we test the actual setup
-    with patch("logging.getLogger") as mock_get_logger:
-        with patch("logging.StreamHandler") as mock_stream_handler:
-            with patch("logging.Formatter") as mock_formatter:
-                # Setup mock objects
-                mock_logger = Mock()
-                mock_get_logger.return_value = mock_logger
+    with patch.multiple(
+        "logging", getLogger=DEFAULT, StreamHandler=DEFAULT, Formatter=DEFAULT
+    ) as mocks:
+        mock_get_logger = mocks["getLogger"]
+        mock_stream_handler = mocks["StreamHandler"]
+        mock_formatter = mocks["Formatter"]
+
+        # Setup mock objects
+        mock_logger = Mock()
+        mock_get_logger.return_value = mock_logger
 
-                mock_handler = Mock()
-                mock_stream_handler.return_value = mock_handler
+        mock_handler = Mock()
+        mock_stream_handler.return_value = mock_handler
 
-                mock_format = Mock()
-                mock_formatter.return_value = mock_format
+        mock_format = Mock()
+        mock_formatter.return_value = mock_format
 
-                # Test with different log levels
-                test_config = Mock(log_level="INFO")
+        # Test with different log levels
+        test_config = Mock(log_level="INFO")
 
-                # Replace instance config with our test config
-                original_config = netbox_pdns_instance.config
-                netbox_pdns_instance.config = test_config
+        # Replace instance config with our test config
+        original_config = netbox_pdns_instance.config
+        netbox_pdns_instance.config = test_config
 
-                # Call setup_logging
-                result = netbox_pdns_instance.setup_logging()
+        # Call setup_logging
+        result = netbox_pdns_instance.setup_logging()
 
-                # Restore original config
-                netbox_pdns_instance.config = original_config
+        # Restore original config
+        netbox_pdns_instance.config = original_config
 
-                # Verify logger was created with correct name
-                mock_get_logger.assert_called_once_with("netbox_pdns")
+        # Verify logger was created with correct name
+        mock_get_logger.assert_called_once_with("netbox_pdns")
 
-                # Verify logger level was set
-                mock_logger.setLevel.assert_called_once_with(logging.INFO)
+        # Verify logger level was set
+        mock_logger.setLevel.assert_called_once_with(logging.INFO)
 
-                # Verify handler was created and configured
-                mock_stream_handler.assert_called_once_with(sys.stdout)
-                mock_handler.setLevel.assert_called_once_with(logging.INFO)
+        # Verify handler was created and configured
+        mock_stream_handler.assert_called_once_with(sys.stdout)
+        mock_handler.setLevel.assert_called_once_with(logging.INFO)
 
-                # Verify formatter was created with correct format
-                mock_formatter.assert_called_once()
-                mock_handler.setFormatter.assert_called_once_with(mock_format)
+        # Verify formatter was created with correct format
+        mock_formatter.assert_called_once()
+        mock_handler.setFormatter.assert_called_once_with(mock_format)
 
-                # Verify handler was added to logger
-                mock_logger.addHandler.assert_called_once_with(mock_handler)
+        # Verify handler was added to logger
+        mock_logger.addHandler.assert_called_once_with(mock_handler)
 
-                # Verify result
-                assert result == mock_logger
+        # Verify result
+        assert result == mock_logger
 
 
 def test_setup_netbox(netbox_pdns_instance: Mock) -> None:
     """Test setup_netbox method properly configures and returns pynetbox API client"""
     with patch("pynetbox.api") as mock_api:
-        mock_nb = Mock()
-        mock_api.return_value = mock_nb
+        with patch("netbox_pdns.api.HTTPAdapter") as mock_adapter_class:
+            mock_nb = Mock()
+            mock_api.return_value = mock_nb
 
-        # Reset existing netbox client to ensure we test the method
-        original_nb = netbox_pdns_instance.nb
-        netbox_pdns_instance.nb = None
+            # Reset existing netbox client to ensure we test the method
+            original_nb = netbox_pdns_instance.nb
+            netbox_pdns_instance.nb = None
 
-        # Call setup_netbox
-        result = netbox_pdns_instance.setup_netbox()
+            # Call setup_netbox
+            result = netbox_pdns_instance.setup_netbox()
 
-        # Restore original nb
-        netbox_pdns_instance.nb = original_nb
+            # Restore original nb
+            netbox_pdns_instance.nb = original_nb
 
-        # Verify pynetbox.api was called with correct params
-        mock_api.assert_called_once_with(
-            netbox_pdns_instance.config.nb_url,
-            token=netbox_pdns_instance.config.nb_token,
-        )
+            # Verify pynetbox.api was called with correct params
+            mock_api.assert_called_once_with(
+                netbox_pdns_instance.config.nb_url,
+                token=netbox_pdns_instance.config.nb_token,
+            )
 
-        # Verify result
-        assert result == mock_nb
+            # Verify a sized keep-alive pool without retries is mounted for both schemes
+            mock_adapter_class.assert_called_once_with(
+                pool_connections=16, pool_maxsize=16, max_retries=0
+            )
+            mock_nb.http_session.mount.assert_has_calls(
+                [
+                    call("http://", mock_adapter_class.return_value),
+                    call("https://", mock_adapter_class.return_value),
+                ]
+            )
+
+            # Verify result
+            assert result == mock_nb
 
 
 def test_setup_pdns(netbox_pdns_instance: Mock) -> None:
     """Test setup_pdns method properly configures and returns PowerDNS API client"""
-    with patch("pdns_auth_client.Configuration") as mock_config_class:
-        with patch("pdns_auth_client.ApiClient") as mock_api_client_class:
-            # Setup mocks
-            mock_config = Mock()
-            mock_config.api_key = {}
-            mock_config_class.return_value = mock_config
+    with patch.multiple("pdns_auth_client", Configuration=DEFAULT, ApiClient=DEFAULT) as mocks:
+        mock_config_class = mocks["Configuration"]
+        mock_api_client_class = mocks["ApiClient"]
 
-            mock_api_client = Mock()
-            mock_api_client_class.return_value = mock_api_client
+        # The configuration is only written to and handed on, a plain namespace will do
+        mock_config = SimpleNamespace(api_key={})
+        mock_config_class.return_value = mock_config
 
-            # Reset existing pdns client to ensure we test the method
-            original_pdns = netbox_pdns_instance.pdns
-            netbox_pdns_instance.pdns = None
+        mock_api_client = Mock()
+        mock_api_client_class.return_value = mock_api_client
 
-            # Call setup_pdns
-            result = netbox_pdns_instance.setup_pdns()
+        # Reset existing pdns client to ensure we test the method
+        original_pdns = netbox_pdns_instance.pdns
+        netbox_pdns_instance.pdns = None
 
-            # Restore original pdns
-            netbox_pdns_instance.pdns = original_pdns
+        # Call setup_pdns
+        result = netbox_pdns_instance.setup_pdns()
 
-            # Verify Configuration was created with correct params
-            mock_config_class.assert_called_once_with(host=netbox_pdns_instance.config.pdns_url)
+        # Restore original pdns
+        netbox_pdns_instance.pdns = original_pdns
 
-            # Verify API key was set
-            assert mock_config.api_key["APIKeyHeader"] == netbox_pdns_instance.config.pdns_token
+        # Verify Configuration was created with correct params
+        mock_config_class.assert_called_once_with(host=netbox_pdns_instance.config.pdns_url)
 
-            # Verify ApiClient was created with config
-            mock_api_client_class.assert_called_once_with(mock_config)
+        # Verify API key was set
+        assert mock_config.api_key["APIKeyHeader"] == netbox_pdns_instance.config.pdns_token
 
-            # Verify result
-            assert result == mock_api_client
+        # Verify the connection pool is sized for concurrent zone syncs
+        assert mock_config.connection_pool_maxsize == 16
+
+        # Verify ApiClient was created with config
+        mock_api_client_class.assert_called_once_with(mock_config)
+
+        # Verify result
+        assert result == mock_api_client
 
 
 def test_get_nb_zone(netbox_pdns_instance: Mock) -> None:
@@ -215,32 +334,52 @@ def test_get_pdns_zone(netbox_pdns_instance: Mock) -> None:
     assert zone == mock_zone
 
 
+def test_get_pdns_zone_not_found_not_retried(netbox_pdns_instance: Mock) -> None:
+    """Test a missing PowerDNS zone is reported without retrying"""
+    netbox_pdns_instance.zones_api.list_zone.return_value = None
+
+    with patch("netbox_pdns.api.time.sleep") as mock_sleep:
+        with pytest.raises(ZoneNotFoundError):
+            netbox_pdns_instance.get_pdns_zone("example.com")
+
+    netbox_pdns_instance.zones_api.list_zone.assert_called_once()
+    mock_sleep.assert_not_called()
+
+
+def test_is_transient_error() -> None:
+    """Test only errors that may succeed on a later attempt are considered transient"""
+    assert is_transient_error(Exception("connection reset"))
+    assert is_transient_error(pdns_auth_client.ApiException(status=500, reason="Error"))
+    assert is_transient_error(pdns_auth_client.ApiException(status=429, reason="Busy"))
+    assert not is_transient_error(pdns_auth_client.ApiException(status=409, reason="Conflict"))
+    assert not is_transient_error(pdns_auth_client.ApiException(status=404, reason="Missing"))
+    assert not is_transient_error(ZoneNotFoundError("example.com"))
+
+
+def test_retry_with_backoff_non_retryable(netbox_pdns_instance: Mock) -> None:
+    """Test retry_with_backoff raises immediately when retry_if rejects the error"""
+    func = Mock(side_effect=ValueError("bad request"), __name__="func")
+
+    with patch("netbox_pdns.api.time.sleep") as mock_sleep:
+        with pytest.raises(ValueError, match="bad request"):
+            netbox_pdns_instance.retry_with_backoff(func, retry_if=lambda e: False)
+
+    func.assert_called_once()
+    mock_sleep.assert_not_called()
+
+
 def test_get_nb_rrsets(netbox_pdns_instance: Mock) -> None:
     """Comprehensive test for get_nb_rrsets method"""
-    # Create various types of mock records
-    mock_records = [
-        # Multiple A records for same FQDN
-        Mock(fqdn="www.example.com", type="A", value="192.0.2.1"),
-        Mock(fqdn="www.example.com", type="A", value="192.0.2.2"),
-        # A single AAAA record
-        Mock(fqdn="www.example.com", type="AAAA", value="2001:db8::1"),
-        # MX record
-        Mock(fqdn="example.com", type="MX", value="10 mail.example.com"),
-        # TXT record
-        Mock(fqdn="example.com", type="TXT", value="v=spf1 -all"),
-        # CNAME record
-        Mock(fqdn="alias.example.com", type="CNAME", value="www.example.com"),
-        # SRV record
-        Mock(fqdn="_sip._tcp.example.com", type="SRV", value="0 5 5060 sip.example.com"),
-    ]
 
-    netbox_pdns_instance.nb.plugins.netbox_dns.records.filter.return_value = mock_records
+    netbox_pdns_instance.nb.plugins.netbox_dns.records.filter.return_value = SAMPLE_RECORDS
 
     # Call get_nb_rrsets
     rrsets = netbox_pdns_instance.get_nb_rrsets(1)
 
     # Verify filter was called with correct zone_id
-    netbox_pdns_instance.nb.plugins.netbox_dns.records.filter.assert_called_once_with(zone_id=1)
+    netbox_pdns_instance.nb.plugins.netbox_dns.records.filter.assert_called_once_with(
+        zone_id=1, limit=0
+    )
 
     # Verify rrsets dictionary structure
     assert len(rrsets) == 6  # 6 unique FQDN+type combinations
@@ -254,9 +393,9 @@ def test_get_nb_rrsets(netbox_pdns_instance: Mock) -> None:
     assert len(rrsets[("_sip._tcp.example.com", "SRV")]) == 1
 
     # Check actual record objects in the sets
-    assert mock_records[0] in rrsets[("www.example.com", "A")]
-    assert mock_records[1] in rrsets[("www.example.com", "A")]
-    assert mock_records[2] in rrsets[("www.example.com", "AAAA")]
+    assert SAMPLE_RECORDS[0] in rrsets[("www.example.com", "A")]
+    assert SAMPLE_RECORDS[1] in rrsets[("www.example.com", "A")]
+    assert SAMPLE_RECORDS[2] in rrsets[("www.example.com", "AAAA")]
 
 
 def test_get_nb_rrsets_empty(netbox_pdns_instance: Mock) -> None:
@@ -267,7 +406,9 @@ def test_get_nb_rrsets_empty(netbox_pdns_instance: Mock) -> None:
     rrsets = netbox_pdns_instance.get_nb_rrsets(1)
 
     # Verify filter was called
-    netbox_pdns_instance.nb.plugins.netbox_dns.records.filter.assert_called_once_with(zone_id=1)
+    netbox_pdns_instance.nb.plugins.netbox_dns.records.filter.assert_called_once_with(
+        zone_id=1, limit=0
+    )
 
     # Verify empty dictionary returned
     assert len(rrsets) == 0
@@ -277,12 +418,12 @@ def test_get_nb_rrsets_empty(netbox_pdns_instance: Mock) -> None:
 def test_mk_pdns_rrsets(netbox_pdns_instance: Mock) -> None:
     """Test the _mk_pdns_rrsets method that creates PowerDNS RRSet objects"""
     # Create mock zone with default TTL
-    mock_nb_zone = Mock(default_ttl=3600)
+    mock_nb_zone = NbZone("example.com")
 
     # Create mock Netbox records with different TTL scenarios
-    mock_record1 = Mock(ttl=7200, value="192.0.2.1")
-    mock_record2 = Mock(ttl=None, value="192.0.2.2")  # Test None TTL (should use default)
-    mock_record3 = Mock(ttl=900, value="10 mail.example.com")
+    mock_record1 = NbRecord("www.example.com", "A", "192.0.2.1", ttl=7200)
+    mock_record2 = NbRecord("api.example.com", "A", "192.0.2.2")  # None TTL uses the default
+    mock_record3 = NbRecord("mail.example.com", "MX", "10 mail.example.com", ttl=900)
 
     # Create test data
     nb_rrsets = {
@@ -298,87 +439,83 @@ def test_mk_pdns_rrsets(netbox_pdns_instance: Mock) -> None:
     }
 
     # Use real RRSet and Record classes with mocked pdns_auth_client module
-    with patch("pdns_auth_client.RRSet") as mock_rrset_class:
-        with patch("pdns_auth_client.Record") as mock_record_class:
-            # Call the method
-            result = netbox_pdns_instance._mk_pdns_rrsets(
-                mock_nb_zone, nb_rrsets, nb_rrsets_deleted, nb_rrsets_replace
-            )
-
-            # Verify the results
-            assert len(result) == 5  # 2 deletes + 3 replaces
-
-            # Validate DELETE operations were called with correct params
-            delete_calls = [
-                call(
-                    changetype="DELETE",
-                    name="old.example.com",
-                    type="CNAME",
-                    records=[],
-                ),
-                call(
-                    changetype="DELETE",
-                    name="unused.example.com",
-                    type="TXT",
-                    records=[],
-                ),
-            ]
+    with patch.multiple("pdns_auth_client", RRSet=DEFAULT, Record=DEFAULT) as mocks:
+        mock_rrset_class = mocks["RRSet"]
+        mock_record_class = mocks["Record"]
+        # Call the method
+        result = netbox_pdns_instance._mk_pdns_rrsets(
+            mock_nb_zone, nb_rrsets, nb_rrsets_deleted, nb_rrsets_replace
+        )
 
-            # Check that the appropriate RRSet calls were made for DELETE operations
-            for delete_call in delete_calls:
-                assert delete_call in mock_rrset_class.call_args_list
-
-            # Verify REPLACE operations - extract calls for each record type
-            www_call = call(
-                changetype="REPLACE",
-                name="www.example.com",
-                type="A",
-                ttl=7200,  # Record's TTL
-                records=[mock_record_class.return_value],
-            )
+        # Verify the results
+        assert len(result) == 5  # 2 deletes + 3 replaces
+
+        # Validate DELETE operations were called with correct params
+        delete_calls = [
+            call(
+                changetype="DELETE",
+                name="old.example.com",
+                type="CNAME",
+                records=[],
+            ),
+            call(
+                changetype="DELETE",
+                name="unused.example.com",
+                type="TXT",
+                records=[],
+            ),
+        ]
+
+        # Check that the appropriate RRSet calls were made for DELETE operations
+        mock_rrset_class.assert_has_calls(delete_calls, any_order=True)
+
+        # Verify REPLACE operations - extract calls for each record type
+        www_call = call(
+            changetype="REPLACE",
+            name="www.example.com",
+            type="A",
+            ttl=7200,  # Record's TTL
+            records=[mock_record_class.return_value],
+        )
 
-            api_call = call(
-                changetype="REPLACE",
-                name="api.example.com",
-                type="A",
-                ttl=3600,  # Zone's default TTL
-                records=[mock_record_class.return_value],
-            )
+        api_call = call(
+            changetype="REPLACE",
+            name="api.example.com",
+            type="A",
+            ttl=3600,  # Zone's default TTL
+            records=[mock_record_class.return_value],
+        )
 
-            mail_call = call(
-                changetype="REPLACE",
-                name="mail.example.com",
-                type="MX",
-                ttl=900,  # Record's TTL
-                records=[mock_record_class.return_value],
-            )
+        mail_call = call(
+            changetype="REPLACE",
+            name="mail.example.com",
+            type="MX",
+            ttl=900,  # Record's TTL
+            records=[mock_record_class.return_value],
+        )
 
-            # Verify all expected calls were made
-            assert www_call in mock_rrset_class.call_args_list
-            assert api_call in mock_rrset_class.call_args_list
-            assert mail_call in mock_rrset_class.call_args_list
+        # Verify all expected calls were made
+        mock_rrset_class.assert_has_calls([www_call, api_call, mail_call], any_order=True)
 
-            # Verify Record constructor calls for content values
-            record_calls = [
-                call(content="192.0.2.1"),
-                call(content="192.0.2.2"),
-                call(content="10 mail.example.com"),
-            ]
+        # Verify Record constructor calls for content values
+        record_calls = [
+            call(content="192.0.2.1"),
+            call(content="192.0.2.2"),
+            call(content="10 mail.example.com"),
+        ]
 
-            for record_call in record_calls:
-                assert record_call in mock_record_class.call_args_list
+        mock_record_class.assert_has_calls(record_calls, any_order=True)
 
-            # Verify logging calls - should log deletes and replaces
-            log_calls = [
-                call(f"Deleting RRSet {('old.example.com', 'CNAME')}"),
-                call(f"Deleting RRSet {('unused.example.com', 'TXT')}"),
-                call(f"Replacing RRSet {('www.example.com', 'A')}"),
-                call(f"Replacing RRSet {('api.example.com', 'A')}"),
-                call(f"Replacing RRSet {('mail.example.com', 'MX')}"),
-            ]
+        # Verify logging calls - should log deletes and replaces
+        log_calls = [
+            call(f"Deleting RRSet {('old.example.com', 'CNAME')}"),
+            call(f"Deleting RRSet {('unused.example.com', 'TXT')}"),
+            call(f"Replacing RRSet {('www.example.com', 'A')}"),
+            call(f"Replacing RRSet {('api.example.com', 'A')}"),
+            call(f"Replacing RRSet {('mail.example.com', 'MX')}"),
+        ]
 
-            for log_call in log_calls:
-                assert log_call in netbox_pdns_instance.logger.info.call_args_list
+        netbox_pdns_instance.logger.info.assert_has_calls(log_calls, any_order=True)
 
 
 def test_mk_pdns_rrsets_empty(netbox_pdns_instance: Mock) -> None:
@@ -387,7 +524,7 @@ def test_mk_pdns_rrsets_empty(netbox_pdns_instance: Mock) -> None:
     empty_nb_rrsets: dict[Any, Any] = {}
 
     # Create mock Netbox zone with default TTL
-    mock_nb_zone = Mock(default_ttl=3600)
+    mock_nb_zone = NbZone("example.com")
 
     result = netbox_pdns_instance._mk_pdns_rrsets(mock_nb_zone, empty_nb_rrsets, None, None)
 
@@ -395,159 +532,149 @@ def test_mk_pdns_rrsets_empty(netbox_pdns_instance: Mock) -> None:
     assert isinstance(result, list)
 
 
-def test_create_zone(netbox_pdns_instance: Mock) -> None:
+@pytest.fixture
+def zone_builders(netbox_pdns_instance: NetboxPDNS) -> Generator[SimpleNamespace, None, None]:
+    """Patch the helpers create_zone uses to assemble the PowerDNS zone"""
+    with (
+        patch.object(netbox_pdns_instance, "get_nb_rrsets") as get_nb_rrsets,
+        patch.object(netbox_pdns_instance, "_mk_pdns_rrsets") as mk_pdns_rrsets,
+        patch("pdns_auth_client.Zone") as zone_class,
+    ):
+        yield SimpleNamespace(
+            get_nb_rrsets=get_nb_rrsets, mk_pdns_rrsets=mk_pdns_rrsets, zone_class=zone_class
+        )
+
+
+def test_create_zone(netbox_pdns_instance: Mock, zone_builders: SimpleNamespace) -> None:
     """Test creating a zone in PowerDNS"""
-    # Create mock zone
-    mock_nb_zone = MagicMock()
-    mock_nb_zone.id = 1
-    mock_nb_zone.name = "example.com"
-    mock_nb_zone.soa_serial = 12345
-    mock_nb_zone.default_ttl = 3600
+    mock_nb_zone = NbZone("example.com", soa_serial=12345)
 
     # Mock get_nb_rrsets to return some records
-    with patch.object(netbox_pdns_instance, "get_nb_rrsets") as mock_get_nb_rrsets:
-        mock_get_nb_rrsets.return_value = {
-            ("www.example.com", "A"): [
-                Mock(fqdn="www.example.com", type="A", ttl=3600, value="192.0.2.1")
-            ],
-            ("mail.example.com", "MX"): [
-                Mock(
-                    fqdn="mail.example.com",
-                    type="MX",
-                    ttl=None,
-                    value="10 mail.example.com",
-                )
-            ],
-        }
+    zone_builders.get_nb_rrsets.return_value = {
+        ("www.example.com", "A"): [
+            NbRecord(fqdn="www.example.com", type="A", ttl=3600, value="192.0.2.1")
+        ],
+        ("mail.example.com", "MX"): [
+            NbRecord(
+                fqdn="mail.example.com",
+                type="MX",
+                ttl=None,
+                value="10 mail.example.com",
+            )
+        ],
+    }
 
-        # Mock _mk_pdns_rrsets
-        with patch.object(netbox_pdns_instance, "_mk_pdns_rrsets") as mock_mk_rrsets:
-            mock_rrsets = [
-                Mock(name="www.example.com", type="A"),
-                Mock(name="mail.example.com", type="MX"),
-            ]
-            mock_mk_rrsets.return_value = mock_rrsets
-
-            # Mock pdns_auth_client Zone class
-            with patch("pdns_auth_client.Zone") as mock_zone_class:
-                mock_zone = Mock()
-                mock_zone_class.return_value = mock_zone
-
-                # Call create_zone
-                netbox_pdns_instance.create_zone(mock_nb_zone)
-
-                # Verify the calls
-                mock_get_nb_rrsets.assert_called_once_with(1)
-                mock_mk_rrsets.assert_called_once_with(
-                    mock_nb_zone,
-                    mock_get_nb_rrsets.return_value,
-                    nb_rrsets_replace=set(mock_get_nb_rrsets.return_value.keys()),
-                )
+    # Mock _mk_pdns_rrsets
+    mock_rrsets = [
+        Mock(name="www.example.com", type="A"),
+        Mock(name="mail.example.com", type="MX"),
+    ]
+    zone_builders.mk_pdns_rrsets.return_value = mock_rrsets
 
-                # Verify Zone creation
-                mock_zone_class.assert_called_once()
-                zone_args = mock_zone_class.call_args[1]
-                assert zone_args["name"] == dns.name.from_text("example.com").to_text()
-                assert zone_args["serial"] == 12345
-                assert zone_args["rrsets"] == mock_rrsets
-                assert zone_args["soa_edit_api"] == ""
-                assert zone_args["kind"] == "Native"
-
-                # Verify create_zone API call
-                netbox_pdns_instance.zones_api.create_zone.assert_called_once_with(
-                    netbox_pdns_instance.config.pdns_server_id, mock_zone
-                )
+    # Mock pdns_auth_client Zone class
+    mock_zone = Mock()
+    zone_builders.zone_class.return_value = mock_zone
 
-                # Verify logging
-                netbox_pdns_instance.logger.info.assert_called_with(
-                    f"Creating zone {mock_nb_zone.name}"
-                )
-                netbox_pdns_instance.logger.error.assert_not_called()
+    # Call create_zone
+    netbox_pdns_instance.create_zone(mock_nb_zone)
 
+    # Verify the calls
+    zone_builders.get_nb_rrsets.assert_called_once_with(1)
+    zone_builders.mk_pdns_rrsets.assert_called_once_with(
+        mock_nb_zone,
+        zone_builders.get_nb_rrsets.return_value,
+        nb_rrsets_replace=set(zone_builders.get_nb_rrsets.return_value.keys()),
+    )
 
-def test_create_zone_exception_handling(netbox_pdns_instance: Mock) -> None:
-    """Test that create_zone properly handles exceptions from the PowerDNS API"""
-    # Create mock zone
-    mock_nb_zone = MagicMock()
-    mock_nb_zone.id = 1
-    mock_nb_zone.name = "example.com"
-    mock_nb_zone.soa_serial = 12345
+    # Verify Zone creation
+    zone_builders.zone_class.assert_called_once()
+    zone_args = zone_builders.zone_class.call_args[1]
+    assert zone_args["name"] == EXAMPLE_COM_NAME.to_text()
+    assert zone_args["serial"] == 12345
+    assert zone_args["rrsets"] == mock_rrsets
+    assert zone_args["soa_edit_api"] == ""
+    assert zone_args["kind"] == "Native"
+
+    # Verify create_zone API call
+    netbox_pdns_instance.zones_api.create_zone.assert_called_once_with(
+        netbox_pdns_instance.config.pdns_server_id, mock_zone
+    )
 
-    # Mock get_nb_rrsets to return minimal data
-    with patch.object(netbox_pdns_instance, "get_nb_rrsets") as mock_get_nb_rrsets:
-        mock_get_nb_rrsets.return_value = {
-            ("www.example.com", "A"): [Mock(ttl=3600, value="192.0.2.1")]
-        }
+    # Verify logging
+    netbox_pdns_instance.logger.info.assert_called_with(f"Creating zone {mock_nb_zone.name}")
+    netbox_pdns_instance.logger.error.assert_not_called()
 
-        # Mock _mk_pdns_rrsets
-        with patch.object(netbox_pdns_instance, "_mk_pdns_rrsets") as mock_mk_rrsets:
-            mock_mk_rrsets.return_value = [Mock()]
 
-            # Mock Zone constructor
-            with patch("pdns_auth_client.Zone") as mock_zone_class:
-                mock_zone = Mock()
-                mock_zone_class.return_value = mock_zone
+def test_create_zone_exception_handling(
+    netbox_pdns_instance: Mock, zone_builders: SimpleNamespace
+) -> None:
+    """Test that create_zone properly handles exceptions from the PowerDNS API"""
+    zone_builders.get_nb_rrsets.return_value = {
+        ("www.example.com", "A"): [NbRecord("www.example.com", "A", "192.0.2.1", ttl=3600)]
+    }
+    zone_builders.mk_pdns_rrsets.return_value = [Mock()]
 
-                # Make create_zone raise an exception
-                test_exception = Exception("Test API exception")
-                netbox_pdns_instance.zones_api.create_zone.side_effect = test_exception
+    # Make create_zone raise an exception
+    test_exception = Exception("Test API exception")
+    netbox_pdns_instance.zones_api.create_zone.side_effect = test_exception
 
-                # Call create_zone, should raise PowerDNSAPIError
-                with pytest.raises(PowerDNSAPIError):
-                    netbox_pdns_instance.create_zone(mock_nb_zone)
+    # Call create_zone, should raise PowerDNSAPIError
+    with pytest.raises(PowerDNSAPIError):
+        netbox_pdns_instance.create_zone(NbZone("example.com", soa_serial=12345))
 
-                # Verify the exception was logged (retry mechanism logs first,
-                # then original error handling)
-                assert netbox_pdns_instance.logger.error.call_count == 2
+    # Verify the exception was logged (retry mechanism logs first,
+    # then original error handling)
+    assert netbox_pdns_instance.logger.error.call_count == 2
 
-                # Check retry mechanism error
-                retry_error = netbox_pdns_instance.logger.error.call_args_list[0][0][0]
-                assert "failed after 3 attempts" in retry_error
+    # Check retry mechanism error
+    retry_error = netbox_pdns_instance.logger.error.call_args_list[0][0][0]
+    assert "failed after 3 attempts" in retry_error
 
-                # Check original error handling
-                original_error = netbox_pdns_instance.logger.error.call_args_list[1][0][0]
-                assert "Failed to create zone example.com in PowerDNS" in original_error
-                assert "Test API exception" in original_error
+    # Check original error handling
+    original_error = netbox_pdns_instance.logger.error.call_args_list[1][0][0]
+    assert "Failed to create zone example.com in PowerDNS" in original_error
+    assert "Test API exception" in original_error
 
 
-def test_create_zone_empty_rrsets(netbox_pdns_instance: Mock) -> None:
-    """Test create_zone behavior with empty RRsets"""
-    # Create mock zone
-    mock_nb_zone = MagicMock()
-    mock_nb_zone.id = 1
-    mock_nb_zone.name = "empty.com"
-    mock_nb_zone.soa_serial = 12345
-    mock_nb_zone.default_ttl = 3600
+def test_create_zone_conflict(netbox_pdns_instance: Mock, zone_builders: SimpleNamespace) -> None:
+    """Test create_zone treats a 409 Conflict as the zone already existing"""
+    zone_builders.get_nb_rrsets.return_value = {}
+    netbox_pdns_instance.zones_api.create_zone.side_effect = pdns_auth_client.ApiException(
+        status=409, reason="Conflict"
+    )
 
-    # Mock get_nb_rrsets to return empty dict
-    with patch.object(netbox_pdns_instance, "get_nb_rrsets") as mock_get_nb_rrsets:
-        mock_get_nb_rrsets.return_value = {}
+    netbox_pdns_instance.create_zone(NbZone("example.com", soa_serial=12345))
 
-        # Mock _mk_pdns_rrsets to return empty list
-        with patch.object(netbox_pdns_instance, "_mk_pdns_rrsets") as mock_mk_rrsets:
-            mock_mk_rrsets.return_value = []
+    # Conflicts are not retried and are not reported as errors
+    netbox_pdns_instance.zones_api.create_zone.assert_called_once()
+    netbox_pdns_instance.logger.warning.assert_called_with(
+        "Zone example.com already exists in PowerDNS, skipping creation"
+    )
+    netbox_pdns_instance.logger.error.assert_not_called()
 
-            # Mock Zone constructor
-            with patch("pdns_auth_client.Zone") as mock_zone_class:
-                mock_zone = Mock()
-                mock_zone_class.return_value = mock_zone
 
-                # Call create_zone
-                netbox_pdns_instance.create_zone(mock_nb_zone)
+def test_create_zone_empty_rrsets(
+    netbox_pdns_instance: Mock, zone_builders: SimpleNamespace
+) -> None:
+    """Test create_zone behavior with empty RRsets"""
+    zone_builders.get_nb_rrsets.return_value = {}
+    zone_builders.mk_pdns_rrsets.return_value = []
+
+    # Call create_zone
+    netbox_pdns_instance.create_zone(NbZone("empty.com", soa_serial=12345))
 
-                # Verify Zone creation with empty RRsets
-                mock_zone_class.assert_called_once()
-                zone_args = mock_zone_class.call_args[1]
-                assert zone_args["rrsets"] == []
+    # Verify Zone creation with empty RRsets
+    zone_builders.zone_class.assert_called_once()
+    zone_args = zone_builders.zone_class.call_args[1]
+    assert zone_args["rrsets"] == []
 
-                # Verify create_zone API call still happens
-                netbox_pdns_instance.zones_api.create_zone.assert_called_once()
+    # Verify create_zone API call still happens
+    netbox_pdns_instance.zones_api.create_zone.assert_called_once()
 
 
 def test_delete_zone(netbox_pdns_instance: Mock) -> None:
     """Test deleting a zone in PowerDNS"""
-    # Create a zone name using dns.name
-    zone_name = dns.name.from_text("example.com")
+    zone_name = EXAMPLE_COM_NAME
 
     # Call delete_zone
     netbox_pdns_instance.delete_zone(zone_name)
@@ -566,8 +693,7 @@ def test_delete_zone(netbox_pdns_instance: Mock) -> None:
 
 def test_delete_zone_exception_handling(netbox_pdns_instance: Mock) -> None:
     """Test that delete_zone properly handles exceptions from the PowerDNS API"""
-    # Create a zone name using dns.name
-    zone_name = dns.name.from_text("non-existent.com")
+    zone_name = NONEXISTENT_COM_NAME
 
     # Make delete_zone raise an exception
     test_exception = Exception("Zone not found")
@@ -587,52 +713,46 @@ def test_delete_zone_exception_handling(netbox_pdns_instance: Mock) -> None:
 def test_sync_zone_matching_serials(netbox_pdns_instance: Mock) -> None:
     """Test sync_zone when serial numbers match - should skip synchronization"""
     # Create mock zones with matching serials
-    mock_nb_zone = MagicMock()
-    mock_nb_zone.name = "example.com"
-    mock_nb_zone.soa_serial = 12345
+    mock_nb_zone = NbZone("example.com", soa_serial=12345)
 
-    mock_pdns_zone = Mock(serial=12345)
+    mock_pdns_zone = PdnsZone("example.com.", serial=12345)
 
-    # Mock get_nb_rrsets, list_zone, and patch_zone
+    # Mock get_nb_rrsets; list_zone and patch_zone are already mocks on the zones API
     with patch.object(netbox_pdns_instance, "get_nb_rrsets") as mock_get_nb_rrsets:
-        with patch.object(netbox_pdns_instance.zones_api, "list_zone") as mock_list_zone:
-            with patch.object(netbox_pdns_instance.zones_api, "patch_zone") as mock_patch_zone:
-                # Call sync_zone
-                netbox_pdns_instance.sync_zone(mock_nb_zone, mock_pdns_zone)
-
-                # Verify that the logger was called
-                netbox_pdns_instance.logger.info.assert_called_with(
-                    "Skipping synchronization of zone example.com because serial numbers match"
-                )
+        # Call sync_zone
+        netbox_pdns_instance.sync_zone(mock_nb_zone, mock_pdns_zone)
 
-                # Verify no other operations occurred
-                mock_get_nb_rrsets.assert_not_called()
-                mock_list_zone.assert_not_called()
-                mock_patch_zone.assert_not_called()
+        # Verify that the logger was called
+        netbox_pdns_instance.logger.info.assert_called_with(
+            "Skipping synchronization of zone example.com because serial numbers match"
+        )
+
+        # Verify no other operations occurred
+        mock_get_nb_rrsets.assert_not_called()
+        netbox_pdns_instance.zones_api.list_zone.assert_not_called()
+        netbox_pdns_instance.zones_api.patch_zone.assert_not_called()
 
 
 def test_sync_zone_different_serials(netbox_pdns_instance: Mock) -> None:
     """Test sync_zone when serial numbers differ - should perform synchronization"""
     # Create mock zones with different serials
-    mock_nb_zone = MagicMock()
-    mock_nb_zone.id = 1
-    mock_nb_zone.name = "example.com"
-    mock_nb_zone.soa_serial = 12346
-    mock_nb_zone.default_ttl = 3600
+    mock_nb_zone = NbZone("example.com", id=1, soa_serial=12346)
 
-    mock_pdns_zone = MagicMock()
-    mock_pdns_zone.id = "example.com"
-    mock_pdns_zone.name = "example.com"
-    mock_pdns_zone.serial = 12345  # Different from nb_zone
+    mock_pdns_zone = PdnsZone("example.com", id="example.com", serial=12345)
 
     # Mock get_nb_rrsets to return some records
-    with patch.object(netbox_pdns_instance, "get_nb_rrsets") as mock_get_nb_rrsets:
+    with (
+        patch.object(netbox_pdns_instance, "get_nb_rrsets") as mock_get_nb_rrsets,
+        patch("pdns_auth_client.RRSet") as mock_rrset_class,
+        patch("pdns_auth_client.Record") as mock_record_class,
+        patch("pdns_auth_client.Zone") as mock_zone_class,
+    ):
         mock_get_nb_rrsets.return_value = {
             ("www.example.com", "A"): [
-                Mock(fqdn="www.example.com", type="A", ttl=3600, value="192.0.2.1")
+                NbRecord(fqdn="www.example.com", type="A", ttl=3600, value="192.0.2.1")
             ],
             ("mail.example.com", "MX"): [
-                Mock(
+                NbRecord(
                     fqdn="mail.example.com",
                     type="MX",
                     ttl=None,
@@ -642,89 +762,73 @@ def test_sync_zone_different_serials(netbox_pdns_instance: Mock) -> None:
         }
 
         # Mock PowerDNS zone list_zone to return RRsets
-        mock_pdns_rrset1 = MagicMock()
-        mock_pdns_rrset1.name = "www.example.com"
-        mock_pdns_rrset1.type = "A"
-        mock_pdns_rrset2 = MagicMock()  # This one should be deleted
-        mock_pdns_rrset2.name = "old.example.com"
-        mock_pdns_rrset2.type = "CNAME"
+        mock_pdns_rrset1 = PdnsRRSet("www.example.com", "A")
+        mock_pdns_rrset2 = PdnsRRSet("old.example.com", "CNAME")  # This one should be deleted
         mock_pdns_rrsets = Mock(rrsets=[mock_pdns_rrset1, mock_pdns_rrset2])
         netbox_pdns_instance.zones_api.list_zone.return_value = mock_pdns_rrsets
 
-        # Mock pdns_auth_client RRSet and Record classes
-        with patch("pdns_auth_client.RRSet") as mock_rrset_class:
-            with patch("pdns_auth_client.Record") as mock_record_class:
-                # Configure mocks to return objects with provided kwargs
-                mock_record_class.side_effect = lambda **kwargs: Mock(**kwargs)
-                mock_rrset_class.side_effect = lambda **kwargs: Mock(**kwargs)
-
-                # Set up our zone patch object to be returned for assertions
-                mock_zone_patch = Mock()
-                mock_rrset_class.side_effect = lambda **kwargs: Mock(**kwargs)
-
-                # Mock Zone constructor
-                with patch("pdns_auth_client.Zone") as mock_zone_class:
-                    mock_zone_class.return_value = mock_zone_patch
-
-                    # Call sync_zone
-                    netbox_pdns_instance.sync_zone(mock_nb_zone, mock_pdns_zone)
-
-                    # Verify API calls
-                    netbox_pdns_instance.get_nb_rrsets.assert_called_once_with(1)
-                    netbox_pdns_instance.zones_api.list_zone.assert_called_once_with(
-                        netbox_pdns_instance.config.pdns_server_id, "example.com"
-                    )
-
-                    # Verify Zone creation for the patch
-                    mock_zone_class.assert_called_once()
-                    zone_args = mock_zone_class.call_args[1]
-                    assert zone_args["name"] == "example.com"
-                    assert zone_args["serial"] == 12346  # Updated to Netbox serial
-
-                    # Verify the patch_zone call
-                    netbox_pdns_instance.zones_api.patch_zone.assert_called_once_with(
-                        netbox_pdns_instance.config.pdns_server_id,
-                        "example.com",
-                        mock_zone_patch,
-                    )
-
-                    # Verify RRSet creation calls - should have DELETE for old.example.com
-                    # and REPLACE for www.example.com and mail.example.com
-                    assert mock_rrset_class.call_count >= 3
-
-                    # Check for a DELETE call for old.example.com
-                    delete_call = call(
-                        changetype="DELETE",
-                        name="old.example.com",
-                        type="CNAME",
-                        records=[],
-                    )
-                    assert delete_call in mock_rrset_class.call_args_list
+        # Configure the RRSet and Record mocks to return objects with provided kwargs
+        mock_record_class.side_effect = lambda **kwargs: Mock(**kwargs)
+        mock_rrset_class.side_effect = lambda **kwargs: Mock(**kwargs)
+
+        # Set up our zone patch object to be returned for assertions
+        mock_zone_patch = Mock()
+        mock_rrset_class.side_effect = lambda **kwargs: Mock(**kwargs)
+
+        # Mock Zone constructor
+        mock_zone_class.return_value = mock_zone_patch
+
+        # Call sync_zone
+        netbox_pdns_instance.sync_zone(mock_nb_zone, mock_pdns_zone)
+
+        # Verify API calls
+        netbox_pdns_instance.get_nb_rrsets.assert_called_once_with(1)
+        netbox_pdns_instance.zones_api.list_zone.assert_called_once_with(
+            netbox_pdns_instance.config.pdns_server_id, "example.com"
+        )
+
+        # Verify Zone creation for the patch
+        mock_zone_class.assert_called_once()
+        zone_args = mock_zone_class.call_args[1]
+        assert zone_args["name"] == "example.com"
+        assert zone_args["serial"] == 12346  # Updated to Netbox serial
+
+        # Verify the patch_zone call
+        netbox_pdns_instance.zones_api.patch_zone.assert_called_once_with(
+            netbox_pdns_instance.config.pdns_server_id,
+            "example.com",
+            mock_zone_patch,
+        )
+
+        # Verify RRSet creation calls - should have DELETE for old.example.com
+        # and REPLACE for www.example.com and mail.example.com
+        assert mock_rrset_class.call_count >= 3
+
+        # Check for a DELETE call for old.example.com
+        delete_call = call(
+            changetype="DELETE",
+            name="old.example.com",
+            type="CNAME",
+            records=[],
+        )
+        assert delete_call in mock_rrset_class.call_args_list
 
 
 def test_sync_zone_exception_handling(netbox_pdns_instance: Mock) -> None:
     """Test that sync_zone properly handles exceptions from the PowerDNS API"""
     # Create mock zones
-    mock_nb_zone = MagicMock()
-    mock_nb_zone.id = 1
-    mock_nb_zone.name = "example.com"
-    mock_nb_zone.soa_serial = 12346
+    mock_nb_zone = NbZone("example.com", id=1, soa_serial=12346)
 
-    mock_pdns_zone = MagicMock()
-    mock_pdns_zone.id = "example.com"
-    mock_pdns_zone.name = "example.com"
-    mock_pdns_zone.serial = 12345
+    mock_pdns_zone = PdnsZone("example.com", id="example.com", serial=12345)
 
     # Mock get_nb_rrsets to return minimal data
     with patch.object(netbox_pdns_instance, "get_nb_rrsets") as mock_get_nb_rrsets:
         mock_get_nb_rrsets.return_value = {
-            ("www.example.com", "A"): [Mock(ttl=3600, value="192.0.2.1")]
+            ("www.example.com", "A"): [NbRecord("www.example.com", "A", "192.0.2.1", ttl=3600)]
         }
 
         # Mock PowerDNS list_zone to return minimal RRsets
-        mock_pdns_rrset = MagicMock()
-        mock_pdns_rrset.name = "www.example.com"
-        mock_pdns_rrset.type = "A"
+        mock_pdns_rrset = PdnsRRSet("www.example.com", "A")
         mock_pdns_rrsets = Mock(rrsets=[mock_pdns_rrset])
         netbox_pdns_instance.zones_api.list_zone.return_value = mock_pdns_rrsets
 
@@ -746,71 +850,52 @@ def test_sync_zone_exception_handling(netbox_pdns_instance: Mock) -> None:
 def test_sync_zone_empty_rrsets(netbox_pdns_instance: Mock) -> None:
     """Test sync_zone behavior with empty RRsets"""
     # Create mock zones
-    mock_nb_zone = MagicMock()
-    mock_nb_zone.id = 1
-    mock_nb_zone.name = "empty.com"
-    mock_nb_zone.soa_serial = 12346
-    mock_nb_zone.default_ttl = 3600
+    mock_nb_zone = NbZone("empty.com", id=1, soa_serial=12346)
 
-    mock_pdns_zone = MagicMock()
-    mock_pdns_zone.id = "empty.com"
-    mock_pdns_zone.name = "empty.com"
-    mock_pdns_zone.serial = 12345
+    mock_pdns_zone = PdnsZone("empty.com", id="empty.com", serial=12345)
 
     # Mock get_nb_rrsets to return empty dict
     with patch.object(netbox_pdns_instance, "get_nb_rrsets") as mock_get_nb_rrsets:
         mock_get_nb_rrsets.return_value = {}
 
         # Mock PowerDNS list_zone to return some RRsets that should be deleted
-        mock_pdns_rrset1 = MagicMock()
-        mock_pdns_rrset1.name = "www.empty.com"
-        mock_pdns_rrset1.type = "A"
-        mock_pdns_rrset2 = MagicMock()
-        mock_pdns_rrset2.name = "mail.empty.com"
-        mock_pdns_rrset2.type = "MX"
+        mock_pdns_rrset1 = PdnsRRSet("www.empty.com", "A")
+        mock_pdns_rrset2 = PdnsRRSet("mail.empty.com", "MX")
         mock_pdns_rrsets = Mock(rrsets=[mock_pdns_rrset1, mock_pdns_rrset2])
         netbox_pdns_instance.zones_api.list_zone.return_value = mock_pdns_rrsets
 
         # Call sync_zone
-        with patch("pdns_auth_client.RRSet") as mock_rrset_class:
-            with patch("pdns_auth_client.Zone") as mock_zone_class:
-                netbox_pdns_instance.sync_zone(mock_nb_zone, mock_pdns_zone)
-
-                # Verify that both RRsets from PowerDNS were marked for deletion
-                assert mock_rrset_class.call_count == 2
-                delete_calls = [
-                    call(changetype="DELETE", name="www.empty.com", type="A", records=[]),
-                    call(
-                        changetype="DELETE",
-                        name="mail.empty.com",
-                        type="MX",
-                        records=[],
-                    ),
-                ]
+        with patch.multiple("pdns_auth_client", RRSet=DEFAULT, Zone=DEFAULT) as mocks:
+            mock_rrset_class = mocks["RRSet"]
+            mock_zone_class = mocks["Zone"]
+            netbox_pdns_instance.sync_zone(mock_nb_zone, mock_pdns_zone)
+
+            # Verify that both RRsets from PowerDNS were marked for deletion
+            assert mock_rrset_class.call_count == 2
+            delete_calls = [
+                call(changetype="DELETE", name="www.empty.com", type="A", records=[]),
+                call(
+                    changetype="DELETE",
+                    name="mail.empty.com",
+                    type="MX",
+                    records=[],
+                ),
+            ]
 
-                for delete_call in delete_calls:
-                    assert delete_call in mock_rrset_class.call_args_list
+            mock_rrset_class.assert_has_calls(delete_calls, any_order=True)
 
-                # Verify the Zone was created with the DELETE RRsets
-                mock_zone_class.assert_called_once()
-                netbox_pdns_instance.zones_api.patch_zone.assert_called_once()
+            # Verify the Zone was created with the DELETE RRsets
+            mock_zone_class.assert_called_once()
+            netbox_pdns_instance.zones_api.patch_zone.assert_called_once()
 
 
 def test_full_sync(netbox_pdns_instance: Mock) -> None:
     """Comprehensive test for full_sync method"""
     # Mock the zones returned from PowerDNS
-    pdns_zone1 = MagicMock()
-    pdns_zone1.name = "existing.com."  # Note: PDNS may return names with trailing dots
-    pdns_zone1.id = "existing.com"
-
-    pdns_zone2 = MagicMock()
-    pdns_zone2.name = "to-be-deleted.com."
-    pdns_zone2.id = "to-be-deleted.com"
-
-    pdns_zone3 = MagicMock()
-    pdns_zone3.name = "sync-needed.com."
-    pdns_zone3.id = "sync-needed.com"
-    pdns_zone3.serial = 1001
+    # Note: PDNS may return names with trailing dots
+    pdns_zone1 = PdnsZone("existing.com.", "existing.com", serial=999)
+    pdns_zone2 = PdnsZone("to-be-deleted.com.", "to-be-deleted.com")
+    pdns_zone3 = PdnsZone("sync-needed.com.", "sync-needed.com", serial=1001)
 
     netbox_pdns_instance.zones_api.list_zones.return_value = [
         pdns_zone1,
@@ -819,16 +904,9 @@ def test_full_sync(netbox_pdns_instance: Mock) -> None:
     ]
 
     # Mock the zones returned from Netbox
-    nb_zone1 = MagicMock()
-    nb_zone1.name = "existing.com"
-    nb_zone1.soa_serial = 1000
-
-    nb_zone2 = MagicMock()
-    nb_zone2.name = "to-be-created.com"
-
-    nb_zone3 = MagicMock()
-    nb_zone3.name = "sync-needed.com"
-    nb_zone3.soa_serial = 1002  # Different from pdns_zone3.serial -> needs sync
+    nb_zone1 = NbZone("existing.com", soa_serial=1000)  # Different from pdns_zone1.serial
+    nb_zone2 = NbZone("to-be-created.com")
+    nb_zone3 = NbZone("sync-needed.com", soa_serial=1002)  # Different from pdns_zone3.serial
 
     netbox_pdns_instance.nb.plugins.netbox_dns.zones.filter.return_value = [
         nb_zone1,
@@ -837,44 +915,65 @@ def test_full_sync(netbox_pdns_instance: Mock) -> None:
     ]
 
     # Mock sync_zone, create_zone, and delete_zone methods
-    with patch.object(netbox_pdns_instance, "sync_zone") as mock_sync:
-        with patch.object(netbox_pdns_instance, "create_zone") as mock_create:
-            with patch.object(netbox_pdns_instance, "delete_zone") as mock_delete:
-                # Call full_sync
-                result = netbox_pdns_instance.full_sync()
-
-                # Verify API calls were made
-                netbox_pdns_instance.zones_api.list_zones.assert_called_once_with(
-                    netbox_pdns_instance.config.pdns_server_id
-                )
+    with patch.multiple(
+        netbox_pdns_instance, sync_zone=DEFAULT, create_zone=DEFAULT, delete_zone=DEFAULT
+    ) as mocks:
+        mock_sync = mocks["sync_zone"]
+        mock_create = mocks["create_zone"]
+        mock_delete = mocks["delete_zone"]
+        # Call full_sync
+        result = netbox_pdns_instance.full_sync()
+
+        # Verify API calls were made
+        netbox_pdns_instance.zones_api.list_zones.assert_called_once_with(
+            netbox_pdns_instance.config.pdns_server_id
+        )
 
-                netbox_pdns_instance.nb.plugins.netbox_dns.zones.filter.assert_called_once_with(
-                    nameserver_id=netbox_pdns_instance.config.nb_ns_id
-                )
+        netbox_pdns_instance.nb.plugins.netbox_dns.zones.filter.assert_called_once_with(
+            nameserver_id=netbox_pdns_instance.config.nb_ns_id, limit=0
+        )
 
-                # Verify logging
-                netbox_pdns_instance.logger.info.assert_called_with(
-                    "Synchronizing all zones from Netbox"
-                )
+        # Verify logging
+        netbox_pdns_instance.logger.info.assert_called_with("Synchronizing all zones from Netbox")
+
+        # Verify sync_zone calls
+        # We expect 2 sync calls - for existing.com and sync-needed.com
+        assert mock_sync.call_count == 2
+        sync_calls = [call(nb_zone1, pdns_zone1), call(nb_zone3, pdns_zone3)]
+        mock_sync.assert_has_calls(sync_calls, any_order=True)
 
-                # Verify sync_zone calls
-                # We expect 2 sync calls - for existing.com and sync-needed.com
-                assert mock_sync.call_count == 2
-                sync_calls = [call(nb_zone1, pdns_zone1), call(nb_zone3, pdns_zone3)]
-                mock_sync.assert_has_calls(sync_calls, any_order=True)
+        # Verify create_zone calls
+        mock_create.assert_called_once_with(nb_zone2)
 
-                # Verify create_zone calls
-                mock_create.assert_called_once_with(nb_zone2)
+        # Verify delete_zone calls - should be called with dns.name.Name object
+        assert mock_delete.call_count == 1
+        # Extract the argument from the call and check it's a dns.name.Name object
+        delete_arg = mock_delete.call_args[0][0]
+        assert isinstance(delete_arg, dns.name.Name)
+        assert delete_arg == TO_BE_DELETED_NAME
 
-                # Verify delete_zone calls - should be called with dns.name.Name object
-                assert mock_delete.call_count == 1
-                # Extract the argument from the call and check it's a dns.name.Name object
-                delete_arg = mock_delete.call_args[0][0]
-                assert isinstance(delete_arg, dns.name.Name)
-                assert delete_arg.to_text() == "to-be-deleted.com."
+        # Verify result
+        assert result == {"result": "success"}
 
-                # Verify result
-                assert result == {"result": "success"}
+
+def test_full_sync_skips_matching_serials(netbox_pdns_instance: Mock) -> None:
+    """Test full_sync only synchronizes zones whose serials differ"""
+    pdns_unchanged = PdnsZone("unchanged.com.", serial=1000)
+    pdns_changed = PdnsZone("changed.com.", serial=1000)
+    netbox_pdns_instance.zones_api.list_zones.return_value = [pdns_unchanged, pdns_changed]
+
+    nb_unchanged = NbZone("unchanged.com", soa_serial=1000)
+    nb_changed = NbZone("changed.com", soa_serial=1001)
+    netbox_pdns_instance.nb.plugins.netbox_dns.zones.filter.return_value = [
+        nb_unchanged,
+        nb_changed,
+    ]
+
+    with patch.object(netbox_pdns_instance, "sync_zone") as mock_sync:
+        result = netbox_pdns_instance.full_sync()
+
+        mock_sync.assert_called_once_with(nb_changed, pdns_changed)
+        assert result == {"result": "success"}
 
 
 def test_full_sync_empty_zones(netbox_pdns_instance: Mock) -> None:
@@ -884,16 +983,105 @@ def test_full_sync_empty_zones(netbox_pdns_instance: Mock) -> None:
     netbox_pdns_instance.nb.plugins.netbox_dns.zones.filter.return_value = []
 
     # Mock sync_zone, create_zone, and delete_zone methods
-    with patch.object(netbox_pdns_instance, "sync_zone") as mock_sync:
-        with patch.object(netbox_pdns_instance, "create_zone") as mock_create:
-            with patch.object(netbox_pdns_instance, "delete_zone") as mock_delete:
-                # Call full_sync
-                result = netbox_pdns_instance.full_sync()
-
-                # Verify none of the methods were called
-                mock_sync.assert_not_called()
-                mock_create.assert_not_called()
-                mock_delete.assert_not_called()
-
-                # Verify result
-                assert result == {"result": "success"}
+    with patch.multiple(
+        netbox_pdns_instance, sync_zone=DEFAULT, create_zone=DEFAULT, delete_zone=DEFAULT
+    ) as mocks:
+        mock_sync = mocks["sync_zone"]
+        mock_create = mocks["create_zone"]
+        mock_delete = mocks["delete_zone"]
+        # Call full_sync
+        result = netbox_pdns_instance.full_sync()
+
+        # Verify none of the methods were called
+        mock_sync.assert_not_called()
+        mock_create.assert_not_called()
+        mock_delete.assert_not_called()
+
+        # Verify result
+        assert result == {"result": "success"}
+
+
+def test_full_sync_zone_error_propagates(netbox_pdns_instance: Mock) -> None:
+    """Test full_sync surfaces errors raised by concurrent zone operations"""
+    pdns_zone = PdnsZone("to-be-deleted.com.")
+    netbox_pdns_instance.zones_api.list_zones.return_value = [pdns_zone]
+
+    nb_zone = NbZone("to-be-created.com")
+    netbox_pdns_instance.nb.plugins.netbox_dns.zones.filter.return_value = [nb_zone]
+
+    with patch.multiple(netbox_pdns_instance, create_zone=DEFAULT, delete_zone=DEFAULT) as mocks:
+        mock_create = mocks["create_zone"]
+        mock_delete = mocks["delete_zone"]
+        mock_create.side_effect = PowerDNSAPIError("Create failed")
+
+        with pytest.raises(PowerDNSAPIError, match="Create failed"):
+            netbox_pdns_instance.full_sync()
+
+        # Independent zone operations still run to completion
+        mock_create.assert_called_once_with(nb_zone)
+        mock_delete.assert_called_once()
+
+
+def test_sync_zone_uses_loaded_rrsets(netbox_pdns_instance: Mock) -> None:
+    """Test sync_zone reuses RRSets already present on the PowerDNS zone"""
+    mock_nb_zone = NbZone("example.com", id=1, soa_serial=12346)
+
+    mock_pdns_rrset = PdnsRRSet("old.example.com", "CNAME")
+
+    mock_pdns_zone = PdnsZone(
+        "example.com", id="example.com", serial=12345, rrsets=[mock_pdns_rrset]
+    )
+
+    with patch.object(netbox_pdns_instance, "get_nb_rrsets") as mock_get_nb_rrsets:
+        mock_get_nb_rrsets.return_value = {}
+
+        with patch.multiple("pdns_auth_client", RRSet=DEFAULT, Zone=DEFAULT) as mocks:
+            mock_rrset_class = mocks["RRSet"]
+            netbox_pdns_instance.sync_zone(mock_nb_zone, mock_pdns_zone)
+
+            # No second round-trip to PowerDNS for RRSets
+            netbox_pdns_instance.zones_api.list_zone.assert_not_called()
+            mock_rrset_class.assert_called_once_with(
+                changetype="DELETE", name="old.example.com", type="CNAME", records=[]
+            )
+            netbox_pdns_instance.zones_api.patch_zone.assert_called_once()
+
+
+def test_operation_lock_zone_stripe(netbox_pdns_instance: Mock) -> None:
+    """Test zone operations only hold the lock stripe for their zone"""
+    zone_lock = netbox_pdns_instance._operation_locks("example.com")[0]
+
+    # Trailing dot and case do not change the stripe a zone maps to
+    assert netbox_pdns_instance._operation_locks("Example.COM.") == [zone_lock]
+
+    with netbox_pdns_instance._operation_lock_with_logging("zone_update", "example.com"):
+        assert zone_lock.locked()
+        held = [lock for lock in netbox_pdns_instance._zone_locks if lock.locked()]
+        assert held == [zone_lock]
+
+    assert not zone_lock.locked()
+
+
+def test_operation_lock_global(netbox_pdns_instance: Mock) -> None:
+    """Test operations without a zone hold every lock stripe"""
+    with netbox_pdns_instance._operation_lock_with_logging("full_sync"):
+        assert all(lock.locked() for lock in netbox_pdns_instance._zone_locks)
+
+    assert not any(lock.locked() for lock in netbox_pdns_instance._zone_locks)
+
+
+def test_operation_lock_timeout_releases_stripes(netbox_pdns_instance: Mock) -> None:
+    """Test a timed out global lock releases the stripes it already acquired"""
+    blocked_lock = netbox_pdns_instance._zone_locks[-1]
+    blocked_lock.acquire()
+    try:
+        # The clock jumps past the 30 second budget right after the first stripe is taken
+        with patch("netbox_pdns.api.time") as mock_time:
+            mock_time.time.side_effect = itertools.chain([0.0, 0.0], itertools.repeat(31.0))
+            with pytest.raises(TimeoutError, match="Lock timeout for operation: full_sync"):
+                with netbox_pdns_instance._operation_lock_with_logging("full_sync"):
+                    pass
+    finally:
+        blocked_lock.release()
+
+    assert not any(lock.locked() for lock in netbox_pdns_instance._zone_locks)
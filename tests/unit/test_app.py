@@ -1,56 +1,105 @@
+from __future__ import annotations
+
+import hashlib
+import hmac
 import json
-from collections.abc import Generator
-from unittest.mock import Mock, patch
+import logging
+import threading
+import time
+from collections.abc import Iterator
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, cast
+from unittest.mock import MagicMock, Mock, create_autospec
 
 import dns.name
 import pytest
-from fastapi.testclient import TestClient
+from fastapi import FastAPI
 
-from netbox_pdns import create_app
+from netbox_pdns import MAX_WEBHOOK_BODY_SIZE, create_app
+from netbox_pdns.api import NetboxPDNS
 from netbox_pdns.models import Settings
 
+if TYPE_CHECKING:
+    from fastapi.testclient import TestClient
+
+EXAMPLE_COM_NAME = dns.name.from_text("example.com")
+
+
+@pytest.fixture(scope="session")
+def netbox_pdns_mock() -> Mock:
+    """NetboxPDNS stand-in shared by every app built in this module"""
+    mock_instance: Mock = create_autospec(NetboxPDNS, instance=True)
+    # Instance attributes are set in __init__, so the class spec does not cover them
+    mock_instance.logger = create_autospec(logging.Logger, instance=True)
+
+    # Provide real Settings object to prevent URL parsing issues
+    mock_instance.config = Settings(
+        api_key="test_api_key",
+        nb_url="https://netbox.example.com",
+        nb_token="test_nb_token",
+        nb_ns_id=1,
+        pdns_url="https://pdns.example.com",
+        pdns_token="test_pdns_token",
+        sync_crontab="*/15 * * * *",
+        mqtt_enabled=False,  # Disable MQTT to avoid connection attempts
+    )
+    mock_instance._operation_lock_with_logging = MagicMock()
+
+    return mock_instance
+
 
 @pytest.fixture
-def mock_netbox_pdns() -> Generator[Mock, None, None]:
-    with patch("netbox_pdns.NetboxPDNS") as mock_class:
-        mock_instance = Mock()
-        mock_class.return_value = mock_instance
-
-        # Provide real Settings object to prevent URL parsing issues
-        mock_instance.config = Settings(
-            api_key="test_api_key",
-            nb_url="https://netbox.example.com",
-            nb_token="test_nb_token",
-            nb_ns_id=1,
-            pdns_url="https://pdns.example.com",
-            pdns_token="test_pdns_token",
-            sync_crontab="*/15 * * * *",
-            mqtt_enabled=False,  # Disable MQTT to avoid connection attempts
-        )
+def mock_netbox_pdns(netbox_pdns_mock: Mock) -> Mock:
+    """The shared NetboxPDNS mock with the previous test's calls and results cleared"""
+    netbox_pdns_mock.reset_mock(return_value=True, side_effect=True)
+    netbox_pdns_mock.full_sync.return_value = {"result": "success"}
+    return netbox_pdns_mock
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _patch_app_services() -> Iterator[None]:
+    """Stub the scheduler and MQTT service for every app this module builds"""
+    with pytest.MonkeyPatch.context() as mp:
+        # Patch the names create_app looks up, rather than where they are defined
+        mp.setattr("netbox_pdns.AsyncIOScheduler", Mock())
+        # Mock MQTT service to prevent connection attempts
+        mp.setattr("netbox_pdns.MQTTService", Mock())
+        yield
 
-        # Mock methods
-        mock_instance.full_sync.return_value = {"result": "success"}
 
-        yield mock_instance
+@pytest.fixture(scope="module")
+def app_client(_patch_app_services: None, netbox_pdns_mock: Mock) -> TestClient:
+    """Client for one app built per module, create_app dominates the setup cost"""
+    # Imported here so collecting this module doesn't pull in the test client and httpx
+    from fastapi.testclient import TestClient
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("netbox_pdns.NetboxPDNS", Mock(return_value=netbox_pdns_mock))
+        app = create_app()
+    return TestClient(app)
 
 
 @pytest.fixture
-def client(mock_netbox_pdns: Mock) -> TestClient:
-    with patch("apscheduler.schedulers.background.BackgroundScheduler") as mock_scheduler:
-        mock_scheduler_instance = Mock()
-        mock_scheduler.return_value = mock_scheduler_instance
+def client(app_client: TestClient, mock_netbox_pdns: Mock) -> TestClient:
+    # Rate limit counters live on the shared app, so every test starts from zero
+    cast(FastAPI, app_client.app).state.limiter.reset()
+    return app_client
 
-        # Mock MQTT service to prevent connection attempts
-        with patch("netbox_pdns.mqtt_service.MQTTService") as mqtt_mock:
-            mqtt_instance = Mock()
-            mqtt_mock.return_value = mqtt_instance
 
-            app = create_app()
-            return TestClient(app)
+def drain_webhook_queue(client: TestClient) -> None:
+    """Wait until the background webhook workers have processed every queued operation"""
+    assert client.portal is not None, "webhook workers only run inside the client context"
+    app = cast(FastAPI, client.app)
+    for queue in app.state.webhook_queues:
+        client.portal.call(queue.join)
 
 
 def test_lifespan(client: TestClient, mock_netbox_pdns: Mock) -> None:
+    # The initial sync runs in a background thread, so wait for it rather than racing it
+    synced = threading.Event()
+    mock_netbox_pdns.full_sync.side_effect = lambda: synced.set()
     with client:
+        assert synced.wait(timeout=5)
         mock_netbox_pdns.full_sync.assert_called_once()
 
 
@@ -61,12 +110,25 @@ def test_health_check(client: TestClient) -> None:
     assert response.json() == {"status": "Healthy"}
 
 
+def test_health_check_not_rate_limited(client: TestClient) -> None:
+    """Test the health check endpoint is exempt from rate limiting"""
+    for _ in range(150):
+        response = client.get("/health")
+        assert response.status_code == 200
+
+
 def test_sync_unauthorized(client: TestClient) -> None:
     """Test accessing sync endpoint without API key"""
     response = client.get("/sync")
     assert response.status_code == 401
 
 
+def test_sync_non_ascii_api_key(client: TestClient) -> None:
+    """Test a non-ASCII API key is rejected rather than erroring"""
+    response = client.get("/sync", headers={"x-netbox-pdns-api-key": "tëst_api_key".encode()})
+    assert response.status_code == 401
+
+
 def test_sync_authorized(client: TestClient, mock_netbox_pdns: Mock) -> None:
     """Test accessing sync endpoint with valid API key"""
     response = client.get("/sync", headers={"x-netbox-pdns-api-key": "test_api_key"})
@@ -79,17 +141,20 @@ def test_zones_create(client: TestClient, mock_netbox_pdns: Mock) -> None:
     """Test creating a zone via webhook"""
     webhook_data = {"id": 123, "name": "example.com", "serial": 2023010101}
 
-    # Mock get_nb_zone to return a Mock zone
-    mock_zone = Mock()
+    # Mock get_nb_zone to return a zone stand-in
+    mock_zone = SimpleNamespace(id=123, name="example.com")
     mock_netbox_pdns.get_nb_zone.return_value = mock_zone
 
-    response = client.post(
-        "/zones/create",
-        json=webhook_data,
-        headers={"x-netbox-pdns-api-key": "test_api_key"},
-    )
+    with client:
+        response = client.post(
+            "/zones/create",
+            json=webhook_data,
+            headers={"x-netbox-pdns-api-key": "test_api_key"},
+        )
+        drain_webhook_queue(client)
 
-    assert response.status_code == 200
+    assert response.status_code == 202
+    assert response.json() == {"result": "accepted"}
     mock_netbox_pdns.get_nb_zone.assert_called_once_with(123)
     mock_netbox_pdns.create_zone.assert_called_once_with(mock_zone)
 
@@ -98,38 +163,211 @@ def test_zones_delete(client: TestClient, mock_netbox_pdns: Mock) -> None:
     """Test deleting a zone via webhook"""
     webhook_data = {"id": 123, "name": "example.com"}
 
-    response = client.request(
-        method="DELETE",
-        url="/zones/delete",
-        content=json.dumps(webhook_data),
-        headers={"x-netbox-pdns-api-key": "test_api_key"},
-    )
+    with client:
+        response = client.request(
+            method="DELETE",
+            url="/zones/delete",
+            json=webhook_data,
+            headers={"x-netbox-pdns-api-key": "test_api_key"},
+        )
+        drain_webhook_queue(client)
 
-    assert response.status_code == 200
+    assert response.status_code == 202
     # Check that delete_zone was called with a DNS name
     mock_netbox_pdns.delete_zone.assert_called_once()
     called_arg = mock_netbox_pdns.delete_zone.call_args[0][0]
     assert isinstance(called_arg, dns.name.Name)
-    assert called_arg.to_text() == "example.com."
+    assert called_arg == EXAMPLE_COM_NAME
 
 
 def test_zones_update(client: TestClient, mock_netbox_pdns: Mock) -> None:
     """Test updating a zone via webhook"""
     webhook_data = {"id": 123, "name": "example.com"}
 
-    # Mock get_nb_zone and get_pdns_zone to return Mock objects
-    mock_nb_zone = Mock()
-    mock_pdns_zone = Mock()
+    # Mock get_nb_zone and get_pdns_zone to return zone stand-ins
+    mock_nb_zone = SimpleNamespace(id=123, name="example.com")
+    mock_pdns_zone = SimpleNamespace(id="example.com.", name="example.com.")
     mock_netbox_pdns.get_nb_zone.return_value = mock_nb_zone
     mock_netbox_pdns.get_pdns_zone.return_value = mock_pdns_zone
 
-    response = client.post(
-        "/zones/update",
-        json=webhook_data,
-        headers={"x-netbox-pdns-api-key": "test_api_key"},
-    )
+    with client:
+        response = client.post(
+            "/zones/update",
+            json=webhook_data,
+            headers={"x-netbox-pdns-api-key": "test_api_key"},
+        )
+        drain_webhook_queue(client)
 
-    assert response.status_code == 200
+    assert response.status_code == 202
     mock_netbox_pdns.get_nb_zone.assert_called_once_with(123)
     mock_netbox_pdns.get_pdns_zone.assert_called_once_with("example.com")
     mock_netbox_pdns.sync_zone.assert_called_once_with(mock_nb_zone, mock_pdns_zone)
+
+
+def test_zone_webhooks_run_in_order(client: TestClient, mock_netbox_pdns: Mock) -> None:
+    """Test a delete queued right after a create for the same zone runs after it"""
+    webhook_data = {"id": 123, "name": "example.com"}
+    headers = {"x-netbox-pdns-api-key": "test_api_key"}
+    operations: list[str] = []
+
+    def slow_create(zone: SimpleNamespace) -> None:
+        # Give an idle worker ample time to pick up the delete if it were free to
+        time.sleep(0.05)
+        operations.append("create")
+
+    mock_netbox_pdns.create_zone.side_effect = slow_create
+    mock_netbox_pdns.delete_zone.side_effect = lambda name: operations.append("delete")
+
+    with client:
+        client.post("/zones/create", json=webhook_data, headers=headers)
+        client.request(method="DELETE", url="/zones/delete", json=webhook_data, headers=headers)
+        drain_webhook_queue(client)
+
+    assert operations == ["create", "delete"]
+
+
+@pytest.fixture
+def signed_client(mock_netbox_pdns: Mock, monkeypatch: pytest.MonkeyPatch) -> TestClient:
+    # The app reads the config on every request, so it gets its own app and the shared
+    # mock's config is restored once the test finishes
+    monkeypatch.setattr(
+        mock_netbox_pdns,
+        "config",
+        mock_netbox_pdns.config.model_copy(update={"webhook_secret": "test_webhook_secret"}),
+    )
+    from fastapi.testclient import TestClient
+
+    monkeypatch.setattr("netbox_pdns.NetboxPDNS", Mock(return_value=mock_netbox_pdns))
+    app = create_app()
+    return TestClient(app)
+
+
+def test_zones_create_valid_signature(signed_client: TestClient, mock_netbox_pdns: Mock) -> None:
+    """Test webhook accepted when the HMAC signature matches the body"""
+    body = json.dumps({"id": 123, "name": "example.com"}).encode()
+    signature = hmac.new(b"test_webhook_secret", body, hashlib.sha256).hexdigest()
+
+    with signed_client:
+        response = signed_client.post(
+            "/zones/create",
+            content=body,
+            headers={
+                "x-netbox-pdns-api-key": "test_api_key",
+                "x-hub-signature-256": f"sha256={signature}",
+            },
+        )
+        drain_webhook_queue(signed_client)
+
+    assert response.status_code == 202
+    mock_netbox_pdns.get_nb_zone.assert_called_once_with(123)
+
+
+def test_zones_create_invalid_signature(signed_client: TestClient, mock_netbox_pdns: Mock) -> None:
+    """Test webhook rejected when the HMAC signature does not match the body"""
+    body = json.dumps({"id": 123, "name": "example.com"}).encode()
+    signature = hmac.new(b"wrong_secret", body, hashlib.sha256).hexdigest()
+
+    response = signed_client.post(
+        "/zones/create",
+        content=body,
+        headers={"x-netbox-pdns-api-key": "test_api_key", "x-signature-256": signature},
+    )
+
+    assert response.status_code == 401
+    assert response.json() == {"detail": "Invalid webhook signature"}
+    mock_netbox_pdns.create_zone.assert_not_called()
+
+
+def test_zones_create_unauthorized(client: TestClient, mock_netbox_pdns: Mock) -> None:
+    """Test webhook endpoints reject requests without a valid API key"""
+    response = client.post("/zones/create", json={"id": 1, "name": "example.com."})
+    assert response.status_code == 401
+    response = client.post(
+        "/zones/create",
+        json={"id": 1, "name": "example.com."},
+        headers={"x-netbox-pdns-api-key": "wrong_key"},
+    )
+    assert response.status_code == 401
+    mock_netbox_pdns.create_zone.assert_not_called()
+
+
+def test_zones_create_rate_limits_bad_api_keys(client: TestClient) -> None:
+    """Test requests with a wrong API key count towards the webhook rate limit"""
+    statuses = [
+        client.post(
+            "/zones/create",
+            json={"id": 1, "name": "example.com."},
+            headers={"x-netbox-pdns-api-key": "wrong_key"},
+        ).status_code
+        for _ in range(21)
+    ]
+    assert statuses == [401] * 20 + [429]
+
+
+def test_zones_create_body_too_large(client: TestClient, mock_netbox_pdns: Mock) -> None:
+    """Test webhook bodies over the size limit are rejected"""
+    response = client.post(
+        "/zones/create",
+        content=b" " * (MAX_WEBHOOK_BODY_SIZE + 1),
+        headers={"x-netbox-pdns-api-key": "test_api_key"},
+    )
+
+    assert response.status_code == 413
+    mock_netbox_pdns.create_zone.assert_not_called()
+
+
+def test_zones_create_invalid_json(client: TestClient, mock_netbox_pdns: Mock) -> None:
+    """Test webhook with a malformed JSON body is rejected"""
+    response = client.post(
+        "/zones/create",
+        content=b"{not json",
+        headers={"x-netbox-pdns-api-key": "test_api_key"},
+    )
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Invalid JSON in request body"}
+    mock_netbox_pdns.create_zone.assert_not_called()
+
+
+def test_zones_create_invalid_data(client: TestClient, mock_netbox_pdns: Mock) -> None:
+    """Test webhook with a body missing required fields is rejected"""
+    response = client.post(
+        "/zones/create",
+        json={"name": "example.com"},
+        headers={"x-netbox-pdns-api-key": "test_api_key"},
+    )
+
+    assert response.status_code == 400
+    assert response.json()["detail"].startswith("Invalid webhook data")
+    mock_netbox_pdns.create_zone.assert_not_called()
+
+
+def test_zones_create_workers_not_running(client: TestClient, mock_netbox_pdns: Mock) -> None:
+    """Test webhook is rejected when the app lifespan (and its workers) is not running"""
+    response = client.post(
+        "/zones/create",
+        json={"id": 123, "name": "example.com"},
+        headers={"x-netbox-pdns-api-key": "test_api_key"},
+    )
+
+    assert response.status_code == 503
+    mock_netbox_pdns.create_zone.assert_not_called()
+
+
+def test_zones_create_operation_error(client: TestClient, mock_netbox_pdns: Mock) -> None:
+    """Test a failing queued operation is logged without stopping the workers"""
+    mock_netbox_pdns.get_nb_zone.side_effect = [Exception("Netbox down"), Mock()]
+
+    with client:
+        for _ in range(2):
+            response = client.post(
+                "/zones/create",
+                json={"id": 123, "name": "example.com"},
+                headers={"x-netbox-pdns-api-key": "test_api_key"},
+            )
+            assert response.status_code == 202
+        drain_webhook_queue(client)
+
+    mock_netbox_pdns.logger.error.assert_called()
+    assert "Netbox down" in mock_netbox_pdns.logger.error.call_args_list[0][0][0]
+    mock_netbox_pdns.create_zone.assert_called_once()
@@ -1,5 +1,9 @@
 """Tests for custom exceptions."""
 
+from typing import Any
+
+import pytest
+
 from netbox_pdns.exceptions import (
     ConfigurationError,
     MQTTConnectionError,
@@ -13,95 +17,85 @@ from netbox_pdns.exceptions import (
 )
 
 
-class TestNetboxPDNSError:
-    """Test the base exception class."""
-
-    def test_base_exception(self) -> None:
-        """Test base exception creation."""
-        error = NetboxPDNSError("Test error")
-        assert str(error) == "Test error"
-        assert isinstance(error, Exception)
-
-
-class TestConfigurationError:
-    """Test configuration errors."""
-
-    def test_configuration_error(self) -> None:
-        """Test configuration error creation."""
-        error = ConfigurationError("Invalid config")
-        assert str(error) == "Invalid config"
-        assert isinstance(error, NetboxPDNSError)
-
-
-class TestAPIErrors:
-    """Test API-related errors."""
-
-    def test_netbox_api_error_without_status(self) -> None:
-        """Test Netbox API error without status code."""
-        error = NetboxAPIError("Connection failed")
-        assert str(error) == "Connection failed"
-        assert error.status_code is None
-        assert isinstance(error, NetboxPDNSError)
-
-    def test_netbox_api_error_with_status(self) -> None:
-        """Test Netbox API error with status code."""
-        error = NetboxAPIError("Not found", 404)
-        assert str(error) == "Not found"
-        assert error.status_code == 404
-
-    def test_powerdns_api_error_without_status(self) -> None:
-        """Test PowerDNS API error without status code."""
-        error = PowerDNSAPIError("Connection failed")
-        assert str(error) == "Connection failed"
-        assert error.status_code is None
-        assert isinstance(error, NetboxPDNSError)
-
-    def test_powerdns_api_error_with_status(self) -> None:
-        """Test PowerDNS API error with status code."""
-        error = PowerDNSAPIError("Unauthorized", 401)
-        assert str(error) == "Unauthorized"
-        assert error.status_code == 401
-
-
-class TestZoneErrors:
-    """Test zone-related errors."""
-
-    def test_zone_not_found_error(self) -> None:
-        """Test zone not found error."""
-        error = ZoneNotFoundError("example.com")
-        assert str(error) == "Zone not found: example.com"
-        assert error.zone_name == "example.com"
-        assert isinstance(error, NetboxPDNSError)
-
-    def test_zone_sync_error(self) -> None:
-        """Test zone sync error."""
-        error = ZoneSyncError("example.com", "Serial mismatch")
-        assert str(error) == "Error syncing zone example.com: Serial mismatch"
-        assert error.zone_name == "example.com"
-        assert isinstance(error, NetboxPDNSError)
-
-
-class TestMQTTErrors:
-    """Test MQTT-related errors."""
-
-    def test_mqtt_connection_error(self) -> None:
-        """Test MQTT connection error."""
-        error = MQTTConnectionError("Broker unreachable")
-        assert str(error) == "Broker unreachable"
-        assert isinstance(error, NetboxPDNSError)
-
-    def test_mqtt_message_error(self) -> None:
-        """Test MQTT message error."""
-        error = MQTTMessageError("Invalid message format")
-        assert str(error) == "Invalid message format"
-        assert isinstance(error, NetboxPDNSError)
-
-
-class TestValidationError:
-    """Test validation errors."""
-
-    def test_validation_error(self) -> None:
-        """Test validation error."""
-        error = ValidationError("Invalid DNS name")
-        assert str(error) == "Invalid DNS name"
-        assert isinstance(error, NetboxPDNSError)
+def test_base_exception() -> None:
+    """Test base exception creation."""
+    error = NetboxPDNSError("Test error")
+    assert str(error) == "Test error"
+    assert isinstance(error, Exception)
+
+
+@pytest.mark.parametrize(
+    ("exc_cls", "args", "expected_str", "attrs"),
+    [
+        pytest.param(
+            ConfigurationError, ("Invalid config",), "Invalid config", {}, id="configuration"
+        ),
+        pytest.param(
+            NetboxAPIError,
+            ("Connection failed",),
+            "Connection failed",
+            {"status_code": None},
+            id="netbox-api-without-status",
+        ),
+        pytest.param(
+            NetboxAPIError,
+            ("Not found", 404),
+            "Not found",
+            {"status_code": 404},
+            id="netbox-api-with-status",
+        ),
+        pytest.param(
+            PowerDNSAPIError,
+            ("Connection failed",),
+            "Connection failed",
+            {"status_code": None},
+            id="powerdns-api-without-status",
+        ),
+        pytest.param(
+            PowerDNSAPIError,
+            ("Unauthorized", 401),
+            "Unauthorized",
+            {"status_code": 401},
+            id="powerdns-api-with-status",
+        ),
+        pytest.param(
+            ZoneNotFoundError,
+            ("example.com",),
+            "Zone not found: example.com",
+            {"zone_name": "example.com"},
+            id="zone-not-found",
+        ),
+        pytest.param(
+            ZoneSyncError,
+            ("example.com", "Serial mismatch"),
+            "Error syncing zone example.com: Serial mismatch",
+            {"zone_name": "example.com"},
+            id="zone-sync",
+        ),
+        pytest.param(
+            MQTTConnectionError, ("Broker unreachable",), "Broker unreachable", {}, id="mqtt-conn"
+        ),
+        pytest.param(
+            MQTTMessageError,
+            ("Invalid message format",),
+            "Invalid message format",
+            {},
+            id="mqtt-message",
+        ),
+        pytest.param(
+            ValidationError, ("Invalid DNS name",), "Invalid DNS name", {}, id="validation"
+        ),
+    ],
+)
+def test_exception(
+    exc_cls: type[NetboxPDNSError],
+    args: tuple[Any, ...],
+    expected_str: str,
+    attrs: dict[str, Any],
+) -> None:
+    """Test each custom exception's message, attributes and base class."""
+    error = exc_cls(*args)
+    assert str(error) == expected_str
+    assert isinstance(error, NetboxPDNSError)
+    for attr, value in attrs.items():
+        assert getattr(error, attr) == value
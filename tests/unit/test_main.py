@@ -6,35 +6,30 @@ from netbox_pdns.__main__ import main, parse_args
 
 def test_default_args() -> None:
     """Test that default arguments are set correctly."""
-    # Mock sys.argv to simulate no command line arguments
-    with patch("sys.argv", ["__main__.py"]):
-        args = parse_args()
-        assert args.host == "127.0.0.1"
-        assert args.port == 8000
+    args = parse_args([])
+    assert args.host == "127.0.0.1"
+    assert args.port == 8000
 
 
 def test_custom_host() -> None:
     """Test setting a custom host."""
-    with patch("sys.argv", ["__main__.py", "--host", "0.0.0.0"]):
-        args = parse_args()
-        assert args.host == "0.0.0.0"
-        assert args.port == 8000
+    args = parse_args(["--host", "0.0.0.0"])
+    assert args.host == "0.0.0.0"
+    assert args.port == 8000
 
 
 def test_custom_port() -> None:
     """Test setting a custom port."""
-    with patch("sys.argv", ["__main__.py", "--port", "9000"]):
-        args = parse_args()
-        assert args.host == "127.0.0.1"
-        assert args.port == 9000
+    args = parse_args(["--port", "9000"])
+    assert args.host == "127.0.0.1"
+    assert args.port == 9000
 
 
 def test_custom_host_and_port() -> None:
     """Test setting both custom host and port."""
-    with patch("sys.argv", ["__main__.py", "--host", "localhost", "--port", "8080"]):
-        args = parse_args()
-        assert args.host == "localhost"
-        assert args.port == 8080
+    args = parse_args(["--host", "localhost", "--port", "8080"])
+    assert args.host == "localhost"
+    assert args.port == 8080
 
 
 @patch("netbox_pdns.__main__.create_app")
@@ -49,13 +44,15 @@ def test_main_default_args(mock_run: Mock, mock_settings: Mock, mock_create_app:
     mock_settings_instance.log_level = "INFO"
     mock_settings.return_value = mock_settings_instance
 
-    # Mock command line arguments
-    with patch("sys.argv", ["__main__.py"]):
-        main()
+    main([])
 
     # Verify uvicorn.run was called with correct arguments
     mock_run.assert_called_once_with(mock_app, host="127.0.0.1", port=8000, log_level="info")
 
+    # Settings are loaded once and shared with the app
+    mock_settings.assert_called_once_with()
+    mock_create_app.assert_called_once_with(mock_settings_instance)
+
 
 @patch("netbox_pdns.__main__.create_app")
 @patch("netbox_pdns.__main__.Settings")
@@ -69,9 +66,7 @@ def test_main_custom_args(mock_run: Mock, mock_settings: Mock, mock_create_app:
     mock_settings_instance.log_level = "DEBUG"
     mock_settings.return_value = mock_settings_instance
 
-    # Mock command line arguments
-    with patch("sys.argv", ["__main__.py", "--host", "0.0.0.0", "--port", "9000"]):
-        main()
+    main(["--host", "0.0.0.0", "--port", "9000"])
 
     # Verify uvicorn.run was called with correct arguments
     mock_run.assert_called_once_with(mock_app, host="0.0.0.0", port=9000, log_level="debug")
@@ -6,6 +6,7 @@ They test the handler functions directly without requiring FastAPI integration.
 
 import time
 from collections.abc import Callable
+from types import SimpleNamespace
 from unittest.mock import Mock
 
 import dns.name
@@ -13,229 +14,185 @@ import pytest
 
 from netbox_pdns.mqtt_service import MQTTZoneUpdate
 
+NB_ZONE = SimpleNamespace(id=1, name="example.com")
+PDNS_ZONE = SimpleNamespace(id="example.com", name="example.com")
 
-class TestMQTTHandlers:
-    """Unit tests for MQTT message handlers."""
-
-    @pytest.fixture
-    def mock_api(self) -> Mock:
-        """Mock NetboxPDNS API instance for handler testing."""
-        mock_api = Mock()
-        mock_api.logger = Mock()
-        return mock_api
-
-    @pytest.fixture
-    def sample_zone_update(self) -> MQTTZoneUpdate:
-        """Sample zone update for testing."""
-        return MQTTZoneUpdate(
-            zone="example.com",
-            serial=2023010101,
-            event="update",
-            timestamp=time.time(),
-            nameserver_ids=[1, 2, 3],
-        )
-
-    def create_handler_function(self, mock_api: Mock) -> Callable[[MQTTZoneUpdate], None]:
-        """Create the MQTT zone update handler function for testing."""
-
-        def handle_mqtt_zone_update(zone_update: MQTTZoneUpdate) -> None:
-            """Handle MQTT zone update messages - extracted from __init__.py for testing."""
-            try:
-                if zone_update.event == "create":
-                    # For create events, get the zone from Netbox and create it
-                    nb_zone = mock_api.get_nb_zone_by_name(zone_update.zone)
-                    if nb_zone:
-                        mock_api.create_zone(nb_zone)
-                        mock_api.logger.info(f"MQTT: Created zone {zone_update.zone}")
-                    else:
-                        mock_api.logger.warning(
-                            f"MQTT: Zone {zone_update.zone} not found in Netbox"
-                        )
-
-                elif zone_update.event == "update":
-                    # For update events, sync the zone if serial numbers differ
-                    try:
-                        nb_zone = mock_api.get_nb_zone_by_name(zone_update.zone)
-                        pdns_zone = mock_api.get_pdns_zone(zone_update.zone)
-                        if nb_zone and pdns_zone:
-                            mock_api.sync_zone(nb_zone, pdns_zone)
-                            mock_api.logger.info(f"MQTT: Synced zone {zone_update.zone}")
-                        elif nb_zone and not pdns_zone:
-                            # Zone exists in Netbox but not PowerDNS, create it
-                            mock_api.create_zone(nb_zone)
-                            mock_api.logger.info(f"MQTT: Created missing zone {zone_update.zone}")
-                        else:
-                            mock_api.logger.warning(f"MQTT: Zone {zone_update.zone} not found")
-                    except Exception as e:
-                        mock_api.logger.error(f"MQTT: Error syncing zone {zone_update.zone}: {e}")
-
-                elif zone_update.event == "delete":
-                    # For delete events, remove the zone from PowerDNS
-                    try:
-                        zone_name = dns.name.from_text(zone_update.zone)
-                        mock_api.delete_zone(zone_name)
-                        mock_api.logger.info(f"MQTT: Deleted zone {zone_update.zone}")
-                    except Exception as e:
-                        mock_api.logger.error(f"MQTT: Error deleting zone {zone_update.zone}: {e}")
 
+def handle_mqtt_zone_update(api: Mock, zone_update: MQTTZoneUpdate) -> None:
+    """Handle MQTT zone update messages - extracted from __init__.py for testing."""
+    try:
+        if zone_update.event == "create":
+            # For create events, get the zone from Netbox and create it
+            nb_zone = api.get_nb_zone_by_name(zone_update.zone)
+            if nb_zone:
+                api.create_zone(nb_zone)
+                api.logger.info(f"MQTT: Created zone {zone_update.zone}")
+            else:
+                api.logger.warning(f"MQTT: Zone {zone_update.zone} not found in Netbox")
+
+        elif zone_update.event == "update":
+            # For update events, sync the zone if serial numbers differ
+            try:
+                nb_zone = api.get_nb_zone_by_name(zone_update.zone)
+                pdns_zone = api.get_pdns_zone(zone_update.zone)
+                if nb_zone and pdns_zone:
+                    api.sync_zone(nb_zone, pdns_zone)
+                    api.logger.info(f"MQTT: Synced zone {zone_update.zone}")
+                elif nb_zone and not pdns_zone:
+                    # Zone exists in Netbox but not PowerDNS, create it
+                    api.create_zone(nb_zone)
+                    api.logger.info(f"MQTT: Created missing zone {zone_update.zone}")
                 else:
-                    mock_api.logger.warning(
-                        f"MQTT: Unknown event type '{zone_update.event}' "
-                        f"for zone {zone_update.zone}"
-                    )
+                    api.logger.warning(f"MQTT: Zone {zone_update.zone} not found")
+            except Exception as e:
+                api.logger.error(f"MQTT: Error syncing zone {zone_update.zone}: {e}")
 
+        elif zone_update.event == "delete":
+            # For delete events, remove the zone from PowerDNS
+            try:
+                zone_name = dns.name.from_text(zone_update.zone)
+                api.delete_zone(zone_name)
+                api.logger.info(f"MQTT: Deleted zone {zone_update.zone}")
             except Exception as e:
-                mock_api.logger.error(
-                    f"MQTT: Error processing zone update for {zone_update.zone}: {e}"
-                )
-
-        return handle_mqtt_zone_update
-
-    def test_handler_create_event_success(
-        self, mock_api: Mock, sample_zone_update: MQTTZoneUpdate
-    ) -> None:
-        """Test handler processes create event successfully."""
-        sample_zone_update.event = "create"
-        handler = self.create_handler_function(mock_api)
-
-        # Mock successful zone lookup
-        mock_zone = Mock(id=1, name="example.com")
-        mock_api.get_nb_zone_by_name.return_value = mock_zone
-
-        # Call handler
-        handler(sample_zone_update)
-
-        # Verify correct methods called
-        mock_api.get_nb_zone_by_name.assert_called_once_with("example.com")
-        mock_api.create_zone.assert_called_once_with(mock_zone)
-        mock_api.logger.info.assert_called_with("MQTT: Created zone example.com")
-
-    def test_handler_create_event_zone_not_found(
-        self, mock_api: Mock, sample_zone_update: MQTTZoneUpdate
-    ) -> None:
-        """Test handler handles create event when zone not found in Netbox."""
-        sample_zone_update.event = "create"
-        handler = self.create_handler_function(mock_api)
-
-        # Mock zone not found
-        mock_api.get_nb_zone_by_name.return_value = None
-
-        # Call handler
-        handler(sample_zone_update)
-
-        # Verify correct methods called
-        mock_api.get_nb_zone_by_name.assert_called_once_with("example.com")
-        mock_api.create_zone.assert_not_called()
-        mock_api.logger.warning.assert_called_with("MQTT: Zone example.com not found in Netbox")
-
-    def test_handler_update_event_success(
-        self, mock_api: Mock, sample_zone_update: MQTTZoneUpdate
-    ) -> None:
-        """Test handler processes update event successfully."""
-        sample_zone_update.event = "update"
-        handler = self.create_handler_function(mock_api)
-
-        # Mock successful zone lookups
-        mock_nb_zone = Mock(id=1, name="example.com")
-        mock_pdns_zone = Mock(id="example.com", name="example.com")
-        mock_api.get_nb_zone_by_name.return_value = mock_nb_zone
-        mock_api.get_pdns_zone.return_value = mock_pdns_zone
-
-        # Call handler
-        handler(sample_zone_update)
-
-        # Verify correct methods called
-        mock_api.get_nb_zone_by_name.assert_called_once_with("example.com")
-        mock_api.get_pdns_zone.assert_called_once_with("example.com")
-        mock_api.sync_zone.assert_called_once_with(mock_nb_zone, mock_pdns_zone)
-        mock_api.logger.info.assert_called_with("MQTT: Synced zone example.com")
-
-    def test_handler_update_event_create_missing_zone(
-        self, mock_api: Mock, sample_zone_update: MQTTZoneUpdate
-    ) -> None:
-        """Test handler creates zone when it exists in Netbox but not PowerDNS."""
-        sample_zone_update.event = "update"
-        handler = self.create_handler_function(mock_api)
-
-        # Mock zone exists in Netbox but not PowerDNS
-        mock_nb_zone = Mock(id=1, name="example.com")
-        mock_api.get_nb_zone_by_name.return_value = mock_nb_zone
-        mock_api.get_pdns_zone.return_value = None
-
-        # Call handler
-        handler(sample_zone_update)
-
-        # Verify zone creation is attempted
-        mock_api.create_zone.assert_called_once_with(mock_nb_zone)
-        mock_api.logger.info.assert_called_with("MQTT: Created missing zone example.com")
-
-    def test_handler_delete_event_success(
-        self, mock_api: Mock, sample_zone_update: MQTTZoneUpdate
-    ) -> None:
-        """Test handler processes delete event successfully."""
-        sample_zone_update.event = "delete"
-        handler = self.create_handler_function(mock_api)
-
-        # Call handler
-        handler(sample_zone_update)
-
-        # Verify delete method called with DNS name object
-        mock_api.delete_zone.assert_called_once()
-        delete_arg = mock_api.delete_zone.call_args[0][0]
-        assert str(delete_arg) == "example.com."
-
-    def test_handler_delete_event_exception(
-        self, mock_api: Mock, sample_zone_update: MQTTZoneUpdate
-    ) -> None:
-        """Test handler handles delete event exceptions."""
-        sample_zone_update.event = "delete"
-        handler = self.create_handler_function(mock_api)
-
-        # Mock delete_zone to raise exception
-        mock_api.delete_zone.side_effect = Exception("PowerDNS error")
-
-        # Call handler - should not raise exception
-        handler(sample_zone_update)
-
-        # Verify error was logged
-        mock_api.logger.error.assert_called()
-        error_call = mock_api.logger.error.call_args[0][0]
-        assert "MQTT: Error deleting zone example.com" in error_call
-
-    def test_handler_unknown_event_type(
-        self, mock_api: Mock, sample_zone_update: MQTTZoneUpdate
-    ) -> None:
-        """Test handler handles unknown event types."""
-        sample_zone_update.event = "unknown_event"
-        handler = self.create_handler_function(mock_api)
-
-        # Call handler
-        handler(sample_zone_update)
-
-        # Verify warning logged
-        mock_api.logger.warning.assert_called_with(
-            "MQTT: Unknown event type 'unknown_event' for zone example.com"
-        )
-
-        # Verify no sync methods called
-        mock_api.create_zone.assert_not_called()
-        mock_api.sync_zone.assert_not_called()
-        mock_api.delete_zone.assert_not_called()
-
-    def test_handler_exception_handling(
-        self, mock_api: Mock, sample_zone_update: MQTTZoneUpdate
-    ) -> None:
-        """Test handler exception handling."""
-        sample_zone_update.event = "create"
-        handler = self.create_handler_function(mock_api)
-
-        # Mock get_nb_zone_by_name to raise exception
-        mock_api.get_nb_zone_by_name.side_effect = Exception("API Error")
-
-        # Call handler - should not raise exception
-        handler(sample_zone_update)
-
-        # Verify error was logged
-        mock_api.logger.error.assert_called()
-        error_call = mock_api.logger.error.call_args[0][0]
-        assert "MQTT: Error processing zone update for example.com" in error_call
+                api.logger.error(f"MQTT: Error deleting zone {zone_update.zone}: {e}")
+
+        else:
+            api.logger.warning(
+                f"MQTT: Unknown event type '{zone_update.event}' for zone {zone_update.zone}"
+            )
+
+    except Exception as e:
+        api.logger.error(f"MQTT: Error processing zone update for {zone_update.zone}: {e}")
+
+
+def _setup_nb_zone(api: Mock) -> None:
+    api.get_nb_zone_by_name.return_value = NB_ZONE
+
+
+def _setup_nb_zone_missing(api: Mock) -> None:
+    api.get_nb_zone_by_name.return_value = None
+
+
+def _setup_both_zones(api: Mock) -> None:
+    api.get_nb_zone_by_name.return_value = NB_ZONE
+    api.get_pdns_zone.return_value = PDNS_ZONE
+
+
+def _setup_pdns_zone_missing(api: Mock) -> None:
+    api.get_nb_zone_by_name.return_value = NB_ZONE
+    api.get_pdns_zone.return_value = None
+
+
+def _setup_delete_fails(api: Mock) -> None:
+    api.delete_zone.side_effect = Exception("PowerDNS error")
+
+
+def _setup_lookup_fails(api: Mock) -> None:
+    api.get_nb_zone_by_name.side_effect = Exception("API Error")
+
+
+def _no_setup(api: Mock) -> None:
+    pass
+
+
+def _verify_created(api: Mock) -> None:
+    api.get_nb_zone_by_name.assert_called_once_with("example.com")
+    api.create_zone.assert_called_once_with(NB_ZONE)
+    api.logger.info.assert_called_with("MQTT: Created zone example.com")
+
+
+def _verify_create_not_found(api: Mock) -> None:
+    api.get_nb_zone_by_name.assert_called_once_with("example.com")
+    api.create_zone.assert_not_called()
+    api.logger.warning.assert_called_with("MQTT: Zone example.com not found in Netbox")
+
+
+def _verify_synced(api: Mock) -> None:
+    api.get_nb_zone_by_name.assert_called_once_with("example.com")
+    api.get_pdns_zone.assert_called_once_with("example.com")
+    api.sync_zone.assert_called_once_with(NB_ZONE, PDNS_ZONE)
+    api.logger.info.assert_called_with("MQTT: Synced zone example.com")
+
+
+def _verify_created_missing(api: Mock) -> None:
+    api.create_zone.assert_called_once_with(NB_ZONE)
+    api.logger.info.assert_called_with("MQTT: Created missing zone example.com")
+
+
+def _verify_deleted(api: Mock) -> None:
+    # Delete is called with a DNS name object
+    api.delete_zone.assert_called_once()
+    delete_arg = api.delete_zone.call_args[0][0]
+    assert str(delete_arg) == "example.com."
+
+
+def _verify_delete_error_logged(api: Mock) -> None:
+    api.logger.error.assert_called()
+    assert "MQTT: Error deleting zone example.com" in api.logger.error.call_args[0][0]
+
+
+def _verify_unknown_event(api: Mock) -> None:
+    api.logger.warning.assert_called_with(
+        "MQTT: Unknown event type 'unknown_event' for zone example.com"
+    )
+    api.create_zone.assert_not_called()
+    api.sync_zone.assert_not_called()
+    api.delete_zone.assert_not_called()
+
+
+def _verify_processing_error_logged(api: Mock) -> None:
+    api.logger.error.assert_called()
+    assert "MQTT: Error processing zone update for example.com" in api.logger.error.call_args[0][0]
+
+
+HANDLER_CASES = [
+    pytest.param("create", _setup_nb_zone, _verify_created, id="create-success"),
+    pytest.param(
+        "create", _setup_nb_zone_missing, _verify_create_not_found, id="create-zone-not-found"
+    ),
+    pytest.param("update", _setup_both_zones, _verify_synced, id="update-success"),
+    pytest.param(
+        "update", _setup_pdns_zone_missing, _verify_created_missing, id="update-create-missing"
+    ),
+    pytest.param("delete", _no_setup, _verify_deleted, id="delete-success"),
+    pytest.param("delete", _setup_delete_fails, _verify_delete_error_logged, id="delete-exception"),
+    pytest.param("unknown_event", _no_setup, _verify_unknown_event, id="unknown-event"),
+    pytest.param(
+        "create", _setup_lookup_fails, _verify_processing_error_logged, id="exception-handling"
+    ),
+]
+
+
+@pytest.fixture
+def mock_api(netbox_pdns_spec: Mock) -> Mock:
+    """The shared NetboxPDNS mock with any earlier test's calls and results cleared."""
+    netbox_pdns_spec.reset_mock(return_value=True, side_effect=True)
+    return netbox_pdns_spec
+
+
+@pytest.fixture(scope="module")
+def sample_zone_update() -> MQTTZoneUpdate:
+    """Sample zone update for testing."""
+    return MQTTZoneUpdate(
+        zone="example.com",
+        serial=2023010101,
+        event="update",
+        timestamp=time.time(),
+        nameserver_ids=[1, 2, 3],
+    )
+
+
+@pytest.mark.parametrize(("event", "setup_fn", "verify_fn"), HANDLER_CASES)
+def test_handler_event(
+    mock_api: Mock,
+    sample_zone_update: MQTTZoneUpdate,
+    event: str,
+    setup_fn: Callable[[Mock], None],
+    verify_fn: Callable[[Mock], None],
+) -> None:
+    """Test handler dispatch for each event type; errors are logged, never raised."""
+    setup_fn(mock_api)
+
+    handle_mqtt_zone_update(mock_api, sample_zone_update.model_copy(update={"event": event}))
+
+    verify_fn(mock_api)
@@ -1,14 +1,50 @@
 import asyncio
-import json
+import logging
+import threading
 import time
+from collections.abc import Iterator
+from types import SimpleNamespace
+from typing import Any, cast
 from unittest.mock import Mock, patch
 
+import orjson
+import paho.mqtt.client as mqtt
 import pytest
+from paho.mqtt.packettypes import PacketTypes
+from paho.mqtt.reasoncodes import ReasonCode
 from pydantic import ValidationError as PydanticValidationError
 
 from netbox_pdns.exceptions import MQTTConnectionError, ValidationError
 from netbox_pdns.models import Settings
-from netbox_pdns.mqtt_service import MQTTService, MQTTZoneUpdate
+from netbox_pdns.mqtt_service import (
+    MQTT_BATCH_WINDOW,
+    MQTT_EVENT_TYPES,
+    MQTTService,
+    MQTTZoneUpdate,
+)
+
+# Passed for paho callback arguments the service never reads
+UNUSED: Any = None
+
+# The model tests don't check message age, so they share one timestamp
+FIXED_TIMESTAMP = 1_700_000_000.0
+
+UPDATE_TOPIC = "test/zones/example.com/update"
+ZONE_UPDATE_TEMPLATE: dict[str, Any] = {
+    "zone": "example.com",
+    "serial": 2023010101,
+    "event": "update",
+}
+
+
+def zone_update_payload(**fields: Any) -> bytes:
+    """Encode a current zone update message, overriding the template's fields"""
+    return orjson.dumps({**ZONE_UPDATE_TEMPLATE, "timestamp": int(time.time()), **fields})
+
+
+def make_message(topic: str, payload: bytes = b"") -> mqtt.MQTTMessage:
+    """Stand-in for the paho message, _on_message only reads its topic and payload"""
+    return cast(mqtt.MQTTMessage, SimpleNamespace(topic=topic, payload=payload))
 
 
 class TestMQTTZoneUpdate:
@@ -16,12 +52,11 @@ class TestMQTTZoneUpdate:
 
     def test_valid_zone_update(self) -> None:
         """Test creating a valid zone update"""
-        timestamp = time.time()
         update = MQTTZoneUpdate(
             zone="example.com",
             serial=2023010101,
             event="update",
-            timestamp=timestamp,
+            timestamp=FIXED_TIMESTAMP,
             nameserver_ids=[1, 2, 3],
         )
         assert update.zone == "example.com"
@@ -31,30 +66,42 @@ class TestMQTTZoneUpdate:
 
     def test_zone_update_without_nameserver_ids(self) -> None:
         """Test zone update without nameserver IDs (optional field)"""
-        timestamp = time.time()
         update = MQTTZoneUpdate(
             zone="example.com",
             serial=2023010101,
             event="create",
-            timestamp=timestamp,
+            timestamp=FIXED_TIMESTAMP,
         )
         assert update.nameserver_ids is None
 
+    def test_zone_update_shares_known_events(self) -> None:
+        """Test that known event types reuse the shared strings and unknown ones pass through"""
+        update = MQTTZoneUpdate.model_validate_json(
+            b'{"zone": "example.com", "serial": 1, "event": "delete", "timestamp": 0}'
+        )
+        assert update.event is MQTT_EVENT_TYPES["delete"]
+
+        update = MQTTZoneUpdate.model_validate_json(
+            b'{"zone": "example.com", "serial": 1, "event": "bogus", "timestamp": 0}'
+        )
+        assert update.event == "bogus"
+        assert "bogus" not in MQTT_EVENT_TYPES
+
     def test_invalid_zone_update_missing_required_field(self) -> None:
         """Test zone update with missing required field"""
-        timestamp = time.time()
-
         with pytest.raises(PydanticValidationError):
             # Missing 'event' field should raise validation error
             MQTTZoneUpdate(
                 zone="example.com",
                 serial=2023010101,
-                timestamp=timestamp,
+                timestamp=FIXED_TIMESTAMP,
             )  # type: ignore[call-arg]
 
     def test_validate_zone_name(self) -> None:
         """Test zone name validation"""
-        update = MQTTZoneUpdate(zone="example.com", serial=1, event="create", timestamp=time.time())
+        update = MQTTZoneUpdate(
+            zone="example.com", serial=1, event="create", timestamp=FIXED_TIMESTAMP
+        )
 
         # Valid zone name should not raise
         update.validate_zone_name()
@@ -65,44 +112,55 @@ class TestMQTTZoneUpdate:
             update.validate_zone_name()
 
 
-class TestMQTTService:
-    """Test the MQTTService class"""
+@pytest.fixture(scope="module")
+def paho_client_class() -> Iterator[Mock]:
+    """Patch the paho client once per module, so no service test can open a real connection"""
+    with patch("paho.mqtt.client.Client") as mock_client_class:
+        yield mock_client_class
+
+
+# Derived from the session's validated settings without revalidating; the overrides are
+# already in the form their validators return
+@pytest.fixture(scope="module")
+def mqtt_settings(prebuilt_settings: Settings) -> Settings:
+    """MQTT-enabled settings, shared by the module since Settings are frozen"""
+    return prebuilt_settings.model_copy(
+        update={
+            "mqtt_enabled": True,
+            "mqtt_broker_url": "mqtt://localhost:1883",
+            "mqtt_client_id": "test-client",
+            "mqtt_topic_prefix": "test/zones",
+            "mqtt_qos": 1,
+        }
+    )
 
-    @pytest.fixture
-    def mqtt_settings(self) -> Settings:
-        """Create MQTT-enabled settings for testing"""
-        return Settings(
-            api_key="test_key",
-            nb_url="https://netbox.example.com",
-            nb_token="nb_token",
-            nb_ns_id=1,
-            pdns_url="https://pdns.example.com",
-            pdns_token="pdns_token",
-            mqtt_enabled=True,
-            mqtt_broker_url="mqtt://localhost:1883",
-            mqtt_client_id="test-client",
-            mqtt_topic_prefix="test/zones",
-            mqtt_qos=1,
-        )
 
-    @pytest.fixture
-    def disabled_mqtt_settings(self) -> Settings:
-        """Create MQTT-disabled settings for testing"""
-        return Settings(
-            api_key="test_key",
-            nb_url="https://netbox.example.com",
-            nb_token="nb_token",
-            nb_ns_id=1,
-            pdns_url="https://pdns.example.com",
-            pdns_token="pdns_token",
-            mqtt_enabled=False,
-        )
+@pytest.fixture(scope="module")
+def disabled_mqtt_settings(prebuilt_settings: Settings) -> Settings:
+    """MQTT-disabled settings, shared by the module since Settings are frozen"""
+    return prebuilt_settings.model_copy(update={"mqtt_enabled": False})
+
+
+@pytest.fixture(scope="module")
+def shared_service(mqtt_settings: Settings) -> MQTTService:
+    """Service for tests that only read its state, built once per module"""
+    return MQTTService(mqtt_settings, Mock())
+
+
+class TestMQTTService:
+    """Test the MQTTService class"""
 
     @pytest.fixture
     def mock_zone_handler(self) -> Mock:
         """Create a mock zone handler function"""
         return Mock()
 
+    @pytest.fixture(autouse=True)
+    def mock_client_class(self, paho_client_class: Mock) -> Mock:
+        """The patched paho client class, cleared of the previous test's calls"""
+        paho_client_class.reset_mock(return_value=True, side_effect=True)
+        return paho_client_class
+
     def test_init(self, mqtt_settings: Settings, mock_zone_handler: Mock) -> None:
         """Test MQTT service initialization"""
         service = MQTTService(mqtt_settings, mock_zone_handler)
@@ -113,18 +171,18 @@ class TestMQTTService:
         assert service.connected is False
         assert service.reconnect_delay == mqtt_settings.mqtt_reconnect_delay
 
-    def test_parse_broker_url_mqtt(self, mqtt_settings: Settings, mock_zone_handler: Mock) -> None:
+    def test_parse_broker_url_mqtt(self, shared_service: MQTTService) -> None:
         """Test parsing MQTT broker URL"""
-        service = MQTTService(mqtt_settings, mock_zone_handler)
-
-        host, port, use_tls = service._parse_broker_url()
+        host, port, use_tls = shared_service._parse_broker_url()
         assert host == "localhost"
         assert port == 1883
         assert use_tls is False
 
     def test_parse_broker_url_mqtts(self, mqtt_settings: Settings, mock_zone_handler: Mock) -> None:
         """Test parsing MQTTS broker URL"""
-        mqtt_settings.mqtt_broker_url = "mqtts://secure.broker:8883"
+        mqtt_settings = mqtt_settings.model_copy(
+            update={"mqtt_broker_url": "mqtts://secure.broker:8883"}
+        )
         service = MQTTService(mqtt_settings, mock_zone_handler)
 
         host, port, use_tls = service._parse_broker_url()
@@ -136,26 +194,26 @@ class TestMQTTService:
         self, mqtt_settings: Settings, mock_zone_handler: Mock
     ) -> None:
         """Test parsing invalid broker URL scheme"""
-        mqtt_settings.mqtt_broker_url = "http://invalid.broker"
+        mqtt_settings = mqtt_settings.model_copy(
+            update={"mqtt_broker_url": "http://invalid.broker"}
+        )
         service = MQTTService(mqtt_settings, mock_zone_handler)
 
         with pytest.raises(MQTTConnectionError, match="Unsupported MQTT scheme"):
             service._parse_broker_url()
 
     def test_start_disabled(
-        self, disabled_mqtt_settings: Settings, mock_zone_handler: Mock
+        self, mock_client_class: Mock, disabled_mqtt_settings: Settings, mock_zone_handler: Mock
     ) -> None:
         """Test starting MQTT service when disabled"""
         service = MQTTService(disabled_mqtt_settings, mock_zone_handler)
 
-        with patch("paho.mqtt.client.Client") as mock_client_class:
-            service.start()
+        service.start()
 
-            # Should not create MQTT client when disabled
-            mock_client_class.assert_not_called()
-            assert service.client is None
+        # Should not create MQTT client when disabled
+        mock_client_class.assert_not_called()
+        assert service.client is None
 
-    @patch("paho.mqtt.client.Client")
     def test_start_enabled(
         self, mock_client_class: Mock, mqtt_settings: Settings, mock_zone_handler: Mock
     ) -> None:
@@ -181,13 +239,13 @@ class TestMQTTService:
         mock_client.connect.assert_called_once_with("localhost", 1883, keepalive=60)
         mock_client.loop_start.assert_called_once()
 
-    @patch("paho.mqtt.client.Client")
     def test_start_with_auth(
         self, mock_client_class: Mock, mqtt_settings: Settings, mock_zone_handler: Mock
     ) -> None:
         """Test starting MQTT service with authentication"""
-        mqtt_settings.mqtt_username = "testuser"
-        mqtt_settings.mqtt_password = "testpass"  # noqa: S105
+        mqtt_settings = mqtt_settings.model_copy(
+            update={"mqtt_username": "testuser", "mqtt_password": "testpass"}  # noqa: S105
+        )
 
         mock_client = Mock()
         mock_client_class.return_value = mock_client
@@ -198,12 +256,13 @@ class TestMQTTService:
         # Verify authentication is configured
         mock_client.username_pw_set.assert_called_once_with("testuser", "testpass")
 
-    @patch("paho.mqtt.client.Client")
     def test_start_with_tls(
         self, mock_client_class: Mock, mqtt_settings: Settings, mock_zone_handler: Mock
     ) -> None:
         """Test starting MQTT service with TLS"""
-        mqtt_settings.mqtt_broker_url = "mqtts://secure.broker:8883"
+        mqtt_settings = mqtt_settings.model_copy(
+            update={"mqtt_broker_url": "mqtts://secure.broker:8883"}
+        )
 
         mock_client = Mock()
         mock_client_class.return_value = mock_client
@@ -237,14 +296,15 @@ class TestMQTTService:
         # Should not raise exception
         service.stop()
 
-    def test_is_connected(self, mqtt_settings: Settings, mock_zone_handler: Mock) -> None:
+    def test_is_connected(
+        self, shared_service: MQTTService, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test connection status check"""
-        service = MQTTService(mqtt_settings, mock_zone_handler)
+        assert shared_service.is_connected() is False
 
-        assert service.is_connected() is False
-
-        service.connected = True
-        assert service.is_connected() is True
+        # Restored after the test, so the shared service stays disconnected
+        monkeypatch.setattr(shared_service, "connected", True)
+        assert shared_service.is_connected() is True
 
     @pytest.mark.asyncio
     async def test_wait_for_connection_disabled(
@@ -264,14 +324,25 @@ class TestMQTTService:
         """Test waiting for connection success"""
         service = MQTTService(mqtt_settings, mock_zone_handler)
 
-        # Simulate connection after short delay
-        async def connect_after_delay() -> None:
-            await asyncio.sleep(0.1)
-            service.connected = True
-
-        asyncio.create_task(connect_after_delay())
+        # Simulate the paho network thread connecting once the wait has started
+        connect_thread = threading.Thread(
+            target=service._on_connect, args=(Mock(), None, UNUSED, 0, None)
+        )
+        asyncio.get_running_loop().call_soon(connect_thread.start)
 
         result = await service.wait_for_connection(connection_timeout=1.0)
+        connect_thread.join()
+        assert result is True
+
+    @pytest.mark.asyncio
+    async def test_wait_for_connection_already_connected(
+        self, mqtt_settings: Settings, mock_zone_handler: Mock
+    ) -> None:
+        """Test waiting returns at once when the service is already connected"""
+        service = MQTTService(mqtt_settings, mock_zone_handler)
+        service.connected = True
+
+        result = await service.wait_for_connection(connection_timeout=0)
         assert result is True
 
     @pytest.mark.asyncio
@@ -280,17 +351,28 @@ class TestMQTTService:
     ) -> None:
         """Test waiting for connection timeout"""
         service = MQTTService(mqtt_settings, mock_zone_handler)
-        # Don't set connected = True
+        # Don't set connected = True, a zero timeout gives up without waiting in real time
 
-        result = await service.wait_for_connection(connection_timeout=0.1)
+        result = await service.wait_for_connection(connection_timeout=0)
         assert result is False
 
-    def test_get_status(self, mqtt_settings: Settings, mock_zone_handler: Mock) -> None:
-        """Test getting service status"""
+    def test_on_log_level_mapping(self, mqtt_settings: Settings, mock_zone_handler: Mock) -> None:
+        """Test paho log messages are forwarded at the matching level when enabled"""
         service = MQTTService(mqtt_settings, mock_zone_handler)
-        service.connected = True
+        service.logger = Mock()
+        service.logger.isEnabledFor.side_effect = lambda level: level >= logging.INFO
+
+        service._on_log(UNUSED, None, mqtt.MQTT_LOG_DEBUG, "packet sent")
+        service.logger.log.assert_not_called()
+
+        service._on_log(UNUSED, None, mqtt.MQTT_LOG_ERR, "connection lost")
+        service.logger.log.assert_called_once_with(logging.ERROR, "MQTT: %s", "connection lost")
+
+    def test_get_status(self, shared_service: MQTTService, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test getting service status"""
+        monkeypatch.setattr(shared_service, "connected", True)
 
-        status = service.get_status()
+        status = shared_service.get_status()
 
         expected = {
             "enabled": True,
@@ -307,7 +389,7 @@ class TestMQTTService:
         service = MQTTService(mqtt_settings, mock_zone_handler)
         mock_client = Mock()
 
-        service._on_connect(mock_client, None, {}, 0)
+        service._on_connect(mock_client, None, UNUSED, 0, None)
 
         assert service.connected is True
         mock_client.subscribe.assert_called_once_with("test/zones/+/+", qos=1)
@@ -317,37 +399,61 @@ class TestMQTTService:
         service = MQTTService(mqtt_settings, mock_zone_handler)
         mock_client = Mock()
 
-        service._on_connect(mock_client, None, {}, 4)  # Bad username/password
+        service._on_connect(mock_client, None, UNUSED, 4, None)  # Bad username/password
 
         assert service.connected is False
         mock_client.subscribe.assert_not_called()
 
+    def test_on_connect_failure_reason_code(
+        self, mqtt_settings: Settings, mock_zone_handler: Mock
+    ) -> None:
+        """Test failed MQTT v5 connection callback reports the reason code"""
+        service = MQTTService(mqtt_settings, mock_zone_handler)
+        service.logger = Mock()
+        mock_client = Mock()
+
+        rc = ReasonCode(PacketTypes.CONNACK, identifier=135)
+        service._on_connect(mock_client, None, UNUSED, rc, None)
+
+        assert service.connected is False
+        mock_client.subscribe.assert_not_called()
+        service.logger.error.assert_called_once_with(
+            "Failed to connect to MQTT broker: Connection refused - Not authorized"
+        )
+
     def test_on_disconnect(self, mqtt_settings: Settings, mock_zone_handler: Mock) -> None:
         """Test MQTT disconnection callback"""
         service = MQTTService(mqtt_settings, mock_zone_handler)
         service.connected = True
 
-        service._on_disconnect(Mock(), None, 0)  # Clean disconnect
+        service._on_disconnect(UNUSED, None, UNUSED, 0, None)  # Clean disconnect
         assert service.connected is False
 
+    def test_on_disconnect_reason_code(
+        self, mqtt_settings: Settings, mock_zone_handler: Mock
+    ) -> None:
+        """Test MQTT v5 disconnection reason codes as passed by paho"""
+        service = MQTTService(mqtt_settings, mock_zone_handler)
+        flags = mqtt.DisconnectFlags(is_disconnect_packet_from_server=True)
+
+        with patch.object(service.logger, "info") as mock_info:
+            service._on_disconnect(UNUSED, None, flags, ReasonCode(PacketTypes.DISCONNECT), None)
+        mock_info.assert_called_once_with("Disconnected from MQTT broker")
+
+        rc = ReasonCode(PacketTypes.DISCONNECT, "Unspecified error")
+        with patch.object(service.logger, "warning") as mock_warning:
+            service._on_disconnect(UNUSED, None, flags, rc, None)
+        mock_warning.assert_called_once_with(
+            "Unexpected disconnection from MQTT broker (code: Unspecified error)"
+        )
+
     def test_on_message_valid(self, mqtt_settings: Settings, mock_zone_handler: Mock) -> None:
         """Test processing valid MQTT message"""
         service = MQTTService(mqtt_settings, mock_zone_handler)
 
-        # Create mock message
-        mock_message = Mock()
-        mock_message.topic = "test/zones/example.com/update"
-        mock_message.payload.decode.return_value = json.dumps(
-            {
-                "zone": "example.com",
-                "serial": 2023010101,
-                "event": "update",
-                "timestamp": time.time(),
-                "nameserver_ids": [1, 2],
-            }
-        )
+        mock_message = make_message(UPDATE_TOPIC, zone_update_payload(nameserver_ids=[1, 2]))
 
-        service._on_message(Mock(), None, mock_message)
+        service._on_message(UNUSED, None, mock_message)
 
         # Verify handler was called
         mock_zone_handler.assert_called_once()
@@ -356,17 +462,93 @@ class TestMQTTService:
         assert called_update.zone == "example.com"
         assert called_update.event == "update"
 
+    @pytest.mark.asyncio
+    async def test_on_message_queued_updates_coalesced(
+        self, mock_client_class: Mock, mqtt_settings: Settings, mock_zone_handler: Mock
+    ) -> None:
+        """Test that a burst of updates started from the event loop is coalesced per zone"""
+        service = MQTTService(mqtt_settings, mock_zone_handler)
+        service.start()
+
+        def message(zone: str, event: str, serial: int) -> mqtt.MQTTMessage:
+            return make_message(
+                f"test/zones/{zone}/{event}",
+                zone_update_payload(zone=zone, serial=serial, event=event),
+            )
+
+        for mock_message in (
+            message("example.com", "update", 2),
+            message("example.org", "delete", 1),
+            message("example.com", "update", 1),
+            message("example.com", "update", 3),
+        ):
+            service._on_message(UNUSED, None, mock_message)
+
+        # Updates are handed to the consumer task rather than handled inline
+        mock_zone_handler.assert_not_called()
+        await asyncio.sleep(MQTT_BATCH_WINDOW + 0.2)
+        service.stop()
+
+        handled = [(c.args[0].zone, c.args[0].serial) for c in mock_zone_handler.call_args_list]
+        assert handled == [("example.org", 1), ("example.com", 3)]
+
+    @pytest.mark.asyncio
+    async def test_shutdown_drains_queued_updates(
+        self, mock_client_class: Mock, mqtt_settings: Settings, mock_zone_handler: Mock
+    ) -> None:
+        """Test that shutdown handles updates still queued instead of dropping them"""
+        service = MQTTService(mqtt_settings, mock_zone_handler)
+        service.start()
+        service._on_message(UNUSED, None, make_message(UPDATE_TOPIC, zone_update_payload()))
+
+        await service.shutdown(drain_timeout=5.0)
+
+        mock_zone_handler.assert_called_once()
+        mock_client_class.return_value.loop_stop.assert_called_once()
+        assert service._consumer_task is None
+
+    @pytest.mark.asyncio
+    async def test_stop_logs_dropped_updates(
+        self, mock_client_class: Mock, mqtt_settings: Settings, mock_zone_handler: Mock
+    ) -> None:
+        """Test that stopping with updates still queued logs how many are dropped"""
+        service = MQTTService(mqtt_settings, mock_zone_handler)
+        service.start()
+        for serial in (1, 2):
+            service._on_message(
+                UNUSED, None, make_message(UPDATE_TOPIC, zone_update_payload(serial=serial))
+            )
+        # Let the queueing callbacks run; the consumer may already hold the first update
+        await asyncio.sleep(0)
+
+        with patch.object(service.logger, "warning") as mock_warning:
+            service.stop()
+
+        mock_warning.assert_called_once_with("Dropping 2 queued MQTT zone updates on shutdown")
+        mock_zone_handler.assert_not_called()
+
     def test_on_message_invalid_topic(
         self, mqtt_settings: Settings, mock_zone_handler: Mock
     ) -> None:
         """Test processing message with invalid topic"""
         service = MQTTService(mqtt_settings, mock_zone_handler)
 
-        # Create mock message with invalid topic
-        mock_message = Mock()
-        mock_message.topic = "invalid/topic"
+        mock_message = make_message("invalid/topic")
 
-        service._on_message(Mock(), None, mock_message)
+        service._on_message(UNUSED, None, mock_message)
+
+        # Handler should not be called
+        mock_zone_handler.assert_not_called()
+
+    def test_on_message_topic_missing_event(
+        self, mqtt_settings: Settings, mock_zone_handler: Mock
+    ) -> None:
+        """Test processing message whose topic lacks the event segment"""
+        service = MQTTService(mqtt_settings, mock_zone_handler)
+
+        mock_message = make_message("test/zones/example.com")
+
+        service._on_message(UNUSED, None, mock_message)
 
         # Handler should not be called
         mock_zone_handler.assert_not_called()
@@ -377,33 +559,65 @@ class TestMQTTService:
         """Test processing message with invalid JSON"""
         service = MQTTService(mqtt_settings, mock_zone_handler)
 
-        # Create mock message with invalid JSON
-        mock_message = Mock()
-        mock_message.topic = "test/zones/example.com/update"
-        mock_message.payload.decode.return_value = "invalid json"
+        mock_message = make_message(UPDATE_TOPIC, b"invalid json")
 
-        service._on_message(Mock(), None, mock_message)
+        service._on_message(UNUSED, None, mock_message)
 
         # Handler should not be called
         mock_zone_handler.assert_not_called()
 
+    def test_on_message_non_utf8_payload(
+        self, mqtt_settings: Settings, mock_zone_handler: Mock
+    ) -> None:
+        """Test that raw payload bytes which are not UTF-8 are rejected as invalid JSON"""
+        service = MQTTService(mqtt_settings, mock_zone_handler)
+
+        mock_message = make_message(UPDATE_TOPIC, b'{"zone": "\xff"}')
+
+        with patch.object(service.logger, "error") as mock_error:
+            service._on_message(UNUSED, None, mock_message)
+
+        mock_zone_handler.assert_not_called()
+        assert mock_error.call_args[0][0].startswith("Failed to parse JSON payload")
+
+    @pytest.mark.parametrize("payload", [b"", b"invalid json", b"[]", b"\xef\xbb\xbf{}"])
+    def test_on_message_payload_not_object(
+        self, payload: bytes, mqtt_settings: Settings, mock_zone_handler: Mock
+    ) -> None:
+        """Test that empty and non-object payloads are rejected before JSON parsing"""
+        service = MQTTService(mqtt_settings, mock_zone_handler)
+
+        mock_message = make_message(UPDATE_TOPIC, payload)
+
+        with patch.object(MQTTZoneUpdate, "model_validate_json") as mock_validate:
+            service._on_message(UNUSED, None, mock_message)
+
+        mock_validate.assert_not_called()
+        mock_zone_handler.assert_not_called()
+
     def test_on_message_invalid_zone_update(
         self, mqtt_settings: Settings, mock_zone_handler: Mock
     ) -> None:
         """Test processing message with invalid zone update format"""
         service = MQTTService(mqtt_settings, mock_zone_handler)
 
-        # Create mock message with missing required fields
-        mock_message = Mock()
-        mock_message.topic = "test/zones/example.com/update"
-        mock_message.payload.decode.return_value = json.dumps(
-            {
-                "zone": "example.com",
-                # Missing 'serial', 'event', 'timestamp'
-            }
-        )
+        # Missing 'serial', 'event', 'timestamp'
+        mock_message = make_message(UPDATE_TOPIC, b'{"zone": "example.com"}')
 
-        service._on_message(Mock(), None, mock_message)
+        service._on_message(UNUSED, None, mock_message)
+
+        # Handler should not be called
+        mock_zone_handler.assert_not_called()
+
+    def test_on_message_invalid_field_types(
+        self, mqtt_settings: Settings, mock_zone_handler: Mock
+    ) -> None:
+        """Test processing message whose fields have the wrong types"""
+        service = MQTTService(mqtt_settings, mock_zone_handler)
+
+        mock_message = make_message(UPDATE_TOPIC, zone_update_payload(serial="not-a-serial"))
+
+        service._on_message(UNUSED, None, mock_message)
 
         # Handler should not be called
         mock_zone_handler.assert_not_called()
@@ -414,19 +628,10 @@ class TestMQTTService:
         """Test processing message with zone name mismatch"""
         service = MQTTService(mqtt_settings, mock_zone_handler)
 
-        # Create mock message with mismatched zone names
-        mock_message = Mock()
-        mock_message.topic = "test/zones/example.com/update"
-        mock_message.payload.decode.return_value = json.dumps(
-            {
-                "zone": "different.com",  # Different from topic
-                "serial": 2023010101,
-                "event": "update",
-                "timestamp": time.time(),
-            }
-        )
+        # Zone name in the payload differs from the topic
+        mock_message = make_message(UPDATE_TOPIC, zone_update_payload(zone="different.com"))
 
-        service._on_message(Mock(), None, mock_message)
+        service._on_message(UNUSED, None, mock_message)
 
         # Handler should not be called
         mock_zone_handler.assert_not_called()
@@ -435,19 +640,15 @@ class TestMQTTService:
         """Test processing old message (should be ignored)"""
         service = MQTTService(mqtt_settings, mock_zone_handler)
 
-        # Create mock message with old timestamp (older than 5 minutes)
-        mock_message = Mock()
-        mock_message.topic = "test/zones/example.com/update"
-        mock_message.payload.decode.return_value = json.dumps(
-            {
-                "zone": "example.com",
-                "serial": 2023010101,
-                "event": "update",
-                "timestamp": time.time() - 400,  # 400 seconds ago
-            }
+        # Old timestamp (older than 5 minutes)
+        mock_message = make_message(
+            UPDATE_TOPIC, zone_update_payload(timestamp=int(time.time()) - 400)
         )
 
-        service._on_message(Mock(), None, mock_message)
+        with patch.object(MQTTZoneUpdate, "validate_zone_name") as mock_validate:
+            service._on_message(UNUSED, None, mock_message)
 
-        # Handler should not be called for old messages
+        # Handler should not be called for old messages, which are dropped before the
+        # zone name is parsed
         mock_zone_handler.assert_not_called()
+        mock_validate.assert_not_called()
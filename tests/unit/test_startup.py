@@ -4,120 +4,142 @@ These tests verify that the application starts up properly without blocking
 the event loop and that status endpoints work correctly.
 """
 
-import time
-from unittest.mock import AsyncMock, Mock, patch
+import asyncio
+import threading
+from collections.abc import AsyncIterator
+from typing import Any
+from unittest.mock import Mock, create_autospec
 
+import httpx
 import pytest
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from fastapi import FastAPI, Request
+from fastapi.routing import APIRoute
 from fastapi.testclient import TestClient
 
+from netbox_pdns import create_app
+from netbox_pdns.models import Settings
+
+
+def patch_services(mp: pytest.MonkeyPatch, api: Mock, scheduler: Mock, mqtt_service: Mock) -> None:
+    """Have the service classes create_app looks up return the given mocks"""
+    mp.setattr("netbox_pdns.NetboxPDNS", Mock(return_value=api))
+    mp.setattr("netbox_pdns.AsyncIOScheduler", Mock(return_value=scheduler))
+    mp.setattr("netbox_pdns.MQTTService", Mock(return_value=mqtt_service))
+
+
+@pytest.fixture
+def mock_api(netbox_pdns_spec: Mock, prebuilt_settings: Settings) -> Mock:
+    """The shared NetboxPDNS mock, reset to a successful sync with MQTT disabled."""
+    netbox_pdns_spec.reset_mock(return_value=True, side_effect=True)
+    netbox_pdns_spec.configure_mock(
+        config=prebuilt_settings, **{"full_sync.return_value": {"result": "success"}}
+    )
+    return netbox_pdns_spec
+
+
+@pytest.fixture(scope="session")
+def scheduler_spec() -> Mock:
+    """AsyncIOScheduler mock with the real interface, specced once per session."""
+    spec: Mock = create_autospec(AsyncIOScheduler, instance=True)
+    return spec
+
+
+@pytest.fixture
+def mock_scheduler(scheduler_spec: Mock) -> Mock:
+    """The shared scheduler mock, reset to a running scheduler without jobs."""
+    scheduler_spec.reset_mock(return_value=True, side_effect=True)
+    scheduler_spec.configure_mock(running=True, **{"get_jobs.return_value": []})
+    return scheduler_spec
+
+
+@pytest.fixture(scope="module")
+def status_app(netbox_pdns_spec: Mock, scheduler_spec: Mock, mqtt_service_spec: Mock) -> FastAPI:
+    """One app shared by the status tests, which only read state per request"""
+    with pytest.MonkeyPatch.context() as mp:
+        patch_services(mp, netbox_pdns_spec, scheduler_spec, mqtt_service_spec)
+        return create_app()
+
+
+def in_process_client(app: FastAPI) -> httpx.AsyncClient:
+    """Client for the app without TestClient's portal thread or lifespan"""
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+@pytest.fixture
+async def status_client(status_app: FastAPI) -> AsyncIterator[httpx.AsyncClient]:
+    """In-process client for the shared status app"""
+    async with in_process_client(status_app) as client:
+        yield client
+
+
+@pytest.fixture(scope="module")
+def status_payload(
+    status_app: FastAPI, netbox_pdns_spec: Mock, scheduler_spec: Mock, prebuilt_settings: Settings
+) -> dict[str, Any]:
+    """One /status payload with MQTT disabled, shared by the tests that only inspect it"""
+    netbox_pdns_spec.configure_mock(config=prebuilt_settings)
+    scheduler_spec.configure_mock(running=True, **{"get_jobs.return_value": ["job1", "job2"]})
+
+    # Call the route's endpoint directly, the MQTT status test covers the HTTP wiring
+    endpoint = next(
+        route.endpoint
+        for route in status_app.routes
+        if isinstance(route, APIRoute) and route.path == "/status"
+    )
+    request = Request(
+        {
+            "type": "http",
+            "app": status_app,
+            "method": "GET",
+            "path": "/status",
+            "headers": [],
+            "query_string": b"",
+            "client": ("127.0.0.1", 0),
+        }
+    )
+    payload: dict[str, Any] = asyncio.run(endpoint(request=request))
+    return payload
+
+
+@pytest.fixture
+def patched_services(
+    monkeypatch: pytest.MonkeyPatch, mock_api: Mock, mock_scheduler: Mock, mock_mqtt_service: Mock
+) -> None:
+    """Have create_app build its services from the freshly reset shared mocks"""
+    patch_services(monkeypatch, mock_api, mock_scheduler, mock_mqtt_service)
+
 
 class TestStartupBehavior:
     """Unit tests for startup behavior."""
 
-    @pytest.fixture
-    def mock_netbox_pdns(self) -> Mock:
-        """Mock NetboxPDNS instance for testing."""
-        mock_api = Mock()
-        mock_api.config = Mock()
-        mock_api.config.mqtt_enabled = False
-        mock_api.config.sync_crontab = "0 */6 * * *"
-        mock_api.logger = Mock()
-        mock_api._operation_lock_with_logging = Mock()
-        mock_api.full_sync = Mock(return_value={"result": "success"})
-        return mock_api
-
-    @pytest.fixture
-    def mock_mqtt_service(self) -> Mock:
-        """Mock MQTT service for testing."""
-        mock_service = Mock()
-        mock_service.get_status = Mock(return_value={"enabled": False})
-        return mock_service
-
-    @patch("netbox_pdns.NetboxPDNS")
-    @patch("netbox_pdns.MQTTService")
-    @patch("netbox_pdns.BackgroundScheduler")
-    def test_app_starts_without_blocking(
-        self,
-        mock_scheduler_class: Mock,
-        mock_mqtt_service_class: Mock,
-        mock_netbox_pdns_class: Mock,
-    ) -> None:
+    @pytest.mark.usefixtures("patched_services")
+    def test_app_starts_without_blocking(self, mock_api: Mock) -> None:
         """Test that the app starts without blocking on full_sync."""
-        # Setup mocks
-        mock_api = Mock()
-        mock_api.config.mqtt_enabled = False
-        mock_api.config.sync_crontab = "0 */6 * * *"
-        mock_api.logger = Mock()
-        mock_api._operation_lock_with_logging = Mock()
-        mock_api.full_sync = Mock()
-        mock_netbox_pdns_class.return_value = mock_api
-
-        mock_scheduler = Mock()
-        mock_scheduler.running = True
-        mock_scheduler.get_jobs = Mock(return_value=[])
-        mock_scheduler_class.return_value = mock_scheduler
-
-        mock_mqtt_service = Mock()
-        mock_mqtt_service.get_status = Mock(return_value={"enabled": False})
-        mock_mqtt_service_class.return_value = mock_mqtt_service
-
-        # Import and create app after mocking
-        from netbox_pdns import create_app
-
-        app = create_app()
-
-        # Create test client and measure startup time
-        start_time = time.time()
-        client = TestClient(app)
-        startup_time = time.time() - start_time
+        release_sync = threading.Event()
+        sync_finished = threading.Event()
 
-        # Startup should be very fast (not blocked by full_sync)
-        assert startup_time < 1.0, f"Startup took {startup_time:.3f}s, expected < 1.0s"
+        def held_full_sync() -> None:
+            release_sync.wait(timeout=5.0)
+            sync_finished.set()
 
-        # full_sync should not have been called during synchronous startup
-        # It should be called in the background thread
-        response = client.get("/health")
-        assert response.status_code == 200
-        assert response.json()["status"] == "Healthy"
-
-    @patch("netbox_pdns.NetboxPDNS")
-    @patch("netbox_pdns.MQTTService")
-    @patch("netbox_pdns.BackgroundScheduler")
-    def test_detailed_status_endpoint(
-        self,
-        mock_scheduler_class: Mock,
-        mock_mqtt_service_class: Mock,
-        mock_netbox_pdns_class: Mock,
-    ) -> None:
-        """Test the detailed status endpoint returns correct information."""
-        # Setup mocks
-        mock_api = Mock()
-        mock_api.config.mqtt_enabled = False
-        mock_api.config.sync_crontab = "0 */6 * * *"
-        mock_api.logger = Mock()
-        mock_api._operation_lock_with_logging = Mock()
-        mock_netbox_pdns_class.return_value = mock_api
-
-        mock_scheduler = Mock()
-        mock_scheduler.running = True
-        mock_scheduler.get_jobs = Mock(return_value=["job1", "job2"])
-        mock_scheduler_class.return_value = mock_scheduler
-
-        mock_mqtt_service = Mock()
-        mock_mqtt_service.get_status = Mock(return_value={"enabled": False, "connected": False})
-        mock_mqtt_service_class.return_value = mock_mqtt_service
-
-        # Import and create app after mocking
-        from netbox_pdns import create_app
+        mock_api.full_sync.side_effect = held_full_sync
 
+        # Creating the app must not run the sync synchronously
         app = create_app()
-        client = TestClient(app)
+        mock_api.full_sync.assert_not_called()
 
-        # Test status endpoint
-        response = client.get("/status")
-        assert response.status_code == 200
+        with TestClient(app) as client:
+            # Startup finished while the initial sync is still held in the background
+            assert not sync_finished.is_set()
+            response = client.get("/health")
+            assert response.status_code == 200
+            assert response.json()["status"] == "Healthy"
+            release_sync.set()
 
-        status_data = response.json()
+    def test_detailed_status_endpoint(self, status_payload: dict[str, Any]) -> None:
+        """Test the detailed status endpoint returns correct information."""
+        status_data = status_payload
 
         # Check required fields
         assert "status" in status_data
@@ -141,89 +163,33 @@ class TestStartupBehavior:
         mqtt_info = status_data["mqtt"]
         assert mqtt_info["enabled"] is False
 
-    @patch("netbox_pdns.NetboxPDNS")
-    @patch("netbox_pdns.MQTTService")
-    @patch("netbox_pdns.BackgroundScheduler")
-    def test_status_initial_state(
-        self,
-        mock_scheduler_class: Mock,
-        mock_mqtt_service_class: Mock,
-        mock_netbox_pdns_class: Mock,
-    ) -> None:
+    def test_status_initial_state(self, status_payload: dict[str, Any]) -> None:
         """Test that status endpoint shows correct initial state."""
-        # Setup mocks
-        mock_api = Mock()
-        mock_api.config.mqtt_enabled = False
-        mock_api.config.sync_crontab = "0 */6 * * *"
-        mock_api.logger = Mock()
-        mock_api._operation_lock_with_logging = Mock()
-        mock_api.full_sync = Mock(return_value={"result": "success"})
-        mock_netbox_pdns_class.return_value = mock_api
-
-        mock_scheduler = Mock()
-        mock_scheduler.running = True
-        mock_scheduler.get_jobs = Mock(return_value=[])
-        mock_scheduler_class.return_value = mock_scheduler
-
-        mock_mqtt_service = Mock()
-        mock_mqtt_service.get_status = Mock(return_value={"enabled": False})
-        mock_mqtt_service_class.return_value = mock_mqtt_service
-
-        # Import and create app after mocking
-        from netbox_pdns import create_app
-
-        app = create_app()
-        client = TestClient(app)
-
-        response = client.get("/status")
-        assert response.status_code == 200
-
-        status_data = response.json()
-        sync_info = status_data["initial_sync"]
+        sync_info = status_payload["initial_sync"]
 
         # Initially, sync should not be started yet or just started
         assert isinstance(sync_info["started"], bool)
         assert isinstance(sync_info["completed"], bool)
         assert sync_info["error"] is None  # No error initially
 
-    @patch("netbox_pdns.NetboxPDNS")
-    @patch("netbox_pdns.MQTTService")
-    @patch("netbox_pdns.BackgroundScheduler")
-    def test_status_with_mqtt_enabled(
+    @pytest.mark.asyncio
+    async def test_status_with_mqtt_enabled(
         self,
-        mock_scheduler_class: Mock,
-        mock_mqtt_service_class: Mock,
-        mock_netbox_pdns_class: Mock,
+        status_client: httpx.AsyncClient,
+        mock_mqtt_service: Mock,
+        mock_api: Mock,
+        mock_scheduler: Mock,
     ) -> None:
         """Test status endpoint with MQTT enabled."""
-        # Setup mocks
-        mock_api = Mock()
-        mock_api.config.mqtt_enabled = True
-        mock_api.config.sync_crontab = "0 */6 * * *"
-        mock_api.logger = Mock()
-        mock_api._operation_lock_with_logging = Mock()
-        mock_netbox_pdns_class.return_value = mock_api
-
-        mock_scheduler = Mock()
-        mock_scheduler.running = True
-        mock_scheduler.get_jobs = Mock(return_value=[])
-        mock_scheduler_class.return_value = mock_scheduler
-
-        mock_mqtt_service = Mock()
-        mock_mqtt_service.start = Mock()
-        mock_mqtt_service.wait_for_connection = AsyncMock(return_value=True)
-        mock_mqtt_service.get_status = Mock(
-            return_value={"enabled": True, "connected": True, "broker_url": "mqtt://localhost:1883"}
-        )
-        mock_mqtt_service_class.return_value = mock_mqtt_service
-
-        # Import and create app after mocking
-        from netbox_pdns import create_app
+        mock_api.config = mock_api.config.model_copy(update={"mqtt_enabled": True})
 
-        app = create_app()
-        client = TestClient(app)
+        mock_mqtt_service.get_status.return_value = {
+            "enabled": True,
+            "connected": True,
+            "broker_url": "mqtt://localhost:1883",
+        }
 
-        response = client.get("/status")
+        response = await status_client.get("/status")
         assert response.status_code == 200
 
         status_data = response.json()
@@ -232,3 +198,19 @@ class TestStartupBehavior:
         assert mqtt_info["enabled"] is True
         assert mqtt_info["connected"] is True
         assert "broker_url" in mqtt_info
+
+    @pytest.mark.usefixtures("patched_services")
+    def test_scheduler_follows_lifespan(self, mock_scheduler: Mock) -> None:
+        """Test that the scheduler is started and stopped by the app lifespan."""
+
+        app = create_app()
+
+        # Creating the app only registers the job; it must not start the scheduler
+        mock_scheduler.add_job.assert_called_once()
+        mock_scheduler.start.assert_not_called()
+
+        with TestClient(app):
+            mock_scheduler.start.assert_called_once()
+            mock_scheduler.shutdown.assert_not_called()
+
+        mock_scheduler.shutdown.assert_called_once()